@@ -0,0 +1,129 @@
+import os
+import sys
+import argparse
+
+from specter.scripts.runner import (
+    RunnerTarget,
+    ScriptResult,
+    SuiteRunner,
+    find_scripts,
+    write_json,
+    write_junit,
+)
+
+
+def create_run_parser(subparsers) -> argparse.ArgumentParser:
+    run_parser = subparsers.add_parser(
+        "run", help="Run a directory of scripts in parallel across targets"
+    )
+    run_parser.add_argument("path", help="Script file or directory of scripts")
+    run_parser.add_argument(
+        "--pattern",
+        default="test_*.py",
+        help="Glob pattern for scripts in a directory (default test_*.py)",
+    )
+
+    group = run_parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--app", type=str, help="Path of the application to start for each target"
+    )
+    group.add_argument(
+        "--target",
+        action="append",
+        metavar="HOST:PORT",
+        help="Address of an already running target (repeatable)",
+    )
+
+    run_parser.add_argument(
+        "--library",
+        default=os.environ.get("SPECTER_VIEVER_SERVER_DLL"),
+        help="Server library injected into started applications",
+    )
+    run_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host of started applications (default 127.0.0.1)",
+    )
+    run_parser.add_argument(
+        "--port",
+        type=int,
+        default=5010,
+        help="Port the injected server listens on in a started application "
+        "(default 5010)",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of applications to start; only 1 is supported with --app "
+        "because the injected server cannot be given a port (default 1)",
+    )
+    run_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Restore each target's checkpointed state between scripts",
+    )
+    run_parser.add_argument("--junit", help="Write a JUnit XML report to this path")
+    run_parser.add_argument("--json", help="Write a JSON report to this path")
+
+    return run_parser
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Specter command line tools")
+
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+    create_run_parser(subparsers)
+
+    return parser
+
+
+def create_targets(args) -> list[RunnerTarget]:
+    if args.target:
+        targets = []
+        for address in args.target:
+            host, _, port = address.rpartition(":")
+            targets.append(RunnerTarget(host or "127.0.0.1", int(port)))
+        return targets
+
+    return [RunnerTarget(args.host, args.port, args.app, args.library)]
+
+
+def print_result(result: ScriptResult):
+    print(
+        f"{result.status.upper():<7} {result.path} "
+        f"({result.duration:.2f} s on {result.target})"
+    )
+    if result.message:
+        print(f"        {result.message}")
+
+
+def main():
+    parser = create_parser()
+    args = parser.parse_args()
+
+    if args.mode == "run" and args.app and args.jobs != 1:
+        parser.error(
+            "--app starts a single application because the injected server "
+            "cannot be given a port; start the applications yourself and "
+            "pass one --target HOST:PORT per application to run in parallel"
+        )
+
+    if args.mode == "run":
+        scripts = find_scripts(args.path, args.pattern)
+        runner = SuiteRunner(create_targets(args), reset=args.reset)
+        results = runner.run(scripts, on_result=print_result)
+
+        if args.junit:
+            write_junit(results, args.junit)
+        if args.json:
+            write_json(results, args.json)
+
+        passed = sum(r.status == ScriptResult.PASSED for r in results)
+        print(f"{passed}/{len(results)} scripts passed")
+        sys.exit(0 if passed == len(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,11 @@ from specter.client.attach import (
     attach_to_new_process,
     AttachException,
 )
+from specter.client.preview import (
+    PreviewRecorder,
+    PreviewRecording,
+    PreviewRecordingException,
+)
 from specter.client.utils import (
     convert_from_value, 
     convert_to_value
@@ -17,6 +22,9 @@ __all__ = [
     "attach_to_existing_process",
     "attach_to_new_process",
     "AttachException",
+    "PreviewRecorder",
+    "PreviewRecording",
+    "PreviewRecordingException",
     "convert_from_value",
     "convert_to_value"
 ]
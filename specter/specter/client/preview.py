@@ -0,0 +1,279 @@
+import os
+import mmap
+import time
+import zlib
+import bisect
+import struct
+import typing
+import hashlib
+import threading
+
+from specter.proto.specter_pb2 import PreviewImage, PreviewRect, PreviewFormat
+
+INDEX_FILE = "index.bin"
+SEGMENT_FILE = "segment-{:05d}.bin"
+
+INDEX_ENTRY = struct.Struct("<dIIQQ")
+
+
+class PreviewRecordingException(Exception):
+    def __init__(self, error_str: str):
+        self._error_str = error_str
+
+    def __str__(self):
+        return self._error_str
+
+
+class PreviewRecorder:
+    SEGMENT_SIZE = 64 * 1024 * 1024
+    KEYFRAME_INTERVAL = 120
+
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._lock = threading.Lock()
+        self._closed = False
+        self._count = 0
+        self._keyframe = 0
+        self._frames_since_keyframe = 0
+        self._row_hashes: typing.Optional[list[int]] = None
+        self._row_size: tuple[int, int] = (0, 0)
+        self._payloads: dict[bytes, tuple[int, int, int]] = {}
+        self._segment = -1
+        self._segment_file = None
+        self._segment_map = None
+        self._segment_offset = 0
+        self._index = open(os.path.join(path, INDEX_FILE), "wb")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def append(
+        self, preview: PreviewImage, timestamp: typing.Optional[float] = None
+    ) -> None:
+        timestamp = time.time() if timestamp is None else timestamp
+
+        with self._lock:
+            if self._closed:
+                return
+
+            payload, is_keyframe = self._encode(preview)
+            if is_keyframe:
+                self._keyframe = self._count
+
+            segment, offset, length = self._store(payload)
+            self._index.write(
+                INDEX_ENTRY.pack(timestamp, segment, length, offset, self._keyframe)
+            )
+            self._index.flush()
+            self._count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._close_segment()
+            self._index.close()
+
+    def _encode(self, preview: PreviewImage) -> tuple[bytes, bool]:
+        image = preview.image
+        if not image:
+            self._row_hashes = None
+            return preview.SerializeToString(), not preview.dirty_rects
+
+        if preview.format != PreviewFormat.RAW:
+            self._row_hashes = None
+            self._frames_since_keyframe = 0
+            return preview.SerializeToString(), True
+
+        size = (preview.width, preview.height)
+        row_hashes = self._hash_rows(image, *size)
+        previous_hashes, self._row_hashes = self._row_hashes, row_hashes
+
+        if (
+            previous_hashes is None
+            or self._row_size != size
+            or self._frames_since_keyframe >= self.KEYFRAME_INTERVAL
+        ):
+            self._row_size = size
+            self._frames_since_keyframe = 0
+            return preview.SerializeToString(), True
+
+        changed = [
+            row
+            for row, (previous, current) in enumerate(zip(previous_hashes, row_hashes))
+            if previous != current
+        ]
+
+        rect = PreviewRect()
+        if changed:
+            top, bottom = changed[0], changed[-1] + 1
+            stride = preview.width * 4
+            rect = PreviewRect(
+                x=0,
+                y=top,
+                width=preview.width,
+                height=bottom - top,
+                image=image[top * stride : bottom * stride],
+            )
+
+        self._frames_since_keyframe += 1
+        delta = PreviewImage(
+            format=PreviewFormat.RAW,
+            width=preview.width,
+            height=preview.height,
+            dirty_rects=[rect],
+        )
+        return delta.SerializeToString(), False
+
+    @staticmethod
+    def _hash_rows(image: bytes, width: int, height: int) -> list[int]:
+        stride = width * 4
+        view = memoryview(image)
+        return [
+            zlib.crc32(view[row * stride : (row + 1) * stride]) for row in range(height)
+        ]
+
+    def _store(self, payload: bytes) -> tuple[int, int, int]:
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        location = self._payloads.get(digest)
+        if location is not None:
+            return location
+
+        if self._segment_map is None or self._segment_offset + len(payload) > len(
+            self._segment_map
+        ):
+            self._open_segment(max(self.SEGMENT_SIZE, len(payload)))
+
+        offset = self._segment_offset
+        self._segment_map[offset : offset + len(payload)] = payload
+        self._segment_offset += len(payload)
+
+        location = (self._segment, offset, len(payload))
+        self._payloads[digest] = location
+        return location
+
+    def _open_segment(self, size: int) -> None:
+        self._close_segment()
+        self._segment += 1
+        self._segment_file = open(
+            os.path.join(self._path, SEGMENT_FILE.format(self._segment)), "w+b"
+        )
+        self._segment_file.truncate(size)
+        self._segment_map = mmap.mmap(self._segment_file.fileno(), size)
+        self._segment_offset = 0
+
+    def _close_segment(self) -> None:
+        if self._segment_map is None:
+            return
+
+        self._segment_map.flush()
+        self._segment_map.close()
+        self._segment_file.truncate(self._segment_offset)
+        self._segment_file.close()
+        self._segment_map = None
+        self._segment_file = None
+
+
+class _IndexTimestamps(typing.Sequence[float]):
+    def __init__(self, recording: "PreviewRecording"):
+        self._recording = recording
+
+    def __len__(self) -> int:
+        return len(self._recording)
+
+    def __getitem__(self, index: int) -> float:
+        return self._recording.timestamp(index)
+
+
+class PreviewRecording:
+    def __init__(self, path: str):
+        index_path = os.path.join(path, INDEX_FILE)
+        if not os.path.exists(index_path):
+            raise PreviewRecordingException(f"No preview recording at {path}")
+
+        self._path = path
+        self._segments: dict[int, tuple[typing.BinaryIO, mmap.mmap]] = {}
+        self._index_file = open(index_path, "rb")
+        self._count = os.fstat(self._index_file.fileno()).st_size // INDEX_ENTRY.size
+        self._index = (
+            mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._count
+            else None
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def start_time(self) -> float:
+        return self.timestamp(0) if self._count else 0.0
+
+    @property
+    def end_time(self) -> float:
+        return self.timestamp(self._count - 1) if self._count else 0.0
+
+    def timestamp(self, index: int) -> float:
+        return self._entry(index)[0]
+
+    def keyframe(self, index: int) -> int:
+        return self._entry(index)[4]
+
+    def find(self, timestamp: float) -> int:
+        index = bisect.bisect_right(_IndexTimestamps(self), timestamp) - 1
+        return max(index, 0) if self._count else -1
+
+    def frame(self, index: int) -> PreviewImage:
+        _, segment, length, offset, _ = self._entry(index)
+        return PreviewImage.FromString(self._segment(segment)[offset : offset + length])
+
+    def frames(
+        self, index: int, start: typing.Optional[int] = None
+    ) -> typing.Iterator[PreviewImage]:
+        if start is None:
+            start = self.keyframe(index)
+
+        for frame_index in range(start, index + 1):
+            yield self.frame(frame_index)
+
+    def close(self) -> None:
+        for segment_file, segment_map in self._segments.values():
+            segment_map.close()
+            segment_file.close()
+        self._segments.clear()
+
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._index_file.close()
+
+    def _entry(self, index: int) -> tuple[float, int, int, int, int]:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return INDEX_ENTRY.unpack_from(self._index, index * INDEX_ENTRY.size)
+
+    def _segment(self, segment: int) -> mmap.mmap:
+        if segment not in self._segments:
+            segment_file = open(
+                os.path.join(self._path, SEGMENT_FILE.format(segment)), "rb"
+            )
+            segment_map = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._segments[segment] = (segment_file, segment_map)
+        return self._segments[segment][1]
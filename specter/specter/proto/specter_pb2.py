@@ -26,17 +26,19 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bspecter/proto/specter.proto\x12\rspecter_proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"\x16\n\x08ObjectId\x12\n\n\x02id\x18\x01 \x01(\t\"*\n\x10OptionalObjectId\x12\x0f\n\x02id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x05\n\x03_id\"1\n\tObjectIds\x12$\n\x03ids\x18\x01 \x03(\x0b\x32\x17.specter_proto.ObjectId\"\"\n\x11ObjectSearchQuery\x12\r\n\x05query\x18\x01 \x01(\t\"\x1d\n\x0cPreviewImage\x12\r\n\x05image\x18\x01 \x01(\x0c\"6\n\nObjectTree\x12(\n\x05roots\x18\x01 \x03(\x0b\x32\x19.specter_proto.ObjectNode\"e\n\nObjectNode\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12+\n\x08\x63hildren\x18\x02 \x03(\x0b\x32\x19.specter_proto.ObjectNode\"x\n\nMethodCall\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x13\n\x0bmethod_name\x18\x02 \x01(\t\x12)\n\targuments\x18\x03 \x03(\x0b\x32\x16.google.protobuf.Value\"z\n\x0ePropertyUpdate\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x15\n\rproperty_name\x18\x02 \x01(\t\x12%\n\x05value\x18\x03 \x01(\x0b\x32\x16.google.protobuf.Value\"1\n\x07Methods\x12&\n\x07methods\x18\x01 \x03(\x0b\x32\x15.specter_proto.Method\"K\n\x06Method\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\x12,\n\nparameters\x18\x02 \x03(\x0b\x32\x18.specter_proto.Parameter\"R\n\tParameter\x12\x16\n\x0eparameter_name\x18\x01 \x01(\t\x12-\n\rdefault_value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\"9\n\nProperties\x12+\n\nproperties\x18\x01 \x03(\x0b\x32\x17.specter_proto.Property\"[\n\x08Property\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12\x11\n\tread_only\x18\x03 \x01(\x08\"\xe1\x01\n\nTreeChange\x12+\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x0b\x32\x1a.specter_proto.ObjectAddedH\x00\x12/\n\x07removed\x18\x02 \x01(\x0b\x32\x1c.specter_proto.ObjectRemovedH\x00\x12\x35\n\nreparented\x18\x03 \x01(\x0b\x32\x1f.specter_proto.ObjectReparentedH\x00\x12/\n\x07renamed\x18\x04 \x01(\x0b\x32\x1c.specter_proto.ObjectRenamedH\x00\x42\r\n\x0b\x63hange_type\"e\n\x0bObjectAdded\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\tparent_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\";\n\rObjectRemoved\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\"j\n\x10ObjectReparented\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\tparent_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rObjectRenamed\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x36\n\x0cobject_query\x18\x02 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\"\xb4\x01\n\x0ePropertyChange\x12-\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x0b\x32\x1c.specter_proto.PropertyAddedH\x00\x12\x31\n\x07removed\x18\x02 \x01(\x0b\x32\x1e.specter_proto.PropertyRemovedH\x00\x12\x31\n\x07updated\x18\x04 \x01(\x0b\x32\x1e.specter_proto.PropertyUpdatedH\x00\x42\r\n\x0b\x63hange_type\"`\n\rPropertyAdded\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12\x11\n\tread_only\x18\x03 \x01(\x08\"(\n\x0fPropertyRemoved\x12\x15\n\rproperty_name\x18\x01 \x01(\t\"~\n\x0fPropertyUpdated\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12)\n\told_value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12)\n\tnew_value\x18\x03 \x01(\x0b\x32\x16.google.protobuf.Value\"\x1e\n\x06Offset\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\"\x8b\x01\n\nMouseEvent\x12%\n\x06offset\x18\x01 \x01(\x0b\x32\x15.specter_proto.Offset\x12*\n\x06\x62utton\x18\x02 \x01(\x0e\x32\x1a.specter_proto.MouseButton\x12\x19\n\x0c\x64ouble_click\x18\x03 \x01(\x08H\x00\x88\x01\x01\x42\x0f\n\r_double_click\"3\n\nCursorMove\x12%\n\x06offset\x18\x01 \x01(\x0b\x32\x15.specter_proto.Offset\"/\n\x0bWheelScroll\x12\x0f\n\x07\x64\x65lta_x\x18\x01 \x01(\x05\x12\x0f\n\x07\x64\x65lta_y\x18\x02 \x01(\x05\"\xef\x01\n\x0bObjectClick\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\x06\x62utton\x18\x02 \x01(\x0e\x32\x1a.specter_proto.MouseButton\x12\x19\n\x0c\x64ouble_click\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\'\n\x06offset\x18\x04 \x01(\x0b\x32\x15.specter_proto.OffsetH\x00\x12\'\n\x06\x61nchor\x18\x05 \x01(\x0e\x32\x15.specter_proto.AnchorH\x00\x42\n\n\x08positionB\x0f\n\r_double_click\"\x97\x01\n\x0bObjectHover\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\'\n\x06offset\x18\x02 \x01(\x0b\x32\x15.specter_proto.OffsetH\x00\x12\'\n\x06\x61nchor\x18\x03 \x01(\x0e\x32\x15.specter_proto.AnchorH\x00\x42\n\n\x08position\"\x8c\x01\n\x08KeyEvent\x12\x10\n\x08key_code\x18\x01 \x01(\x05\x12\x11\n\x04\x63trl\x18\x02 \x01(\x08H\x00\x88\x01\x01\x12\x10\n\x03\x61lt\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\x12\n\x05shift\x18\x04 \x01(\x08H\x02\x88\x01\x01\x12\x11\n\x04meta\x18\x05 \x01(\x08H\x03\x88\x01\x01\x42\x07\n\x05_ctrlB\x06\n\x04_altB\x08\n\x06_shiftB\x07\n\x05_meta\"\x19\n\tTextInput\x12\x0c\n\x04text\x18\x01 \x01(\t\"K\n\x0fObjectTextInput\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0c\n\x04text\x18\x02 \x01(\t\"w\n\x11\x43ontextMenuOpened\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rButtonClicked\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\x84\x01\n\rButtonToggled\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0f\n\x07\x63hecked\x18\x03 \x01(\x08\"\x8b\x01\n\x16\x43omboBoxCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"\x88\x01\n\x13SpinBoxValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x05\"\x8e\x01\n\x19\x44oubleSpinBoxValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x01\"\x87\x01\n\x12SliderValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x05\"\x86\x01\n\x11TabCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"~\n\tTabClosed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"\x88\x01\n\x08TabMoved\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0c\n\x04\x66rom\x18\x03 \x01(\x05\x12\n\n\x02to\x18\x04 \x01(\x05\"\x8a\x01\n\x15ToolBoxCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"u\n\x0f\x41\x63tionTriggered\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rActionHovered\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\x88\x01\n\x13TextEditTextChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\t\"\x88\x01\n\x13LineEditTextChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\t\"{\n\x15LineEditReturnPressed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"u\n\x0fWindowMinimized\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"u\n\x0fWindowMaximized\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"r\n\x0cWindowClosed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\xd4\t\n\x0fRecorderCommand\x12?\n\x13\x63ontext_menu_opened\x18\x01 \x01(\x0b\x32 .specter_proto.ContextMenuOpenedH\x00\x12\x36\n\x0e\x62utton_clicked\x18\x02 \x01(\x0b\x32\x1c.specter_proto.ButtonClickedH\x00\x12\x36\n\x0e\x62utton_toggled\x18\x03 \x01(\x0b\x32\x1c.specter_proto.ButtonToggledH\x00\x12J\n\x19\x63ombo_box_current_changed\x18\x04 \x01(\x0b\x32%.specter_proto.ComboBoxCurrentChangedH\x00\x12\x44\n\x16spin_box_value_changed\x18\x05 \x01(\x0b\x32\".specter_proto.SpinBoxValueChangedH\x00\x12Q\n\x1d\x64ouble_spin_box_value_changed\x18\x06 \x01(\x0b\x32(.specter_proto.DoubleSpinBoxValueChangedH\x00\x12\x41\n\x14slider_value_changed\x18\x07 \x01(\x0b\x32!.specter_proto.SliderValueChangedH\x00\x12?\n\x13tab_current_changed\x18\x08 \x01(\x0b\x32 .specter_proto.TabCurrentChangedH\x00\x12.\n\ntab_closed\x18\t \x01(\x0b\x32\x18.specter_proto.TabClosedH\x00\x12,\n\ttab_moved\x18\n \x01(\x0b\x32\x17.specter_proto.TabMovedH\x00\x12H\n\x18tool_box_current_changed\x18\x0b \x01(\x0b\x32$.specter_proto.ToolBoxCurrentChangedH\x00\x12:\n\x10\x61\x63tion_triggered\x18\x0c \x01(\x0b\x32\x1e.specter_proto.ActionTriggeredH\x00\x12\x36\n\x0e\x61\x63tion_hovered\x18\r \x01(\x0b\x32\x1c.specter_proto.ActionHoveredH\x00\x12\x44\n\x16text_edit_text_changed\x18\x0e \x01(\x0b\x32\".specter_proto.TextEditTextChangedH\x00\x12\x44\n\x16line_edit_text_changed\x18\x0f \x01(\x0b\x32\".specter_proto.LineEditTextChangedH\x00\x12H\n\x18line_edit_return_pressed\x18\x10 \x01(\x0b\x32$.specter_proto.LineEditReturnPressedH\x00\x12:\n\x10window_minimized\x18\x11 \x01(\x0b\x32\x1e.specter_proto.WindowMinimizedH\x00\x12:\n\x10window_maximized\x18\x12 \x01(\x0b\x32\x1e.specter_proto.WindowMaximizedH\x00\x12\x34\n\rwindow_closed\x18\x13 \x01(\x0b\x32\x1b.specter_proto.WindowClosedH\x00\x42\x07\n\x05\x65vent*.\n\x0bMouseButton\x12\x08\n\x04LEFT\x10\x00\x12\t\n\x05RIGHT\x10\x01\x12\n\n\x06MIDDLE\x10\x02*R\n\x06\x41nchor\x12\n\n\x06\x43\x45NTER\x10\x00\x12\x0b\n\x07LEFT_UP\x10\x01\x12\x0c\n\x08RIGHT_UP\x10\x02\x12\x0f\n\x0bLEFT_BOTTOM\x10\x03\x12\x10\n\x0cRIGHT_BOTTOM\x10\x04\x32]\n\x10PreviewerService\x12I\n\rListenPreview\x12\x17.specter_proto.ObjectId\x1a\x1b.specter_proto.PreviewImage\"\x00\x30\x01\x32\xd3\x01\n\rMarkerService\x12\x39\n\x05Start\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x38\n\x04Stop\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\x16ListenSelectionChanges\x12\x16.google.protobuf.Empty\x1a\x17.specter_proto.ObjectId\"\x00\x30\x01\x32_\n\x0fRecorderService\x12L\n\x0eListenCommands\x12\x16.google.protobuf.Empty\x1a\x1e.specter_proto.RecorderCommand\"\x00\x30\x01\x32\xf4\x03\n\x0cMouseService\x12\x42\n\x0bPressButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x44\n\rReleaseButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x42\n\x0b\x43lickButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\nMoveCursor\x12\x19.specter_proto.CursorMove\x1a\x16.google.protobuf.Empty\"\x00\x12\x43\n\x0bScrollWheel\x12\x1a.specter_proto.WheelScroll\x1a\x16.google.protobuf.Empty\"\x00\x12\x45\n\rClickOnObject\x12\x1a.specter_proto.ObjectClick\x1a\x16.google.protobuf.Empty\"\x00\x12G\n\x0fHoverOverObject\x12\x1a.specter_proto.ObjectHover\x1a\x16.google.protobuf.Empty\"\x00\x32\xe0\x02\n\x0fKeyboardService\x12=\n\x08PressKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\nReleaseKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12;\n\x06TapKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\tEnterText\x12\x18.specter_proto.TextInput\x1a\x16.google.protobuf.Empty\"\x00\x12O\n\x13\x45nterTextIntoObject\x12\x1e.specter_proto.ObjectTextInput\x1a\x16.google.protobuf.Empty\"\x00\x32\xab\x06\n\rObjectService\x12G\n\x07GetTree\x12\x1f.specter_proto.OptionalObjectId\x1a\x19.specter_proto.ObjectTree\"\x00\x12\x44\n\x04\x46ind\x12 .specter_proto.ObjectSearchQuery\x1a\x18.specter_proto.ObjectIds\"\x00\x12M\n\x0eGetObjectQuery\x12\x17.specter_proto.ObjectId\x1a .specter_proto.ObjectSearchQuery\"\x00\x12?\n\tGetParent\x12\x17.specter_proto.ObjectId\x1a\x17.specter_proto.ObjectId\"\x00\x12\x42\n\x0bGetChildren\x12\x17.specter_proto.ObjectId\x1a\x18.specter_proto.ObjectIds\"\x00\x12\x41\n\nCallMethod\x12\x19.specter_proto.MethodCall\x1a\x16.google.protobuf.Empty\"\x00\x12I\n\x0eUpdateProperty\x12\x1d.specter_proto.PropertyUpdate\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\nGetMethods\x12\x17.specter_proto.ObjectId\x1a\x16.specter_proto.Methods\"\x00\x12\x45\n\rGetProperties\x12\x17.specter_proto.ObjectId\x1a\x19.specter_proto.Properties\"\x00\x12J\n\x11ListenTreeChanges\x12\x16.google.protobuf.Empty\x1a\x19.specter_proto.TreeChange\"\x00\x30\x01\x12U\n\x17ListenPropertiesChanges\x12\x17.specter_proto.ObjectId\x1a\x1d.specter_proto.PropertyChange\"\x00\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1bspecter/proto/specter.proto\x12\rspecter_proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"\x16\n\x08ObjectId\x12\n\n\x02id\x18\x01 \x01(\t\"*\n\x10OptionalObjectId\x12\x0f\n\x02id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x05\n\x03_id\"1\n\tObjectIds\x12$\n\x03ids\x18\x01 \x03(\x0b\x32\x17.specter_proto.ObjectId\"\"\n\x11ObjectSearchQuery\x12\r\n\x05query\x18\x01 \x01(\t\"\x97\x01\n\x0ePreviewRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\tmax_width\x18\x02 \x01(\r\x12\x12\n\nmax_height\x18\x03 \x01(\r\x12\x0f\n\x07max_fps\x18\x04 \x01(\x02\x12,\n\x06\x66ormat\x18\x05 \x01(\x0e\x32\x1c.specter_proto.PreviewFormat\x12\x13\n\x0b\x61llow_delta\x18\x06 \x01(\x08\"Q\n\x0bPreviewRect\x12\t\n\x01x\x18\x01 \x01(\r\x12\t\n\x01y\x18\x02 \x01(\r\x12\r\n\x05width\x18\x03 \x01(\r\x12\x0e\n\x06height\x18\x04 \x01(\r\x12\r\n\x05image\x18\x05 \x01(\x0c\"\x9b\x01\n\x0cPreviewImage\x12\r\n\x05image\x18\x01 \x01(\x0c\x12,\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\x1c.specter_proto.PreviewFormat\x12\r\n\x05width\x18\x03 \x01(\r\x12\x0e\n\x06height\x18\x04 \x01(\r\x12/\n\x0b\x64irty_rects\x18\x05 \x03(\x0b\x32\x1a.specter_proto.PreviewRect\"6\n\nObjectTree\x12(\n\x05roots\x18\x01 \x03(\x0b\x32\x19.specter_proto.ObjectNode\"e\n\nObjectNode\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12+\n\x08\x63hildren\x18\x02 \x03(\x0b\x32\x19.specter_proto.ObjectNode\"x\n\nMethodCall\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x13\n\x0bmethod_name\x18\x02 \x01(\t\x12)\n\targuments\x18\x03 \x03(\x0b\x32\x16.google.protobuf.Value\"z\n\x0ePropertyUpdate\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x15\n\rproperty_name\x18\x02 \x01(\t\x12%\n\x05value\x18\x03 \x01(\x0b\x32\x16.google.protobuf.Value\"1\n\x07Methods\x12&\n\x07methods\x18\x01 \x03(\x0b\x32\x15.specter_proto.Method\"K\n\x06Method\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\x12,\n\nparameters\x18\x02 \x03(\x0b\x32\x18.specter_proto.Parameter\"R\n\tParameter\x12\x16\n\x0eparameter_name\x18\x01 \x01(\t\x12-\n\rdefault_value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\"9\n\nProperties\x12+\n\nproperties\x18\x01 \x03(\x0b\x32\x17.specter_proto.Property\"[\n\x08Property\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12\x11\n\tread_only\x18\x03 \x01(\x08\"\xe1\x01\n\nTreeChange\x12+\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x0b\x32\x1a.specter_proto.ObjectAddedH\x00\x12/\n\x07removed\x18\x02 \x01(\x0b\x32\x1c.specter_proto.ObjectRemovedH\x00\x12\x35\n\nreparented\x18\x03 \x01(\x0b\x32\x1f.specter_proto.ObjectReparentedH\x00\x12/\n\x07renamed\x18\x04 \x01(\x0b\x32\x1c.specter_proto.ObjectRenamedH\x00\x42\r\n\x0b\x63hange_type\"e\n\x0bObjectAdded\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\tparent_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\";\n\rObjectRemoved\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\"j\n\x10ObjectReparented\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\tparent_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rObjectRenamed\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x36\n\x0cobject_query\x18\x02 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\"\xb4\x01\n\x0ePropertyChange\x12-\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x0b\x32\x1c.specter_proto.PropertyAddedH\x00\x12\x31\n\x07removed\x18\x02 \x01(\x0b\x32\x1e.specter_proto.PropertyRemovedH\x00\x12\x31\n\x07updated\x18\x04 \x01(\x0b\x32\x1e.specter_proto.PropertyUpdatedH\x00\x42\r\n\x0b\x63hange_type\"`\n\rPropertyAdded\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12\x11\n\tread_only\x18\x03 \x01(\x08\"(\n\x0fPropertyRemoved\x12\x15\n\rproperty_name\x18\x01 \x01(\t\"~\n\x0fPropertyUpdated\x12\x15\n\rproperty_name\x18\x01 \x01(\t\x12)\n\told_value\x18\x02 \x01(\x0b\x32\x16.google.protobuf.Value\x12)\n\tnew_value\x18\x03 \x01(\x0b\x32\x16.google.protobuf.Value\"\x1e\n\x06Offset\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\"\x8b\x01\n\nMouseEvent\x12%\n\x06offset\x18\x01 \x01(\x0b\x32\x15.specter_proto.Offset\x12*\n\x06\x62utton\x18\x02 \x01(\x0e\x32\x1a.specter_proto.MouseButton\x12\x19\n\x0c\x64ouble_click\x18\x03 \x01(\x08H\x00\x88\x01\x01\x42\x0f\n\r_double_click\"3\n\nCursorMove\x12%\n\x06offset\x18\x01 \x01(\x0b\x32\x15.specter_proto.Offset\"/\n\x0bWheelScroll\x12\x0f\n\x07\x64\x65lta_x\x18\x01 \x01(\x05\x12\x0f\n\x07\x64\x65lta_y\x18\x02 \x01(\x05\"\xef\x01\n\x0bObjectClick\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12*\n\x06\x62utton\x18\x02 \x01(\x0e\x32\x1a.specter_proto.MouseButton\x12\x19\n\x0c\x64ouble_click\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\'\n\x06offset\x18\x04 \x01(\x0b\x32\x15.specter_proto.OffsetH\x00\x12\'\n\x06\x61nchor\x18\x05 \x01(\x0e\x32\x15.specter_proto.AnchorH\x00\x42\n\n\x08positionB\x0f\n\r_double_click\"\x97\x01\n\x0bObjectHover\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\'\n\x06offset\x18\x02 \x01(\x0b\x32\x15.specter_proto.OffsetH\x00\x12\'\n\x06\x61nchor\x18\x03 \x01(\x0e\x32\x15.specter_proto.AnchorH\x00\x42\n\n\x08position\"\x8c\x01\n\x08KeyEvent\x12\x10\n\x08key_code\x18\x01 \x01(\x05\x12\x11\n\x04\x63trl\x18\x02 \x01(\x08H\x00\x88\x01\x01\x12\x10\n\x03\x61lt\x18\x03 \x01(\x08H\x01\x88\x01\x01\x12\x12\n\x05shift\x18\x04 \x01(\x08H\x02\x88\x01\x01\x12\x11\n\x04meta\x18\x05 \x01(\x08H\x03\x88\x01\x01\x42\x07\n\x05_ctrlB\x06\n\x04_altB\x08\n\x06_shiftB\x07\n\x05_meta\"\x19\n\tTextInput\x12\x0c\n\x04text\x18\x01 \x01(\t\"K\n\x0fObjectTextInput\x12*\n\tobject_id\x18\x01 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0c\n\x04text\x18\x02 \x01(\t\"w\n\x11\x43ontextMenuOpened\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rButtonClicked\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\x84\x01\n\rButtonToggled\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0f\n\x07\x63hecked\x18\x03 \x01(\x08\"\x8b\x01\n\x16\x43omboBoxCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"\x88\x01\n\x13SpinBoxValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x05\"\x8e\x01\n\x19\x44oubleSpinBoxValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x01\"\x87\x01\n\x12SliderValueChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\x05\"\x86\x01\n\x11TabCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"~\n\tTabClosed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"\x88\x01\n\x08TabMoved\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\x0c\n\x04\x66rom\x18\x03 \x01(\x05\x12\n\n\x02to\x18\x04 \x01(\x05\"\x8a\x01\n\x15ToolBoxCurrentChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05index\x18\x03 \x01(\x05\"u\n\x0f\x41\x63tionTriggered\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"s\n\rActionHovered\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\x88\x01\n\x13TextEditTextChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\t\"\x88\x01\n\x13LineEditTextChanged\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\x12\r\n\x05value\x18\x03 \x01(\t\"{\n\x15LineEditReturnPressed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"u\n\x0fWindowMinimized\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"u\n\x0fWindowMaximized\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"r\n\x0cWindowClosed\x12\x36\n\x0cobject_query\x18\x01 \x01(\x0b\x32 .specter_proto.ObjectSearchQuery\x12*\n\tobject_id\x18\x02 \x01(\x0b\x32\x17.specter_proto.ObjectId\"\x1b\n\x07IdleGap\x12\x10\n\x08\x64uration\x18\x01 \x01(\x01\"\x93\n\n\x0fRecorderCommand\x12?\n\x13\x63ontext_menu_opened\x18\x01 \x01(\x0b\x32 .specter_proto.ContextMenuOpenedH\x00\x12\x36\n\x0e\x62utton_clicked\x18\x02 \x01(\x0b\x32\x1c.specter_proto.ButtonClickedH\x00\x12\x36\n\x0e\x62utton_toggled\x18\x03 \x01(\x0b\x32\x1c.specter_proto.ButtonToggledH\x00\x12J\n\x19\x63ombo_box_current_changed\x18\x04 \x01(\x0b\x32%.specter_proto.ComboBoxCurrentChangedH\x00\x12\x44\n\x16spin_box_value_changed\x18\x05 \x01(\x0b\x32\".specter_proto.SpinBoxValueChangedH\x00\x12Q\n\x1d\x64ouble_spin_box_value_changed\x18\x06 \x01(\x0b\x32(.specter_proto.DoubleSpinBoxValueChangedH\x00\x12\x41\n\x14slider_value_changed\x18\x07 \x01(\x0b\x32!.specter_proto.SliderValueChangedH\x00\x12?\n\x13tab_current_changed\x18\x08 \x01(\x0b\x32 .specter_proto.TabCurrentChangedH\x00\x12.\n\ntab_closed\x18\t \x01(\x0b\x32\x18.specter_proto.TabClosedH\x00\x12,\n\ttab_moved\x18\n \x01(\x0b\x32\x17.specter_proto.TabMovedH\x00\x12H\n\x18tool_box_current_changed\x18\x0b \x01(\x0b\x32$.specter_proto.ToolBoxCurrentChangedH\x00\x12:\n\x10\x61\x63tion_triggered\x18\x0c \x01(\x0b\x32\x1e.specter_proto.ActionTriggeredH\x00\x12\x36\n\x0e\x61\x63tion_hovered\x18\r \x01(\x0b\x32\x1c.specter_proto.ActionHoveredH\x00\x12\x44\n\x16text_edit_text_changed\x18\x0e \x01(\x0b\x32\".specter_proto.TextEditTextChangedH\x00\x12\x44\n\x16line_edit_text_changed\x18\x0f \x01(\x0b\x32\".specter_proto.LineEditTextChangedH\x00\x12H\n\x18line_edit_return_pressed\x18\x10 \x01(\x0b\x32$.specter_proto.LineEditReturnPressedH\x00\x12:\n\x10window_minimized\x18\x11 \x01(\x0b\x32\x1e.specter_proto.WindowMinimizedH\x00\x12:\n\x10window_maximized\x18\x12 \x01(\x0b\x32\x1e.specter_proto.WindowMaximizedH\x00\x12\x34\n\rwindow_closed\x18\x13 \x01(\x0b\x32\x1b.specter_proto.WindowClosedH\x00\x12*\n\x08idle_gap\x18\x14 \x01(\x0b\x32\x16.specter_proto.IdleGapH\x00\x12\x11\n\ttimestamp\x18\x15 \x01(\x01\x42\x07\n\x05\x65vent*+\n\rPreviewFormat\x12\x07\n\x03PNG\x10\x00\x12\x08\n\x04JPEG\x10\x01\x12\x07\n\x03RAW\x10\x02*.\n\x0bMouseButton\x12\x08\n\x04LEFT\x10\x00\x12\t\n\x05RIGHT\x10\x01\x12\n\n\x06MIDDLE\x10\x02*R\n\x06\x41nchor\x12\n\n\x06\x43\x45NTER\x10\x00\x12\x0b\n\x07LEFT_UP\x10\x01\x12\x0c\n\x08RIGHT_UP\x10\x02\x12\x0f\n\x0bLEFT_BOTTOM\x10\x03\x12\x10\n\x0cRIGHT_BOTTOM\x10\x04\x32\x63\n\x10PreviewerService\x12O\n\rListenPreview\x12\x1d.specter_proto.PreviewRequest\x1a\x1b.specter_proto.PreviewImage\"\x00\x30\x01\x32\xd3\x01\n\rMarkerService\x12\x39\n\x05Start\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x38\n\x04Stop\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\x16ListenSelectionChanges\x12\x16.google.protobuf.Empty\x1a\x17.specter_proto.ObjectId\"\x00\x30\x01\x32_\n\x0fRecorderService\x12L\n\x0eListenCommands\x12\x16.google.protobuf.Empty\x1a\x1e.specter_proto.RecorderCommand\"\x00\x30\x01\x32\xf4\x03\n\x0cMouseService\x12\x42\n\x0bPressButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x44\n\rReleaseButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x42\n\x0b\x43lickButton\x12\x19.specter_proto.MouseEvent\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\nMoveCursor\x12\x19.specter_proto.CursorMove\x1a\x16.google.protobuf.Empty\"\x00\x12\x43\n\x0bScrollWheel\x12\x1a.specter_proto.WheelScroll\x1a\x16.google.protobuf.Empty\"\x00\x12\x45\n\rClickOnObject\x12\x1a.specter_proto.ObjectClick\x1a\x16.google.protobuf.Empty\"\x00\x12G\n\x0fHoverOverObject\x12\x1a.specter_proto.ObjectHover\x1a\x16.google.protobuf.Empty\"\x00\x32\xe0\x02\n\x0fKeyboardService\x12=\n\x08PressKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\nReleaseKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12;\n\x06TapKey\x12\x17.specter_proto.KeyEvent\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\tEnterText\x12\x18.specter_proto.TextInput\x1a\x16.google.protobuf.Empty\"\x00\x12O\n\x13\x45nterTextIntoObject\x12\x1e.specter_proto.ObjectTextInput\x1a\x16.google.protobuf.Empty\"\x00\x32\xab\x06\n\rObjectService\x12G\n\x07GetTree\x12\x1f.specter_proto.OptionalObjectId\x1a\x19.specter_proto.ObjectTree\"\x00\x12\x44\n\x04\x46ind\x12 .specter_proto.ObjectSearchQuery\x1a\x18.specter_proto.ObjectIds\"\x00\x12M\n\x0eGetObjectQuery\x12\x17.specter_proto.ObjectId\x1a .specter_proto.ObjectSearchQuery\"\x00\x12?\n\tGetParent\x12\x17.specter_proto.ObjectId\x1a\x17.specter_proto.ObjectId\"\x00\x12\x42\n\x0bGetChildren\x12\x17.specter_proto.ObjectId\x1a\x18.specter_proto.ObjectIds\"\x00\x12\x41\n\nCallMethod\x12\x19.specter_proto.MethodCall\x1a\x16.google.protobuf.Empty\"\x00\x12I\n\x0eUpdateProperty\x12\x1d.specter_proto.PropertyUpdate\x1a\x16.google.protobuf.Empty\"\x00\x12?\n\nGetMethods\x12\x17.specter_proto.ObjectId\x1a\x16.specter_proto.Methods\"\x00\x12\x45\n\rGetProperties\x12\x17.specter_proto.ObjectId\x1a\x19.specter_proto.Properties\"\x00\x12J\n\x11ListenTreeChanges\x12\x16.google.protobuf.Empty\x1a\x19.specter_proto.TreeChange\"\x00\x30\x01\x12U\n\x17ListenPropertiesChanges\x12\x17.specter_proto.ObjectId\x1a\x1d.specter_proto.PropertyChange\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'specter.proto.specter_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_MOUSEBUTTON']._serialized_start=6761
-  _globals['_MOUSEBUTTON']._serialized_end=6807
-  _globals['_ANCHOR']._serialized_start=6809
-  _globals['_ANCHOR']._serialized_end=6891
+  _globals['_PREVIEWFORMAT']._serialized_start=7217
+  _globals['_PREVIEWFORMAT']._serialized_end=7260
+  _globals['_MOUSEBUTTON']._serialized_start=7262
+  _globals['_MOUSEBUTTON']._serialized_end=7308
+  _globals['_ANCHOR']._serialized_start=7310
+  _globals['_ANCHOR']._serialized_end=7392
   _globals['_OBJECTID']._serialized_start=105
   _globals['_OBJECTID']._serialized_end=127
   _globals['_OPTIONALOBJECTID']._serialized_start=129
@@ -45,112 +47,118 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_OBJECTIDS']._serialized_end=222
   _globals['_OBJECTSEARCHQUERY']._serialized_start=224
   _globals['_OBJECTSEARCHQUERY']._serialized_end=258
-  _globals['_PREVIEWIMAGE']._serialized_start=260
-  _globals['_PREVIEWIMAGE']._serialized_end=289
-  _globals['_OBJECTTREE']._serialized_start=291
-  _globals['_OBJECTTREE']._serialized_end=345
-  _globals['_OBJECTNODE']._serialized_start=347
-  _globals['_OBJECTNODE']._serialized_end=448
-  _globals['_METHODCALL']._serialized_start=450
-  _globals['_METHODCALL']._serialized_end=570
-  _globals['_PROPERTYUPDATE']._serialized_start=572
-  _globals['_PROPERTYUPDATE']._serialized_end=694
-  _globals['_METHODS']._serialized_start=696
-  _globals['_METHODS']._serialized_end=745
-  _globals['_METHOD']._serialized_start=747
-  _globals['_METHOD']._serialized_end=822
-  _globals['_PARAMETER']._serialized_start=824
-  _globals['_PARAMETER']._serialized_end=906
-  _globals['_PROPERTIES']._serialized_start=908
-  _globals['_PROPERTIES']._serialized_end=965
-  _globals['_PROPERTY']._serialized_start=967
-  _globals['_PROPERTY']._serialized_end=1058
-  _globals['_TREECHANGE']._serialized_start=1061
-  _globals['_TREECHANGE']._serialized_end=1286
-  _globals['_OBJECTADDED']._serialized_start=1288
-  _globals['_OBJECTADDED']._serialized_end=1389
-  _globals['_OBJECTREMOVED']._serialized_start=1391
-  _globals['_OBJECTREMOVED']._serialized_end=1450
-  _globals['_OBJECTREPARENTED']._serialized_start=1452
-  _globals['_OBJECTREPARENTED']._serialized_end=1558
-  _globals['_OBJECTRENAMED']._serialized_start=1560
-  _globals['_OBJECTRENAMED']._serialized_end=1675
-  _globals['_PROPERTYCHANGE']._serialized_start=1678
-  _globals['_PROPERTYCHANGE']._serialized_end=1858
-  _globals['_PROPERTYADDED']._serialized_start=1860
-  _globals['_PROPERTYADDED']._serialized_end=1956
-  _globals['_PROPERTYREMOVED']._serialized_start=1958
-  _globals['_PROPERTYREMOVED']._serialized_end=1998
-  _globals['_PROPERTYUPDATED']._serialized_start=2000
-  _globals['_PROPERTYUPDATED']._serialized_end=2126
-  _globals['_OFFSET']._serialized_start=2128
-  _globals['_OFFSET']._serialized_end=2158
-  _globals['_MOUSEEVENT']._serialized_start=2161
-  _globals['_MOUSEEVENT']._serialized_end=2300
-  _globals['_CURSORMOVE']._serialized_start=2302
-  _globals['_CURSORMOVE']._serialized_end=2353
-  _globals['_WHEELSCROLL']._serialized_start=2355
-  _globals['_WHEELSCROLL']._serialized_end=2402
-  _globals['_OBJECTCLICK']._serialized_start=2405
-  _globals['_OBJECTCLICK']._serialized_end=2644
-  _globals['_OBJECTHOVER']._serialized_start=2647
-  _globals['_OBJECTHOVER']._serialized_end=2798
-  _globals['_KEYEVENT']._serialized_start=2801
-  _globals['_KEYEVENT']._serialized_end=2941
-  _globals['_TEXTINPUT']._serialized_start=2943
-  _globals['_TEXTINPUT']._serialized_end=2968
-  _globals['_OBJECTTEXTINPUT']._serialized_start=2970
-  _globals['_OBJECTTEXTINPUT']._serialized_end=3045
-  _globals['_CONTEXTMENUOPENED']._serialized_start=3047
-  _globals['_CONTEXTMENUOPENED']._serialized_end=3166
-  _globals['_BUTTONCLICKED']._serialized_start=3168
-  _globals['_BUTTONCLICKED']._serialized_end=3283
-  _globals['_BUTTONTOGGLED']._serialized_start=3286
-  _globals['_BUTTONTOGGLED']._serialized_end=3418
-  _globals['_COMBOBOXCURRENTCHANGED']._serialized_start=3421
-  _globals['_COMBOBOXCURRENTCHANGED']._serialized_end=3560
-  _globals['_SPINBOXVALUECHANGED']._serialized_start=3563
-  _globals['_SPINBOXVALUECHANGED']._serialized_end=3699
-  _globals['_DOUBLESPINBOXVALUECHANGED']._serialized_start=3702
-  _globals['_DOUBLESPINBOXVALUECHANGED']._serialized_end=3844
-  _globals['_SLIDERVALUECHANGED']._serialized_start=3847
-  _globals['_SLIDERVALUECHANGED']._serialized_end=3982
-  _globals['_TABCURRENTCHANGED']._serialized_start=3985
-  _globals['_TABCURRENTCHANGED']._serialized_end=4119
-  _globals['_TABCLOSED']._serialized_start=4121
-  _globals['_TABCLOSED']._serialized_end=4247
-  _globals['_TABMOVED']._serialized_start=4250
-  _globals['_TABMOVED']._serialized_end=4386
-  _globals['_TOOLBOXCURRENTCHANGED']._serialized_start=4389
-  _globals['_TOOLBOXCURRENTCHANGED']._serialized_end=4527
-  _globals['_ACTIONTRIGGERED']._serialized_start=4529
-  _globals['_ACTIONTRIGGERED']._serialized_end=4646
-  _globals['_ACTIONHOVERED']._serialized_start=4648
-  _globals['_ACTIONHOVERED']._serialized_end=4763
-  _globals['_TEXTEDITTEXTCHANGED']._serialized_start=4766
-  _globals['_TEXTEDITTEXTCHANGED']._serialized_end=4902
-  _globals['_LINEEDITTEXTCHANGED']._serialized_start=4905
-  _globals['_LINEEDITTEXTCHANGED']._serialized_end=5041
-  _globals['_LINEEDITRETURNPRESSED']._serialized_start=5043
-  _globals['_LINEEDITRETURNPRESSED']._serialized_end=5166
-  _globals['_WINDOWMINIMIZED']._serialized_start=5168
-  _globals['_WINDOWMINIMIZED']._serialized_end=5285
-  _globals['_WINDOWMAXIMIZED']._serialized_start=5287
-  _globals['_WINDOWMAXIMIZED']._serialized_end=5404
-  _globals['_WINDOWCLOSED']._serialized_start=5406
-  _globals['_WINDOWCLOSED']._serialized_end=5520
-  _globals['_RECORDERCOMMAND']._serialized_start=5523
-  _globals['_RECORDERCOMMAND']._serialized_end=6759
-  _globals['_PREVIEWERSERVICE']._serialized_start=6893
-  _globals['_PREVIEWERSERVICE']._serialized_end=6986
-  _globals['_MARKERSERVICE']._serialized_start=6989
-  _globals['_MARKERSERVICE']._serialized_end=7200
-  _globals['_RECORDERSERVICE']._serialized_start=7202
-  _globals['_RECORDERSERVICE']._serialized_end=7297
-  _globals['_MOUSESERVICE']._serialized_start=7300
-  _globals['_MOUSESERVICE']._serialized_end=7800
-  _globals['_KEYBOARDSERVICE']._serialized_start=7803
-  _globals['_KEYBOARDSERVICE']._serialized_end=8155
-  _globals['_OBJECTSERVICE']._serialized_start=8158
-  _globals['_OBJECTSERVICE']._serialized_end=8969
+  _globals['_PREVIEWREQUEST']._serialized_start=261
+  _globals['_PREVIEWREQUEST']._serialized_end=412
+  _globals['_PREVIEWRECT']._serialized_start=414
+  _globals['_PREVIEWRECT']._serialized_end=495
+  _globals['_PREVIEWIMAGE']._serialized_start=498
+  _globals['_PREVIEWIMAGE']._serialized_end=653
+  _globals['_OBJECTTREE']._serialized_start=655
+  _globals['_OBJECTTREE']._serialized_end=709
+  _globals['_OBJECTNODE']._serialized_start=711
+  _globals['_OBJECTNODE']._serialized_end=812
+  _globals['_METHODCALL']._serialized_start=814
+  _globals['_METHODCALL']._serialized_end=934
+  _globals['_PROPERTYUPDATE']._serialized_start=936
+  _globals['_PROPERTYUPDATE']._serialized_end=1058
+  _globals['_METHODS']._serialized_start=1060
+  _globals['_METHODS']._serialized_end=1109
+  _globals['_METHOD']._serialized_start=1111
+  _globals['_METHOD']._serialized_end=1186
+  _globals['_PARAMETER']._serialized_start=1188
+  _globals['_PARAMETER']._serialized_end=1270
+  _globals['_PROPERTIES']._serialized_start=1272
+  _globals['_PROPERTIES']._serialized_end=1329
+  _globals['_PROPERTY']._serialized_start=1331
+  _globals['_PROPERTY']._serialized_end=1422
+  _globals['_TREECHANGE']._serialized_start=1425
+  _globals['_TREECHANGE']._serialized_end=1650
+  _globals['_OBJECTADDED']._serialized_start=1652
+  _globals['_OBJECTADDED']._serialized_end=1753
+  _globals['_OBJECTREMOVED']._serialized_start=1755
+  _globals['_OBJECTREMOVED']._serialized_end=1814
+  _globals['_OBJECTREPARENTED']._serialized_start=1816
+  _globals['_OBJECTREPARENTED']._serialized_end=1922
+  _globals['_OBJECTRENAMED']._serialized_start=1924
+  _globals['_OBJECTRENAMED']._serialized_end=2039
+  _globals['_PROPERTYCHANGE']._serialized_start=2042
+  _globals['_PROPERTYCHANGE']._serialized_end=2222
+  _globals['_PROPERTYADDED']._serialized_start=2224
+  _globals['_PROPERTYADDED']._serialized_end=2320
+  _globals['_PROPERTYREMOVED']._serialized_start=2322
+  _globals['_PROPERTYREMOVED']._serialized_end=2362
+  _globals['_PROPERTYUPDATED']._serialized_start=2364
+  _globals['_PROPERTYUPDATED']._serialized_end=2490
+  _globals['_OFFSET']._serialized_start=2492
+  _globals['_OFFSET']._serialized_end=2522
+  _globals['_MOUSEEVENT']._serialized_start=2525
+  _globals['_MOUSEEVENT']._serialized_end=2664
+  _globals['_CURSORMOVE']._serialized_start=2666
+  _globals['_CURSORMOVE']._serialized_end=2717
+  _globals['_WHEELSCROLL']._serialized_start=2719
+  _globals['_WHEELSCROLL']._serialized_end=2766
+  _globals['_OBJECTCLICK']._serialized_start=2769
+  _globals['_OBJECTCLICK']._serialized_end=3008
+  _globals['_OBJECTHOVER']._serialized_start=3011
+  _globals['_OBJECTHOVER']._serialized_end=3162
+  _globals['_KEYEVENT']._serialized_start=3165
+  _globals['_KEYEVENT']._serialized_end=3305
+  _globals['_TEXTINPUT']._serialized_start=3307
+  _globals['_TEXTINPUT']._serialized_end=3332
+  _globals['_OBJECTTEXTINPUT']._serialized_start=3334
+  _globals['_OBJECTTEXTINPUT']._serialized_end=3409
+  _globals['_CONTEXTMENUOPENED']._serialized_start=3411
+  _globals['_CONTEXTMENUOPENED']._serialized_end=3530
+  _globals['_BUTTONCLICKED']._serialized_start=3532
+  _globals['_BUTTONCLICKED']._serialized_end=3647
+  _globals['_BUTTONTOGGLED']._serialized_start=3650
+  _globals['_BUTTONTOGGLED']._serialized_end=3782
+  _globals['_COMBOBOXCURRENTCHANGED']._serialized_start=3785
+  _globals['_COMBOBOXCURRENTCHANGED']._serialized_end=3924
+  _globals['_SPINBOXVALUECHANGED']._serialized_start=3927
+  _globals['_SPINBOXVALUECHANGED']._serialized_end=4063
+  _globals['_DOUBLESPINBOXVALUECHANGED']._serialized_start=4066
+  _globals['_DOUBLESPINBOXVALUECHANGED']._serialized_end=4208
+  _globals['_SLIDERVALUECHANGED']._serialized_start=4211
+  _globals['_SLIDERVALUECHANGED']._serialized_end=4346
+  _globals['_TABCURRENTCHANGED']._serialized_start=4349
+  _globals['_TABCURRENTCHANGED']._serialized_end=4483
+  _globals['_TABCLOSED']._serialized_start=4485
+  _globals['_TABCLOSED']._serialized_end=4611
+  _globals['_TABMOVED']._serialized_start=4614
+  _globals['_TABMOVED']._serialized_end=4750
+  _globals['_TOOLBOXCURRENTCHANGED']._serialized_start=4753
+  _globals['_TOOLBOXCURRENTCHANGED']._serialized_end=4891
+  _globals['_ACTIONTRIGGERED']._serialized_start=4893
+  _globals['_ACTIONTRIGGERED']._serialized_end=5010
+  _globals['_ACTIONHOVERED']._serialized_start=5012
+  _globals['_ACTIONHOVERED']._serialized_end=5127
+  _globals['_TEXTEDITTEXTCHANGED']._serialized_start=5130
+  _globals['_TEXTEDITTEXTCHANGED']._serialized_end=5266
+  _globals['_LINEEDITTEXTCHANGED']._serialized_start=5269
+  _globals['_LINEEDITTEXTCHANGED']._serialized_end=5405
+  _globals['_LINEEDITRETURNPRESSED']._serialized_start=5407
+  _globals['_LINEEDITRETURNPRESSED']._serialized_end=5530
+  _globals['_WINDOWMINIMIZED']._serialized_start=5532
+  _globals['_WINDOWMINIMIZED']._serialized_end=5649
+  _globals['_WINDOWMAXIMIZED']._serialized_start=5651
+  _globals['_WINDOWMAXIMIZED']._serialized_end=5768
+  _globals['_WINDOWCLOSED']._serialized_start=5770
+  _globals['_WINDOWCLOSED']._serialized_end=5884
+  _globals['_IDLEGAP']._serialized_start=5886
+  _globals['_IDLEGAP']._serialized_end=5913
+  _globals['_RECORDERCOMMAND']._serialized_start=5916
+  _globals['_RECORDERCOMMAND']._serialized_end=7215
+  _globals['_PREVIEWERSERVICE']._serialized_start=7394
+  _globals['_PREVIEWERSERVICE']._serialized_end=7493
+  _globals['_MARKERSERVICE']._serialized_start=7496
+  _globals['_MARKERSERVICE']._serialized_end=7707
+  _globals['_RECORDERSERVICE']._serialized_start=7709
+  _globals['_RECORDERSERVICE']._serialized_end=7804
+  _globals['_MOUSESERVICE']._serialized_start=7807
+  _globals['_MOUSESERVICE']._serialized_end=8307
+  _globals['_KEYBOARDSERVICE']._serialized_start=8310
+  _globals['_KEYBOARDSERVICE']._serialized_end=8662
+  _globals['_OBJECTSERVICE']._serialized_start=8665
+  _globals['_OBJECTSERVICE']._serialized_end=9476
 # @@protoc_insertion_point(module_scope)
@@ -39,7 +39,7 @@ class PreviewerServiceStub(object):
         """
         self.ListenPreview = channel.unary_stream(
                 '/specter_proto.PreviewerService/ListenPreview',
-                request_serializer=specter_dot_proto_dot_specter__pb2.ObjectId.SerializeToString,
+                request_serializer=specter_dot_proto_dot_specter__pb2.PreviewRequest.SerializeToString,
                 response_deserializer=specter_dot_proto_dot_specter__pb2.PreviewImage.FromString,
                 _registered_method=True)
 
@@ -60,7 +60,7 @@ def add_PreviewerServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'ListenPreview': grpc.unary_stream_rpc_method_handler(
                     servicer.ListenPreview,
-                    request_deserializer=specter_dot_proto_dot_specter__pb2.ObjectId.FromString,
+                    request_deserializer=specter_dot_proto_dot_specter__pb2.PreviewRequest.FromString,
                     response_serializer=specter_dot_proto_dot_specter__pb2.PreviewImage.SerializeToString,
             ),
     }
@@ -91,7 +91,7 @@ class PreviewerService(object):
             request,
             target,
             '/specter_proto.PreviewerService/ListenPreview',
-            specter_dot_proto_dot_specter__pb2.ObjectId.SerializeToString,
+            specter_dot_proto_dot_specter__pb2.PreviewRequest.SerializeToString,
             specter_dot_proto_dot_specter__pb2.PreviewImage.FromString,
             options,
             channel_credentials,
@@ -0,0 +1,45 @@
+import typing
+import threading
+
+import grpc
+
+
+class CallBatch:
+    _local = threading.local()
+
+    def __init__(self):
+        self._futures: list[grpc.Future] = []
+        self._in_flight: dict[str, grpc.Future] = {}
+        self._previous: typing.Optional["CallBatch"] = None
+
+    @classmethod
+    def current(cls) -> typing.Optional["CallBatch"]:
+        return getattr(cls._local, "batch", None)
+
+    def __enter__(self):
+        self._previous = CallBatch.current()
+        CallBatch._local.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        CallBatch._local.batch = self._previous
+        self._previous = None
+        self.wait(raise_errors=exc_type is None)
+
+    def submit(self, key: str, rpc: typing.Any, request: typing.Any) -> None:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            in_flight.exception()
+
+        future = rpc.future(request)
+        self._in_flight[key] = future
+        self._futures.append(future)
+
+    def wait(self, raise_errors: bool = True) -> None:
+        futures, self._futures = self._futures, []
+        self._in_flight.clear()
+
+        errors = [future.exception() for future in futures]
+        errors = [error for error in errors if error is not None]
+        if errors and raise_errors:
+            raise errors[0]
@@ -0,0 +1,111 @@
+import typing
+
+import grpc
+from google.protobuf.struct_pb2 import Value
+
+from specter.proto.specter_pb2 import (
+    ObjectId,
+    ObjectNode,
+    OptionalObjectId,
+    PropertyUpdate,
+)
+
+from specter.client import Client
+from specter.scripts.batch import CallBatch
+
+
+class RestoreReport:
+    def __init__(self):
+        self.checked = 0
+        self.updated = 0
+        self.missing: list[str] = []
+
+
+class StateCheckpoint:
+    def __init__(
+        self,
+        root_id: typing.Optional[str],
+        values: dict[str, dict[str, Value]],
+    ):
+        self.root_id = root_id
+        self.values = values
+
+    def __len__(self) -> int:
+        return sum(len(properties) for properties in self.values.values())
+
+    @classmethod
+    def take(
+        cls,
+        client: Client,
+        root_id: typing.Optional[str] = None,
+        properties: typing.Optional[typing.Iterable[str]] = None,
+    ) -> "StateCheckpoint":
+        request = (
+            OptionalObjectId() if root_id is None else OptionalObjectId(id=root_id)
+        )
+        tree = client.object_stub.GetTree(request)
+
+        object_ids: list[str] = []
+        for root in tree.roots:
+            _collect_object_ids(root, object_ids)
+
+        names = None if properties is None else set(properties)
+        values = {}
+        for object_id, snapshot in _read_properties(client, object_ids).items():
+            values[object_id] = {
+                p.property_name: p.value
+                for p in snapshot
+                if not p.read_only and (names is None or p.property_name in names)
+            }
+        return cls(root_id, values)
+
+    def restore(self, client: Client) -> RestoreReport:
+        report = RestoreReport()
+        current = _read_properties(client, list(self.values))
+
+        with CallBatch() as batch:
+            for object_id, values in self.values.items():
+                snapshot = current.get(object_id)
+                if snapshot is None:
+                    report.missing.append(object_id)
+                    continue
+
+                current_values = {p.property_name: p.value for p in snapshot}
+                for property_name, value in values.items():
+                    report.checked += 1
+                    if current_values.get(property_name) == value:
+                        continue
+
+                    batch.submit(
+                        object_id,
+                        client.object_stub.UpdateProperty,
+                        PropertyUpdate(
+                            object_id=ObjectId(id=object_id),
+                            property_name=property_name,
+                            value=value,
+                        ),
+                    )
+                    report.updated += 1
+
+        return report
+
+
+def _collect_object_ids(node: ObjectNode, object_ids: list[str]) -> None:
+    object_ids.append(node.object_id.id)
+    for child in node.children:
+        _collect_object_ids(child, object_ids)
+
+
+def _read_properties(client: Client, object_ids: list[str]) -> dict[str, typing.Any]:
+    futures = [
+        client.object_stub.GetProperties.future(ObjectId(id=object_id))
+        for object_id in object_ids
+    ]
+
+    snapshots = {}
+    for object_id, future in zip(object_ids, futures):
+        try:
+            snapshots[object_id] = future.result().properties
+        except grpc.RpcError:
+            continue
+    return snapshots
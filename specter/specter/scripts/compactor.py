@@ -0,0 +1,145 @@
+import typing
+
+from specter.proto.specter_pb2 import RecorderCommand, IdleGap
+from specter.scripts.generator import CodeGenerator
+
+
+class CompactionReport:
+    def __init__(self):
+        self.original = 0
+        self.compacted = 0
+        self.hovers_dropped = 0
+        self.overwritten = 0
+        self.inverse_pairs = 0
+        self.idle_gaps = 0
+
+    @property
+    def reduction(self) -> float:
+        return 1 - self.compacted / self.original if self.original else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.original} -> {self.compacted} events "
+            f"({self.reduction:.0%} smaller): "
+            f"{self.hovers_dropped} hovers dropped, "
+            f"{self.overwritten} overwritten, "
+            f"{self.inverse_pairs} inverse pairs removed, "
+            f"{self.idle_gaps} idle gaps marked"
+        )
+
+
+class RecordingCompactor:
+    HOVER_GROUP = {"action_hovered"}
+    LAST_WRITE_GROUP = (
+        CodeGenerator.TEXT_GROUP | CodeGenerator.NUMERIC_GROUP | {"button_toggled"}
+    )
+    INVERSE_GROUP = {"button_toggled", "tab_moved"}
+
+    def __init__(self, idle_gap: float = 2.0):
+        self.idle_gap = idle_gap
+        self.report = CompactionReport()
+        self._window: list[RecorderCommand] = []
+        self._last_timestamp = 0.0
+
+    def compact(
+        self, events: typing.Iterable[RecorderCommand]
+    ) -> typing.Iterator[RecorderCommand]:
+        for event in events:
+            yield from self.feed(event)
+        yield from self.finish()
+
+    def feed(self, event: RecorderCommand) -> list[RecorderCommand]:
+        which = event.WhichOneof("event")
+        if not which:
+            return []
+        self.report.original += 1
+
+        previous_timestamp = self._last_timestamp
+        if event.timestamp:
+            self._last_timestamp = event.timestamp
+
+        if which in self.HOVER_GROUP:
+            self.report.hovers_dropped += 1
+            return []
+
+        events = []
+        gap = event.timestamp - previous_timestamp
+        if self.idle_gap > 0 and previous_timestamp and gap >= self.idle_gap:
+            events.extend(self._flush(self._window))
+            self.report.idle_gaps += 1
+            events.append(
+                RecorderCommand(
+                    idle_gap=IdleGap(duration=gap), timestamp=previous_timestamp
+                )
+            )
+
+        if which not in CodeGenerator.BARRIER_GROUP:
+            self._window.append(event)
+        elif not self._merge_adjacent(self._window, event):
+            events.extend(self._flush(self._window))
+            self._window.append(event)
+
+        return events
+
+    def finish(self) -> list[RecorderCommand]:
+        return self._flush(self._window)
+
+    def pending(self) -> list[RecorderCommand]:
+        return self._keep_last_writes(self._window)
+
+    def _flush(self, window: list[RecorderCommand]) -> list[RecorderCommand]:
+        events = self._keep_last_writes(window)
+        self.report.overwritten += len(window) - len(events)
+        self.report.compacted += len(events)
+        window.clear()
+        return events
+
+    def _merge_adjacent(
+        self, window: list[RecorderCommand], event: RecorderCommand
+    ) -> bool:
+        object_key, which = self._get_key(event)
+        if not object_key or len(window) != 1:
+            return False
+        if self._get_key(window[0]) != (object_key, which):
+            return False
+
+        if which in self.INVERSE_GROUP and self._is_inverse(
+            which, getattr(window[0], which), getattr(event, which)
+        ):
+            window.clear()
+            self.report.inverse_pairs += 1
+            return True
+
+        if which in self.LAST_WRITE_GROUP:
+            window[0] = event
+            self.report.overwritten += 1
+            return True
+
+        return False
+
+    def _keep_last_writes(self, window: list[RecorderCommand]) -> list[RecorderCommand]:
+        last_writes: dict[tuple[str, str], int] = {}
+        for index, event in enumerate(window):
+            key = self._get_key(event)
+            if key[0] and key[1] in self.LAST_WRITE_GROUP:
+                last_writes[key] = index
+
+        events = [
+            event
+            for index, event in enumerate(window)
+            if last_writes.get(self._get_key(event), index) == index
+        ]
+        return events
+
+    @staticmethod
+    def _is_inverse(which: str, previous: typing.Any, current: typing.Any) -> bool:
+        if which == "button_toggled":
+            return previous.checked != current.checked
+        return getattr(previous, "from") == current.to and previous.to == getattr(
+            current, "from"
+        )
+
+    @staticmethod
+    def _get_key(event: RecorderCommand) -> tuple[str, str]:
+        which = event.WhichOneof("event")
+        return CodeGenerator._get_id_key(getattr(event, which)), which
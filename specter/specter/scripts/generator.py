@@ -1,10 +1,15 @@
-import typing
+import io
 import re
+import copy
+import textwrap
+import typing
 
 
 class CodeGenerator:
     def __init__(self):
         self._object_vars: dict[str, str] = {}
+        self._pending: typing.Any = None
+        self._pending_owned = False
         self._event_mapping = {
             "context_menu_opened": self._context_menu_opened,
             "button_clicked": self._button_clicked,
@@ -21,6 +26,7 @@ class CodeGenerator:
             "text_edit_text_changed": self._text_edit_text_changed,
             "line_edit_text_changed": self._line_edit_text_changed,
             "line_edit_return_pressed": self._line_edit_return_pressed,
+            "idle_gap": self._idle_gap,
         }
 
     @staticmethod
@@ -33,61 +39,58 @@ class CodeGenerator:
         except Exception:
             return ""
 
+    TEXT_GROUP = {"text_edit_text_changed", "line_edit_text_changed"}
+    NUMERIC_GROUP = {
+        "combo_box_current_changed",
+        "spin_box_value_changed",
+        "double_spin_box_value_changed",
+        "slider_value_changed",
+        "tab_current_changed",
+        "tool_box_current_changed",
+    }
+    BARRIER_GROUP = {
+        "context_menu_opened",
+        "button_clicked",
+        "button_toggled",
+        "combo_box_current_changed",
+        "tab_current_changed",
+        "tab_closed",
+        "tab_moved",
+        "tool_box_current_changed",
+        "action_triggered",
+        "line_edit_return_pressed",
+        "idle_gap",
+        "window_minimized",
+        "window_maximized",
+        "window_closed",
+    }
+
     @staticmethod
-    def _normalize(events: list[typing.Any]) -> list[typing.Any]:
-        if not events:
-            return []
+    def _can_coalesce(last: typing.Any, event: typing.Any) -> bool:
+        which = event.WhichOneof("event")
+        if which != last.WhichOneof("event"):
+            return False
+        if which not in CodeGenerator.TEXT_GROUP | CodeGenerator.NUMERIC_GROUP:
+            return False
+
+        last_id = CodeGenerator._get_id_key(getattr(last, which))
+        return bool(last_id) and last_id == CodeGenerator._get_id_key(
+            getattr(event, which)
+        )
 
-        out: list[typing.Any] = []
-        for ev in events:
-            which = ev.WhichOneof("event")
-            if not which:
-                continue
-            inner = getattr(ev, which)
-
-            if not out:
-                out.append(ev)
-                continue
-
-            last = out[-1]
-            last_which = last.WhichOneof("event")
-            last_inner = getattr(last, last_which)
-
-            last_id = CodeGenerator._get_id_key(last_inner)
-            cur_id = CodeGenerator._get_id_key(inner)
-
-            text_group = {"text_edit_text_changed", "line_edit_text_changed"}
-            if (
-                which in text_group
-                and which == last_which
-                and last_id
-                and last_id == cur_id
-            ):
-                setattr(last_inner, "value", inner.value)
-                continue
-
-            numeric_group = {
-                "combo_box_current_changed",
-                "spin_box_value_changed",
-                "double_spin_box_value_changed",
-                "slider_value_changed",
-                "tab_current_changed",
-                "tool_box_current_changed",
-            }
-            if (
-                which in numeric_group
-                and which == last_which
-                and last_id
-                and last_id == cur_id
-            ):
-                for fld in ("index", "value", "from", "to"):
-                    if hasattr(inner, fld):
-                        setattr(last_inner, fld, getattr(inner, fld))
-                continue
-
-            out.append(ev)
-
-        return out
+    @staticmethod
+    def _coalesce(last: typing.Any, event: typing.Any) -> None:
+        which = event.WhichOneof("event")
+        last_inner = getattr(last, which)
+        inner = getattr(event, which)
+
+        if which in CodeGenerator.TEXT_GROUP:
+            setattr(last_inner, "value", inner.value)
+            return
+
+        for fld in ("index", "value", "from", "to"):
+            if hasattr(inner, fld):
+                setattr(last_inner, fld, getattr(inner, fld))
 
     @staticmethod
     def _wrap(action: str, code: str, width: int = 80) -> str:
@@ -202,21 +205,140 @@ class CodeGenerator:
         code = f"{prefix}"
         return self._wrap("lineedit return pressed", code)
 
-    def generate(self, events: list[typing.Any]) -> str:
-        script_text = ""
-        normalized = self._normalize(events)
-
-        for event in normalized:
-            which = event.WhichOneof("event")
-            assert which, "event must have an inner oneof set"
-            handler = self._event_mapping.get(which)
-            if not handler:
-                script_text += f"# Skipping unsupported event: {which}\n"
-                continue
-            inner = getattr(event, which)
+    def _idle_gap(self, event: typing.Any) -> str:
+        code = f"# idle for {event.duration:.1f} s\n"
+        return self._wrap("idle gap", code)
+
+    def _generate_event(self, event: typing.Any) -> str:
+        which = event.WhichOneof("event")
+        assert which, "event must have an inner oneof set"
+        handler = self._event_mapping.get(which)
+        if not handler:
+            return f"# Skipping unsupported event: {which}\n"
+        inner = getattr(event, which)
+        try:
+            return f"{handler(inner)}\n"
+        except Exception as exc:
+            return f"# Error generating code for event {which}: {exc}\n"
+
+    def feed(self, event: typing.Any) -> list[str]:
+        if not event.WhichOneof("event"):
+            return []
+
+        if self._pending is not None and self._can_coalesce(self._pending, event):
+            if not self._pending_owned:
+                self._pending = copy.deepcopy(self._pending)
+                self._pending_owned = True
+            self._coalesce(self._pending, event)
+            return []
+
+        chunks = self._flush_pending()
+        self._pending = event
+        self._pending_owned = False
+        return chunks
+
+    def finish(self) -> list[str]:
+        return self._flush_pending()
+
+    def _flush_pending(self) -> list[str]:
+        if self._pending is None:
+            return []
+
+        pending, self._pending = self._pending, None
+        chunk = self._generate_event(pending)
+        return [chunk] if chunk else []
+
+    def preview_pending(self, events: typing.Iterable[typing.Any] = ()) -> list[str]:
+        state = self._pending, self._pending_owned, dict(self._object_vars)
+        self._pending_owned = False
+        try:
+            chunks = []
+            for event in events:
+                chunks.extend(self.feed(event))
+            chunks.extend(self.finish())
+            return chunks
+        finally:
+            self._pending, self._pending_owned, self._object_vars = state
+
+    def write(self, events: typing.Iterable[typing.Any], out: typing.TextIO) -> None:
+        for event in events:
+            out.writelines(self.feed(event))
+        out.writelines(self.finish())
+
+    def generate(self, events: typing.Iterable[typing.Any]) -> str:
+        out = io.StringIO()
+        self.write(events, out)
+        return out.getvalue()
+
+
+class BatchedCodeGenerator(CodeGenerator):
+    def __init__(self):
+        super().__init__()
+        self._lookups: list[tuple[str, str]] = []
+        self._segment: list[str] = []
+        self._segment_calls = 0
+
+    @staticmethod
+    def _wrap(action: str, code: str, width: int = 80) -> str:
+        return f"# {action}\n{code}"
+
+    def _get_or_declare_object(self, event: typing.Any) -> tuple[str, str]:
+        var_name, prefix = super()._get_or_declare_object(event)
+        if prefix:
+            self._lookups.append(
+                (var_name, event.object_query.query.replace("'", "\\'"))
+            )
+        return var_name, ""
+
+    def _generate_event(self, event: typing.Any) -> str:
+        which = event.WhichOneof("event")
+        assert which, "event must have an inner oneof set"
+        handler = self._event_mapping.get(which)
+        if not handler:
+            code = f"# Skipping unsupported event: {which}\n"
+        else:
             try:
-                script_text += f"{handler(inner)}\n"
+                code = handler(getattr(event, which))
             except Exception as exc:
-                script_text += f"# Error generating code for event {which}: {exc}\n"
+                code = f"# Error generating code for event {which}: {exc}\n"
+
+        if which in self.BARRIER_GROUP:
+            return self._flush_segment(code)
+
+        self._segment.append(code)
+        self._segment_calls += code.count("\n") - 1
+        return ""
 
-        return script_text
+    def _flush_segment(self, trigger: str = "") -> str:
+        lookups, self._lookups = self._lookups, []
+        segment, self._segment = self._segment, []
+        calls, self._segment_calls = self._segment_calls, 0
+        if not lookups and not segment and not trigger:
+            return ""
+
+        code = ""
+        if len(lookups) == 1:
+            var_name, query = lookups[0]
+            code += f"{var_name} = m.waitForObject('{query}')\n"
+        elif lookups:
+            names = "".join(f"    {var_name},\n" for var_name, _ in lookups)
+            queries = "".join(f"    '{query}',\n" for _, query in lookups)
+            code += f"(\n{names}) = m.waitForObjects(\n{queries})\n"
+
+        if calls > 1:
+            code += "with m.batch():\n" + textwrap.indent("".join(segment), "    ")
+        else:
+            code += "".join(segment)
+        return f"{code}{trigger}\n"
+
+    def finish(self) -> list[str]:
+        chunks = self._flush_pending()
+        chunks.append(self._flush_segment())
+        return [chunk for chunk in chunks if chunk]
+
+    def preview_pending(self, events: typing.Iterable[typing.Any] = ()) -> list[str]:
+        state = list(self._lookups), list(self._segment), self._segment_calls
+        try:
+            return super().preview_pending(events)
+        finally:
+            self._lookups, self._segment, self._segment_calls = state
@@ -19,6 +19,8 @@ from specter.proto.specter_pb2 import (
 )
 
 from specter.client import Client
+from specter.scripts.batch import CallBatch
+from specter.scripts.checkpoint import StateCheckpoint, RestoreReport
 from specter.scripts.wrappers import ObjectWrapper
 
 
@@ -45,6 +47,46 @@ class ScriptModule:
             f"Object matching query '{object_query}' not found within {timeout} seconds."
         )
 
+    def waitForObjects(self, *object_queries, timeout=10):
+        found_ids: dict[str, str] = {}
+
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            pending = [query for query in object_queries if query not in found_ids]
+            futures = [
+                self._client.object_stub.Find.future(ObjectSearchQuery(query=query))
+                for query in pending
+            ]
+            for query, future in zip(pending, futures):
+                response = future.result()
+                if len(response.ids) == 1:
+                    found_ids[query] = response.ids[0].id
+
+            if len(found_ids) == len(set(object_queries)):
+                return ObjectWrapper.create_wrapper_objects(
+                    self._client, [found_ids[query] for query in object_queries]
+                )
+            time.sleep(0.5)
+
+        missing = [query for query in object_queries if query not in found_ids]
+        raise TimeoutError(
+            f"Objects matching queries {missing} not found within {timeout} seconds."
+        )
+
+    def batch(self) -> CallBatch:
+        return CallBatch()
+
+    def checkpoint(
+        self,
+        root: typing.Optional[ObjectWrapper] = None,
+        properties: typing.Optional[typing.Iterable[str]] = None,
+    ) -> StateCheckpoint:
+        root_id = None if root is None else root.id
+        return StateCheckpoint.take(self._client, root_id, properties)
+
+    def restore(self, checkpoint: StateCheckpoint) -> RestoreReport:
+        return checkpoint.restore(self._client)
+
     def pressMouseButton(self, pos: QPoint, button: Qt.MouseButton, double_click: bool):
         event = MouseEvent(
             offset=Offset(x=pos.x(), y=pos.y()),
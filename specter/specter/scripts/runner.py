@@ -0,0 +1,272 @@
+import io
+import os
+import json
+import time
+import typing
+import pathlib
+import traceback
+import contextlib
+import multiprocessing
+import multiprocessing.util
+import concurrent.futures
+import xml.etree.ElementTree as ElementTree
+
+import psutil
+
+from PySide6.QtNetwork import QHostAddress
+
+import specter
+from specter.client import Client, ClientException, attach_to_new_process
+from specter.scripts.module import ScriptModule
+from specter.scripts.checkpoint import StateCheckpoint
+
+CONNECTING_TIMEOUT = 5
+
+
+class RunnerTarget:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app: typing.Optional[str] = None,
+        library: typing.Optional[str] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.app = app
+        self.library = library
+
+    def connect(self) -> Client:
+        if self.app is None:
+            client = Client()
+            client.connect_to_host(QHostAddress(self.host), self.port)
+            if not client.wait_for_connected(CONNECTING_TIMEOUT):
+                raise ClientException(f"Connection failed to {self}")
+            return client
+
+        return attach_to_new_process(
+            QHostAddress(self.host), self.port, self.app, self.library
+        )
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+
+class ScriptResult:
+    PASSED = "passed"
+    FAILED = "failed"
+    ERROR = "error"
+
+    def __init__(
+        self,
+        path: str,
+        target: str,
+        status: str,
+        duration: float,
+        message: str = "",
+        details: str = "",
+        output: str = "",
+        reset_duration: float = 0.0,
+    ):
+        self.path = path
+        self.target = target
+        self.status = status
+        self.duration = duration
+        self.message = message
+        self.details = details
+        self.output = output
+        self.reset_duration = reset_duration
+
+    def to_dict(self) -> dict[str, typing.Any]:
+        return {
+            "path": self.path,
+            "target": self.target,
+            "status": self.status,
+            "duration": self.duration,
+            "message": self.message,
+            "details": self.details,
+            "output": self.output,
+            "reset_duration": self.reset_duration,
+        }
+
+
+_worker_target: typing.Optional[RunnerTarget] = None
+_worker_client: typing.Optional[Client] = None
+_worker_error: typing.Optional[str] = None
+_worker_reset = False
+_worker_checkpoint: typing.Optional[StateCheckpoint] = None
+
+
+def _init_worker(targets: multiprocessing.Queue, reset: bool) -> None:
+    global _worker_target, _worker_reset
+    _worker_target = targets.get()
+    _worker_reset = reset
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker() -> None:
+    if _worker_client is not None:
+        _worker_client.close()
+    for child in psutil.Process().children(recursive=True):
+        child.terminate()
+
+
+def _error_result(path: str, message: str, duration: float = 0.0) -> ScriptResult:
+    return ScriptResult(
+        path, str(_worker_target), ScriptResult.ERROR, duration, message=message
+    )
+
+
+def _run_script(path: str) -> ScriptResult:
+    global _worker_client, _worker_checkpoint, _worker_error
+
+    if _worker_error is not None:
+        return _error_result(path, _worker_error)
+
+    reset_duration = 0.0
+    if _worker_client is None:
+        start = time.perf_counter()
+        try:
+            _worker_client = _worker_target.connect()
+            if _worker_reset:
+                _worker_checkpoint = StateCheckpoint.take(_worker_client)
+        except Exception as e:
+            if _worker_client is None:
+                _worker_error = f"Target unavailable: {e}"
+            else:
+                _worker_error = f"State checkpoint failed: {e}"
+            return _error_result(path, _worker_error, time.perf_counter() - start)
+    elif _worker_checkpoint is not None:
+        start = time.perf_counter()
+        try:
+            _worker_checkpoint.restore(_worker_client)
+        except Exception as e:
+            return _error_result(
+                path, f"State restore failed: {e}", time.perf_counter() - start
+            )
+        reset_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    script_globals = {
+        "__name__": "__main__",
+        "__file__": path,
+        "specter": specter,
+        "m": ScriptModule(_worker_client),
+    }
+
+    output = io.StringIO()
+    status, message, details = ScriptResult.PASSED, "", ""
+    try:
+        with open(path, encoding="utf-8") as f:
+            code = compile(f.read(), path, "exec")
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            exec(code, script_globals)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status, message = ScriptResult.FAILED, f"Exited with {e.code}"
+    except AssertionError as e:
+        status, message = ScriptResult.FAILED, str(e) or "Assertion failed"
+        details = traceback.format_exc()
+    except Exception as e:
+        status, message = ScriptResult.ERROR, f"{type(e).__name__}: {e}"
+        details = traceback.format_exc()
+
+    return ScriptResult(
+        path,
+        str(_worker_target),
+        status,
+        time.perf_counter() - start,
+        message=message,
+        details=details,
+        output=output.getvalue(),
+        reset_duration=reset_duration,
+    )
+
+
+class SuiteRunner:
+    def __init__(self, targets: list[RunnerTarget], reset: bool = False):
+        assert targets, "at least one target is required"
+        self._targets = targets
+        self._reset = reset
+
+    def run(
+        self,
+        scripts: list[str],
+        on_result: typing.Optional[typing.Callable[[ScriptResult], None]] = None,
+    ) -> list[ScriptResult]:
+        context = multiprocessing.get_context("spawn")
+        targets = context.Queue()
+        for target in self._targets:
+            targets.put(target)
+
+        results: dict[str, ScriptResult] = {}
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(self._targets),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(targets, self._reset),
+        ) as pool:
+            futures = {pool.submit(_run_script, path): path for path in scripts}
+            for future in concurrent.futures.as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = ScriptResult(path, "", ScriptResult.ERROR, 0.0, str(e))
+                results[path] = result
+                if on_result:
+                    on_result(result)
+
+        return [results[path] for path in scripts]
+
+
+def find_scripts(path: str, pattern: str = "test_*.py") -> list[str]:
+    if os.path.isfile(path):
+        return [path]
+    return sorted(str(script) for script in pathlib.Path(path).rglob(pattern))
+
+
+def write_json(results: list[ScriptResult], path: str) -> None:
+    report = {
+        "tests": len(results),
+        "failures": sum(r.status == ScriptResult.FAILED for r in results),
+        "errors": sum(r.status == ScriptResult.ERROR for r in results),
+        "time": sum(r.duration for r in results),
+        "results": [r.to_dict() for r in results],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_junit(results: list[ScriptResult], path: str) -> None:
+    suite = ElementTree.Element(
+        "testsuite",
+        name="specter",
+        tests=str(len(results)),
+        failures=str(sum(r.status == ScriptResult.FAILED for r in results)),
+        errors=str(sum(r.status == ScriptResult.ERROR for r in results)),
+        time=f"{sum(r.duration for r in results):.3f}",
+    )
+
+    for result in results:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=os.path.dirname(result.path).replace(os.sep, "."),
+            name=os.path.basename(result.path),
+            time=f"{result.duration:.3f}",
+        )
+        properties = ElementTree.SubElement(case, "properties")
+        ElementTree.SubElement(
+            properties, "property", name="target", value=result.target
+        )
+        if result.status != ScriptResult.PASSED:
+            tag = "failure" if result.status == ScriptResult.FAILED else "error"
+            ElementTree.SubElement(case, tag, message=result.message).text = (
+                result.details
+            )
+        if result.output:
+            ElementTree.SubElement(case, "system-out").text = result.output
+
+    ElementTree.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
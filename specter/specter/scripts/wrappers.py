@@ -4,6 +4,7 @@ import typing
 from specter.proto.specter_pb2 import ObjectId, MethodCall, PropertyUpdate
 
 from specter.client import Client, convert_from_value, convert_to_value
+from specter.scripts.batch import CallBatch
 
 
 class ObjectWrapper:
@@ -51,7 +52,7 @@ class ObjectWrapper:
             method_name=method_name,
             arguments=pb_args,
         )
-        self._client.object_stub.CallMethod(method_call_pb)
+        self._invoke(self._client.object_stub.CallMethod, method_call_pb)
 
     def _get_remote_property(self, property_name: str):
         properties = self._get_properties()
@@ -89,9 +90,15 @@ class ObjectWrapper:
             value=pb_value,
         )
 
-        self._client.object_stub.UpdateProperty(property_update_pb)
+        self._invoke(self._client.object_stub.UpdateProperty, property_update_pb)
         self._properties_cache = None
 
+    def _invoke(self, rpc: typing.Any, request: typing.Any):
+        batch = CallBatch.current()
+        if batch is None:
+            return rpc(request)
+        batch.submit(self._object_id, rpc, request)
+
     def getChildren(self):
         response = self._client.object_stub.GetChildren(ObjectId(id=self._object_id))
         children = []
@@ -159,6 +166,38 @@ class ObjectWrapper:
         wrapper_class = cls.get_wrapper_class(object_query)
         return wrapper_class(client, object_id, object_query)
 
+    @classmethod
+    def create_wrapper_objects(cls, client, object_ids: list[str]):
+        stub = client.object_stub
+        query_futures = [
+            stub.GetObjectQuery.future(ObjectId(id=object_id))
+            for object_id in object_ids
+        ]
+        method_futures = [
+            stub.GetMethods.future(ObjectId(id=object_id)) for object_id in object_ids
+        ]
+        property_futures = [
+            stub.GetProperties.future(ObjectId(id=object_id))
+            for object_id in object_ids
+        ]
+
+        wrappers = []
+        for object_id, query_future, method_future, property_future in zip(
+            object_ids, query_futures, method_futures, property_futures
+        ):
+            object_query = query_future.result().query
+            wrapper = cls.get_wrapper_class(object_query)(
+                client, object_id, object_query
+            )
+            wrapper._methods_cache = {
+                m.method_name: m for m in method_future.result().methods
+            }
+            wrapper._properties_cache = {
+                p.property_name: p for p in property_future.result().properties
+            }
+            wrappers.append(wrapper)
+        return wrappers
+
 
 @ObjectWrapper.register_type("qobject")
 class QObjectWrapper(ObjectWrapper):
@@ -0,0 +1,89 @@
+import threading
+import concurrent.futures
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+
+from specter.proto.specter_pb2 import (
+    ObjectId,
+    ObjectIds,
+    ObjectNode,
+    ObjectSearchQuery,
+    ObjectTree,
+    Methods,
+    Properties,
+    Property,
+)
+from specter.proto.specter_pb2_grpc import (
+    ObjectServiceServicer,
+    add_ObjectServiceServicer_to_server,
+)
+from specter.client import convert_to_value
+
+
+class FakeObjectService(ObjectServiceServicer):
+    def __init__(self, objects: dict[str, dict[str, object]]):
+        self._lock = threading.Lock()
+        self._properties = {
+            object_id: {
+                name: convert_to_value(value) for name, value in properties.items()
+            }
+            for object_id, properties in objects.items()
+        }
+        self.rejected_values: list = []
+
+    def GetTree(self, request, context):
+        return ObjectTree(
+            roots=[
+                ObjectNode(object_id=ObjectId(id=object_id))
+                for object_id in self._properties
+            ]
+        )
+
+    def Find(self, request, context):
+        ids = [ObjectId(id=request.query)] if request.query in self._properties else []
+        return ObjectIds(ids=ids)
+
+    def GetObjectQuery(self, request, context):
+        return ObjectSearchQuery(query=request.id)
+
+    def GetMethods(self, request, context):
+        return Methods()
+
+    def GetProperties(self, request, context):
+        with self._lock:
+            properties = self._properties.get(request.id)
+            if properties is None:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Object not found")
+            return Properties(
+                properties=[
+                    Property(property_name=name, value=value)
+                    for name, value in properties.items()
+                ]
+            )
+
+    def UpdateProperty(self, request, context):
+        with self._lock:
+            properties = self._properties.get(request.object_id.id)
+            if properties is None or request.property_name not in properties:
+                context.abort(grpc.StatusCode.NOT_FOUND, "Property not found")
+            if request.value in self.rejected_values:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Value rejected")
+            properties[request.property_name] = request.value
+        return Empty()
+
+
+class FakeTarget:
+    def __init__(self, objects: dict[str, dict[str, object]]):
+        self.service = FakeObjectService(objects)
+        self._server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=4))
+        add_ObjectServiceServicer_to_server(self.service, self._server)
+        self.port = self._server.add_insecure_port("127.0.0.1:0")
+        self._server.start()
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    def stop(self) -> None:
+        self._server.stop(0)
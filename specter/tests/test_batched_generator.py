@@ -0,0 +1,133 @@
+from specter.proto.specter_pb2 import RecorderCommand
+import pytest
+
+from specter.scripts.generator import CodeGenerator, BatchedCodeGenerator
+from specter.scripts.compactor import RecordingCompactor
+
+
+def make_event(which: str, object_id: str, **fields) -> RecorderCommand:
+    event = RecorderCommand()
+    inner = getattr(event, which)
+    inner.object_query.query = f"q_{object_id}"
+    inner.object_id.id = object_id
+    for name, value in fields.items():
+        setattr(inner, name, value)
+    return event
+
+
+def test_state_changes_end_the_batch():
+    code = BatchedCodeGenerator().generate(
+        [
+            make_event("line_edit_text_changed", "name", value="a"),
+            make_event("button_clicked", "ok"),
+            make_event("line_edit_text_changed", "name", value="b"),
+            make_event("tab_current_changed", "tabs", index=1),
+            make_event("line_edit_text_changed", "name", value="c"),
+        ]
+    )
+
+    tab_change = code.index("obj_tabs.setCurrentIndex(1)")
+    assert code.index("obj_name.setText('b')") < tab_change
+    assert tab_change < code.index("obj_name.setText('c')")
+    assert "with m.batch()" not in code
+
+
+def test_form_fill_hoists_lookups_into_one_call():
+    code = BatchedCodeGenerator().generate(
+        [
+            make_event("line_edit_text_changed", "first", value="a"),
+            make_event("line_edit_text_changed", "last", value="b"),
+            make_event("line_edit_text_changed", "mail", value="c"),
+            make_event("line_edit_text_changed", "phone", value="d"),
+            make_event("button_clicked", "ok"),
+            make_event("line_edit_text_changed", "created", value="e"),
+        ]
+    )
+
+    assert code.count("m.waitForObjects(") == 1
+    lookup, rest = code.split(") = m.waitForObjects(\n", 1)
+    queries, rest = rest.split(")\n", 1)
+    assert queries.split() == [
+        "'q_first',",
+        "'q_last',",
+        "'q_mail',",
+        "'q_phone',",
+        "'q_ok',",
+    ]
+    batch, rest = rest.split("obj_ok.click()\n", 1)
+    assert batch.startswith("with m.batch():\n")
+    assert batch.count(".setText(") == 4
+    assert rest.index("obj_created = m.waitForObject('q_created')") < rest.index(
+        "obj_created.setText('e')"
+    )
+
+
+def test_known_objects_are_batched():
+    events = [
+        make_event("line_edit_text_changed", "first", value="a"),
+        make_event("line_edit_text_changed", "second", value="b"),
+        make_event("button_clicked", "ok"),
+        make_event("line_edit_text_changed", "first", value="c"),
+        make_event("line_edit_text_changed", "second", value="d"),
+        make_event("button_clicked", "ok"),
+    ]
+    code = BatchedCodeGenerator().generate(events)
+
+    after_batch = code.split("with m.batch():\n", 1)[1].splitlines()
+    batch = "\n".join(line for line in after_batch if line.startswith("    "))
+    assert "obj_first.setText('c')" in batch
+    assert "obj_second.setText('d')" in batch
+    assert "click()" not in batch
+
+
+def test_compactor_keeps_writes_separated_by_state_changes():
+    events = [
+        make_event("line_edit_text_changed", "name", value="a"),
+        make_event("combo_box_current_changed", "mode", index=1),
+        make_event("line_edit_text_changed", "name", value="b"),
+        make_event("button_toggled", "check", checked=True),
+        make_event("button_toggled", "check", checked=False),
+        make_event("combo_box_current_changed", "mode", index=2),
+        make_event("combo_box_current_changed", "mode", index=3),
+    ]
+    compactor = RecordingCompactor(idle_gap=0)
+    compacted = list(compactor.compact(events))
+
+    assert [event.WhichOneof("event") for event in compacted] == [
+        "line_edit_text_changed",
+        "combo_box_current_changed",
+        "line_edit_text_changed",
+        "combo_box_current_changed",
+    ]
+    assert compacted[-1].combo_box_current_changed.index == 3
+    assert compactor.report.inverse_pairs == 1
+    assert compactor.report.overwritten == 1
+
+
+@pytest.mark.parametrize("generator_type", [CodeGenerator, BatchedCodeGenerator])
+def test_incremental_preview_matches_export(generator_type):
+    events = [
+        make_event("line_edit_text_changed", "name", value="a"),
+        make_event("line_edit_text_changed", "name", value="ab"),
+        make_event("button_toggled", "check", checked=True),
+        make_event("button_toggled", "check", checked=False),
+        make_event("spin_box_value_changed", "count", value=1),
+        make_event("button_clicked", "ok"),
+        make_event("spin_box_value_changed", "count", value=2),
+        make_event("spin_box_value_changed", "count", value=3),
+        make_event("action_hovered", "menu"),
+        make_event("tab_current_changed", "tabs", index=1),
+    ]
+    for index, event in enumerate(events):
+        event.timestamp = index + (5.0 if index >= 6 else 1.0)
+    exported = generator_type().generate(RecordingCompactor().compact(events))
+    assert "# idle for" in exported
+
+    generator, compactor = generator_type(), RecordingCompactor()
+    committed = ""
+    for event in events:
+        for compacted in compactor.feed(event):
+            committed += "".join(generator.feed(compacted))
+        preview = committed + "".join(generator.preview_pending(compactor.pending()))
+        assert exported.startswith(committed)
+    assert preview == exported
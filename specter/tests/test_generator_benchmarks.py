@@ -0,0 +1,56 @@
+import io
+import time
+
+import pytest
+
+from specter.scripts.generator import CodeGenerator
+
+from test_batched_generator import make_event
+
+pytestmark = pytest.mark.benchmark
+
+
+def report(name: str, **values: float) -> None:
+    print(f"\n{name}: " + ", ".join(f"{k}={v:.2f}" for k, v in values.items()))
+
+
+def make_recording(count: int) -> list:
+    events = []
+    for index in range(count):
+        field = f"field_{index % 50}"
+        if index % 10 == 9:
+            events.append(make_event("button_clicked", f"button_{index % 7}"))
+        elif index % 3 == 0:
+            events.append(make_event("spin_box_value_changed", field, value=index))
+        else:
+            events.append(
+                make_event("line_edit_text_changed", field, value=f"text {index}")
+            )
+    return events
+
+
+def time_generate(events: list) -> float:
+    start = time.perf_counter()
+    CodeGenerator().write(events, io.StringIO())
+    return (time.perf_counter() - start) * 1000
+
+
+def time_feed(events: list) -> float:
+    generator = CodeGenerator()
+    start = time.perf_counter()
+    for event in events:
+        generator.feed(event)
+    generator.finish()
+    return (time.perf_counter() - start) * 1000
+
+
+def test_generation_scales_linearly():
+    small, large = make_recording(10_000), make_recording(100_000)
+
+    small_ms, large_ms = time_generate(small), time_generate(large)
+    small_feed_ms, large_feed_ms = time_feed(small), time_feed(large)
+
+    report("generate", events_10k_ms=small_ms, events_100k_ms=large_ms)
+    report("feed", events_10k_ms=small_feed_ms, events_100k_ms=large_feed_ms)
+    assert large_ms < small_ms * 20
+    assert large_feed_ms < small_feed_ms * 20
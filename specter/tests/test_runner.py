@@ -0,0 +1,166 @@
+import os
+import json
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from specter.client import convert_to_value
+from specter.scripts.runner import (
+    RunnerTarget,
+    ScriptResult,
+    SuiteRunner,
+    find_scripts,
+    write_json,
+    write_junit,
+)
+
+from fake_target import FakeTarget
+
+SCRIPTS = {
+    "test_set_text.py": (
+        "edit = m.waitForObject('edit')\n"
+        "edit.text = 'hello'\n"
+        "assert edit.text == 'hello'\n"
+        "print('text set')\n"
+    ),
+    "test_read_text.py": "assert m.waitForObject('edit').text is not None\n",
+    "test_read_count.py": "assert m.waitForObject('counter').value == 3\n",
+    "test_wrong_text.py": (
+        "assert m.waitForObject('edit').text == 'nope', 'text mismatch'\n"
+    ),
+    "test_raises.py": "raise RuntimeError('boom')\n",
+}
+
+
+@pytest.fixture
+def targets():
+    targets = [
+        FakeTarget({"edit": {"text": ""}, "counter": {"value": 3}}) for _ in range(2)
+    ]
+    yield targets
+    for target in targets:
+        target.stop()
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    for name, source in SCRIPTS.items():
+        (tmp_path / "suite" / name).parent.mkdir(exist_ok=True)
+        (tmp_path / "suite" / name).write_text(source)
+    return find_scripts(str(tmp_path / "suite"))
+
+
+def test_suite_runs_across_targets(targets, scripts, tmp_path):
+    runner = SuiteRunner([RunnerTarget("127.0.0.1", t.port) for t in targets])
+    results = runner.run(scripts)
+
+    statuses = {result.path.rsplit("/", 1)[-1]: result.status for result in results}
+    assert statuses == {
+        "test_raises.py": ScriptResult.ERROR,
+        "test_read_count.py": ScriptResult.PASSED,
+        "test_read_text.py": ScriptResult.PASSED,
+        "test_set_text.py": ScriptResult.PASSED,
+        "test_wrong_text.py": ScriptResult.FAILED,
+    }
+    assert {result.target for result in results} <= {t.address for t in targets}
+    assert [result.path for result in results] == scripts
+
+    junit_path, json_path = tmp_path / "report.xml", tmp_path / "report.json"
+    write_junit(results, str(junit_path))
+    write_json(results, str(json_path))
+
+    suite = ElementTree.parse(junit_path).getroot()
+    assert suite.get("tests") == "5"
+    assert suite.get("failures") == "1"
+    assert suite.get("errors") == "1"
+    cases = {case.get("name"): case for case in suite.iter("testcase")}
+    assert cases["test_wrong_text.py"].find("failure").get("message") == (
+        "text mismatch"
+    )
+    assert "RuntimeError: boom" in cases["test_raises.py"].find("error").get("message")
+    assert cases["test_set_text.py"].find("system-out").text == "text set\n"
+
+    report = json.loads(json_path.read_text())
+    assert report["tests"] == 5
+    assert report["failures"] == 1
+    assert report["errors"] == 1
+    assert sorted(r["status"] for r in report["results"]) == [
+        "error",
+        "failed",
+        "passed",
+        "passed",
+        "passed",
+    ]
+
+
+def test_unreachable_target_is_not_retried(scripts):
+    runner = SuiteRunner([RunnerTarget("127.0.0.1", 1)])
+    results = runner.run(scripts)
+
+    assert all(result.status == ScriptResult.ERROR for result in results)
+    assert all(result.message.startswith("Target unavailable") for result in results)
+    assert sum(result.duration for result in results) < 10
+
+
+RESET_SCRIPTS = {
+    "test_1_edit.py": "m.waitForObject('edit').text = 'first'\n",
+    "test_2_edit.py": (
+        "edit = m.waitForObject('edit')\n"
+        "assert edit.text == '', 'state leaked'\n"
+        "edit.text = 'second'\n"
+    ),
+}
+
+
+def write_scripts(directory, sources: dict[str, str]) -> list[str]:
+    directory.mkdir()
+    for name, source in sources.items():
+        (directory / name).write_text(source)
+    return find_scripts(str(directory))
+
+
+def test_reset_reports_restore_time_only(tmp_path):
+    target = FakeTarget({"edit": {"text": ""}})
+    try:
+        runner = SuiteRunner([RunnerTarget("127.0.0.1", target.port)], reset=True)
+        results = runner.run(write_scripts(tmp_path / "suite", RESET_SCRIPTS))
+    finally:
+        target.stop()
+
+    assert [result.status for result in results] == [ScriptResult.PASSED] * 2
+    assert results[0].reset_duration == 0.0
+    assert results[1].reset_duration > 0.0
+
+
+def test_failed_restore_is_not_reported_as_unavailable(tmp_path):
+    target = FakeTarget({"edit": {"text": ""}})
+    target.service.rejected_values.append(convert_to_value(""))
+    try:
+        runner = SuiteRunner([RunnerTarget("127.0.0.1", target.port)], reset=True)
+        results = runner.run(write_scripts(tmp_path / "suite", RESET_SCRIPTS))
+    finally:
+        target.stop()
+
+    assert results[0].status == ScriptResult.PASSED
+    assert results[1].status == ScriptResult.ERROR
+    assert results[1].message.startswith("State restore failed")
+
+
+def test_find_scripts_skips_helper_modules(tmp_path):
+    for name in (
+        "__init__.py",
+        "conftest.py",
+        "helpers.py",
+        "test_login.py",
+        "forms/test_fill.py",
+        "forms/__init__.py",
+    ):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("")
+
+    scripts = find_scripts(str(tmp_path))
+
+    assert [os.path.relpath(script, tmp_path) for script in scripts] == [
+        os.path.join("forms", "test_fill.py"),
+        "test_login.py",
+    ]
@@ -1,10 +1,27 @@
 import os
 
+from specter_debugger.proto import specter_pb2 as pb2
 from specter_debugger.client import DebuggerClient
 from specter_debugger.server import DebuggerServer
 
 
 class DebuggerClientCLI:
+    TRACE_MODES = {
+        "full": pb2.TRACE_MODE_FULL,
+        "breakpoints": pb2.TRACE_MODE_BREAKPOINTS,
+    }
+    LINE_EVENT_MODES = {
+        "all": pb2.LINE_EVENT_MODE_ALL,
+        "sampled": pb2.LINE_EVENT_MODE_SAMPLED,
+        "on_pause": pb2.LINE_EVENT_MODE_ON_PAUSE,
+        "off": pb2.LINE_EVENT_MODE_OFF,
+    }
+    STEP_MODES = {
+        "into": pb2.STEP_MODE_INTO,
+        "over": pb2.STEP_MODE_OVER,
+        "out": pb2.STEP_MODE_OUT,
+    }
+
     def __init__(self, address: str = "localhost:50051"):
         self.client = DebuggerClient(address)
         self.session_id = None
@@ -38,10 +55,29 @@ class DebuggerClientCLI:
                     print("Usage: set_source <filename>")
                     continue
                 self.set_source(args[1])
+            elif command == "set_trace_mode":
+                if len(args) != 2 or args[1] not in self.TRACE_MODES:
+                    print("Usage: set_trace_mode <full|breakpoints>")
+                    continue
+                self.set_trace_mode(args[1])
+            elif command == "set_line_events":
+                if len(args) not in (2, 3) or args[1] not in self.LINE_EVENT_MODES:
+                    print("Usage: set_line_events <all|sampled|on_pause|off> [hz]")
+                    continue
+                self.set_line_events(*args[1:])
             elif command == "start":
                 self.start()
             elif command == "stop":
                 self.stop()
+            elif command == "pause":
+                self.pause()
+            elif command == "resume":
+                self.resume()
+            elif command == "step":
+                if len(args) != 2 or args[1] not in self.STEP_MODES:
+                    print("Usage: step <into|over|out>")
+                    continue
+                self.step(args[1])
             elif command == "add_breakpoint":
                 if len(args) != 2:
                     print("Usage: add_breakpoint <filename:lineno>")
@@ -69,8 +105,13 @@ class DebuggerClientCLI:
             "create_session            - Create debugging session \n",
             "get_sessions              - List active sessions \n",
             "set_source <filename>     - Set source for current session \n",
+            "set_trace_mode <mode>     - Trace every line (full) or breakpoints only \n",
+            "set_line_events <mode>    - Report all, sampled [hz], on_pause or off \n",
             "start                     - Start debugging current session \n",
             "stop                      - Stop debugging current session \n",
+            "pause                     - Pause current session \n",
+            "resume                    - Resume paused session \n",
+            "step <into|over|out>      - Step paused session \n",
             "add_breakpoint f:ln       - Add a breakpoint, example: foo.py:10 \n",
             "remove_breakpoint f:ln    - Remove a breakpoint, example: foo.py:10 \n",
             "get_breakpoints           - Get breakpoints of current session \n",
@@ -111,6 +152,30 @@ class DebuggerClientCLI:
         except Exception as e:
             print(f"Error listing sessions: {e}")
 
+    def set_trace_mode(self, mode):
+        if not self.session_id:
+            print("No session selected")
+            return
+        try:
+            self.client.configure(self.session_id, self.TRACE_MODES[mode])
+            print(f"Trace mode set to {mode}")
+        except Exception as e:
+            print(f"Error setting trace mode: {e}")
+
+    def set_line_events(self, mode, rate=None):
+        if not self.session_id:
+            print("No session selected")
+            return
+        try:
+            self.client.configure(
+                self.session_id,
+                line_event_mode=self.LINE_EVENT_MODES[mode],
+                line_event_rate=None if rate is None else float(rate),
+            )
+            print(f"Line events set to {mode}")
+        except Exception as e:
+            print(f"Error setting line events: {e}")
+
     def start(self):
         if not self.session_id:
             print("No session selected")
@@ -131,6 +196,36 @@ class DebuggerClientCLI:
         except Exception as e:
             print(f"Error stopping session: {e}")
 
+    def pause(self):
+        if not self.session_id:
+            print("No session selected")
+            return
+        try:
+            self.client.pause(self.session_id)
+            print("Paused debugging session")
+        except Exception as e:
+            print(f"Error pausing session: {e}")
+
+    def resume(self):
+        if not self.session_id:
+            print("No session selected")
+            return
+        try:
+            self.client.resume(self.session_id)
+            print("Resumed debugging session")
+        except Exception as e:
+            print(f"Error resuming session: {e}")
+
+    def step(self, mode):
+        if not self.session_id:
+            print("No session selected")
+            return
+        try:
+            self.client.step(self.session_id, self.STEP_MODES[mode])
+            print(f"Stepped {mode}")
+        except Exception as e:
+            print(f"Error stepping session: {e}")
+
     def add_breakpoint(self, bp_str):
         if not self.session_id:
             print("No session selected")
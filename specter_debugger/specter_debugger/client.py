@@ -24,6 +24,22 @@ class DebuggerClient:
         )
         return self.stub.SetSource(request)
 
+    def configure(
+        self,
+        session_id,
+        trace_mode=None,
+        line_event_mode=None,
+        line_event_rate=None,
+    ):
+        request = pb2.SessionConfig(session=pb2.Session(id=session_id))
+        if trace_mode is not None:
+            request.trace_mode = trace_mode
+        if line_event_mode is not None:
+            request.line_event_mode = line_event_mode
+        if line_event_rate is not None:
+            request.line_event_rate = line_event_rate
+        return self.stub.Configure(request)
+
     def start(self, session_id):
         return self.stub.Start(pb2.Session(id=session_id))
 
@@ -36,6 +52,12 @@ class DebuggerClient:
     def stop(self, session_id):
         return self.stub.Stop(pb2.Session(id=session_id))
 
+    def step(self, session_id, step_mode):
+        request = pb2.SessionStep(
+            session=pb2.Session(id=session_id), step_mode=step_mode
+        )
+        return self.stub.Step(request)
+
     def add_breakpoint(self, session_id, filename, lineno):
         request = pb2.BreakpointAdd(
             session=pb2.Session(id=session_id),
@@ -54,13 +76,20 @@ class DebuggerClient:
         return self.stub.GetBreakpoints(pb2.Session(id=session_id))
 
     def listen_events(self, session_id, callback):
+        def _on_events(events):
+            for event in events:
+                callback(event)
+
+        self.listen_event_batches(session_id, _on_events)
+
+    def listen_event_batches(self, session_id, callback):
         def _listen():
             try:
                 request = pb2.Session(id=session_id)
-                for event in self.stub.ListenEvents(request):
+                for batch in self.stub.ListenEventBatches(request):
                     if self._stop_event.is_set():
                         break
-                    callback(event)
+                    callback(batch.events)
             except grpc.RpcError:
                 pass
 
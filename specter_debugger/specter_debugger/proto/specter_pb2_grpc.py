@@ -52,6 +52,11 @@ class DebuggerServiceStub(object):
                 request_serializer=specter__debugger_dot_proto_dot_specter__pb2.SourceSet.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.Configure = channel.unary_unary(
+                '/specter_debugger_proto.DebuggerService/Configure',
+                request_serializer=specter__debugger_dot_proto_dot_specter__pb2.SessionConfig.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
         self.Start = channel.unary_unary(
                 '/specter_debugger_proto.DebuggerService/Start',
                 request_serializer=specter__debugger_dot_proto_dot_specter__pb2.Session.SerializeToString,
@@ -72,6 +77,11 @@ class DebuggerServiceStub(object):
                 request_serializer=specter__debugger_dot_proto_dot_specter__pb2.Session.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.Step = channel.unary_unary(
+                '/specter_debugger_proto.DebuggerService/Step',
+                request_serializer=specter__debugger_dot_proto_dot_specter__pb2.SessionStep.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
         self.AddBreakpoint = channel.unary_unary(
                 '/specter_debugger_proto.DebuggerService/AddBreakpoint',
                 request_serializer=specter__debugger_dot_proto_dot_specter__pb2.BreakpointAdd.SerializeToString,
@@ -92,6 +102,11 @@ class DebuggerServiceStub(object):
                 request_serializer=specter__debugger_dot_proto_dot_specter__pb2.Session.SerializeToString,
                 response_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Event.FromString,
                 _registered_method=True)
+        self.ListenEventBatches = channel.unary_stream(
+                '/specter_debugger_proto.DebuggerService/ListenEventBatches',
+                request_serializer=specter__debugger_dot_proto_dot_specter__pb2.Session.SerializeToString,
+                response_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Events.FromString,
+                _registered_method=True)
 
 
 class DebuggerServiceServicer(object):
@@ -117,6 +132,12 @@ class DebuggerServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Configure(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Start(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -141,6 +162,12 @@ class DebuggerServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Step(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddBreakpoint(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -165,6 +192,12 @@ class DebuggerServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListenEventBatches(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DebuggerServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -183,6 +216,11 @@ def add_DebuggerServiceServicer_to_server(servicer, server):
                     request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.SourceSet.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'Configure': grpc.unary_unary_rpc_method_handler(
+                    servicer.Configure,
+                    request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.SessionConfig.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
             'Start': grpc.unary_unary_rpc_method_handler(
                     servicer.Start,
                     request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Session.FromString,
@@ -203,6 +241,11 @@ def add_DebuggerServiceServicer_to_server(servicer, server):
                     request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Session.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'Step': grpc.unary_unary_rpc_method_handler(
+                    servicer.Step,
+                    request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.SessionStep.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
             'AddBreakpoint': grpc.unary_unary_rpc_method_handler(
                     servicer.AddBreakpoint,
                     request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.BreakpointAdd.FromString,
@@ -223,6 +266,11 @@ def add_DebuggerServiceServicer_to_server(servicer, server):
                     request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Session.FromString,
                     response_serializer=specter__debugger_dot_proto_dot_specter__pb2.Event.SerializeToString,
             ),
+            'ListenEventBatches': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListenEventBatches,
+                    request_deserializer=specter__debugger_dot_proto_dot_specter__pb2.Session.FromString,
+                    response_serializer=specter__debugger_dot_proto_dot_specter__pb2.Events.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'specter_debugger_proto.DebuggerService', rpc_method_handlers)
@@ -317,6 +365,33 @@ class DebuggerService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def Configure(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/specter_debugger_proto.DebuggerService/Configure',
+            specter__debugger_dot_proto_dot_specter__pb2.SessionConfig.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Start(request,
             target,
@@ -425,6 +500,33 @@ class DebuggerService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def Step(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/specter_debugger_proto.DebuggerService/Step',
+            specter__debugger_dot_proto_dot_specter__pb2.SessionStep.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def AddBreakpoint(request,
             target,
@@ -532,3 +634,30 @@ class DebuggerService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ListenEventBatches(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/specter_debugger_proto.DebuggerService/ListenEventBatches',
+            specter__debugger_dot_proto_dot_specter__pb2.Session.SerializeToString,
+            specter__debugger_dot_proto_dot_specter__pb2.Events.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,6 +1,7 @@
 import concurrent
 import threading
 import linecache
+import types
 import typing
 import queue
 import uuid
@@ -14,6 +15,8 @@ from specter_debugger.proto import specter_pb2 as pb2
 from specter_debugger.proto import specter_pb2_grpc as pb2_grpc
 from google.protobuf.empty_pb2 import Empty
 
+EVENT_BATCH_SIZE = 512
+
 
 class OutputCapture:
     def __init__(self, queue, event_type):
@@ -42,12 +45,175 @@ class OutputCapture:
         return False
 
 
+def _iter_code_objects(code: types.CodeType) -> typing.Iterator[types.CodeType]:
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code_objects(const)
+
+
+def _frame_depth(frame: typing.Optional[types.FrameType]) -> int:
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class StepController:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._step_mode: typing.Optional[int] = None
+        self._depth = 0
+
+    @property
+    def active(self) -> bool:
+        return self._step_mode is not None
+
+    def request(self, step_mode: int, frame: typing.Optional[types.FrameType]):
+        with self._lock:
+            self._step_mode = step_mode if frame is not None else pb2.STEP_MODE_INTO
+            self._depth = _frame_depth(frame)
+
+    def cancel(self):
+        with self._lock:
+            self._step_mode = None
+
+    def should_pause(self, frame: types.FrameType) -> bool:
+        if self._step_mode is None:
+            return False
+
+        with self._lock:
+            if self._step_mode is None:
+                return False
+
+            if self._step_mode == pb2.STEP_MODE_OVER:
+                pause = _frame_depth(frame) <= self._depth
+            elif self._step_mode == pb2.STEP_MODE_OUT:
+                pause = _frame_depth(frame) < self._depth
+            else:
+                pause = True
+
+            if pause:
+                self._step_mode = None
+            return pause
+
+
+class LineEventFilter:
+    DEFAULT_RATE = 30.0
+
+    def __init__(self):
+        self._line_event_mode = pb2.LINE_EVENT_MODE_ALL
+        self._interval = 1 / LineEventFilter.DEFAULT_RATE
+        self._next_emit = 0.0
+
+    def configure(self, line_event_mode: int, rate: typing.Optional[float] = None):
+        self._line_event_mode = line_event_mode
+        if rate is not None:
+            self._interval = 1 / (rate if rate > 0 else LineEventFilter.DEFAULT_RATE)
+        self._next_emit = 0.0
+
+    def should_emit(self, paused: bool) -> bool:
+        line_event_mode = self._line_event_mode
+        if line_event_mode == pb2.LINE_EVENT_MODE_ALL:
+            return True
+        if line_event_mode == pb2.LINE_EVENT_MODE_OFF:
+            return False
+        if paused:
+            return True
+
+        if line_event_mode == pb2.LINE_EVENT_MODE_SAMPLED:
+            now = time.monotonic()
+            if now >= self._next_emit:
+                self._next_emit = now + self._interval
+                return True
+        return False
+
+
+class BreakpointMonitor:
+    TOOL_ID = sys.monitoring.DEBUGGER_ID
+    TOOL_NAME = "specter_debugger"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: dict[int, "DebuggerSession"] = {}
+
+    def run(self, session: "DebuggerSession", code: types.CodeType, globals, locals):
+        code_objects = list(_iter_code_objects(code))
+
+        self._attach(session, code_objects)
+        try:
+            exec(code, globals, locals)
+        except bdb.BdbQuit:
+            pass
+        finally:
+            self._detach(code_objects)
+
+    def refresh(self):
+        sys.monitoring.restart_events()
+
+    def _attach(self, session: "DebuggerSession", code_objects: list[types.CodeType]):
+        monitoring = sys.monitoring
+        with self._lock:
+            if not self._sessions:
+                monitoring.use_tool_id(self.TOOL_ID, self.TOOL_NAME)
+                monitoring.register_callback(
+                    self.TOOL_ID, monitoring.events.LINE, self._on_line
+                )
+
+            for code_object in code_objects:
+                self._sessions[id(code_object)] = session
+                monitoring.set_local_events(
+                    self.TOOL_ID, code_object, monitoring.events.LINE
+                )
+
+    def _detach(self, code_objects: list[types.CodeType]):
+        monitoring = sys.monitoring
+        with self._lock:
+            for code_object in code_objects:
+                monitoring.set_local_events(
+                    self.TOOL_ID, code_object, monitoring.events.NO_EVENTS
+                )
+                self._sessions.pop(id(code_object), None)
+
+            if not self._sessions:
+                monitoring.register_callback(self.TOOL_ID, monitoring.events.LINE, None)
+                monitoring.free_tool_id(self.TOOL_ID)
+
+    def _on_line(self, code: types.CodeType, line_number: int):
+        session = self._sessions.get(id(code))
+        if session is None:
+            return sys.monitoring.DISABLE
+        if session._quitting:
+            raise bdb.BdbQuit
+
+        frame = sys._getframe(1)
+        if line_number in session._breakpoint_lines or session._stepper.should_pause(
+            frame
+        ):
+            session.pause()
+        elif not session.is_paused() and not session._stepper.active:
+            return sys.monitoring.DISABLE
+
+        session._trace_line(code.co_filename, line_number, frame)
+
+
+_breakpoint_monitor = BreakpointMonitor()
+
+
 class DebuggerSession:
     def __init__(self, session_id):
         self._id = session_id
         self._filename = None
         self._code = None
         self._breakpoints = []
+        self._breakpoint_lines: set[int] = set()
+        self._trace_mode = pb2.TRACE_MODE_FULL
+        self._monitor: typing.Optional[BreakpointMonitor] = None
+        self._quitting = False
+        self._stepper = StepController()
+        self._line_events = LineEventFilter()
+        self._frame: typing.Optional[types.FrameType] = None
         self._output_queue = queue.Queue()
         self._event_queue = queue.Queue()
         self._debugger = self._create_debugger()
@@ -61,27 +227,17 @@ class DebuggerSession:
 
         class ServerBdb(bdb.Bdb):
             def user_line(self_inner, frame):
-                filename = frame.f_code.co_filename
                 lineno = frame.f_lineno
 
-                if os.path.abspath(filename) == os.path.abspath(session._filename):
-                    for bp_filename, bp_lineno in session._breakpoints:
-                        if (
-                            os.path.abspath(bp_filename) == os.path.abspath(filename)
-                            and bp_lineno == lineno
-                        ):
-                            session.pause()
-                            break
-
-                    ev = pb2.Event(
-                        line_changed_event=pb2.LineChangedEvent(
-                            filename=filename, lineno=lineno
-                        )
-                    )
-                    session._event_queue.put(ev)
-
-                while session.is_paused():
-                    time.sleep(0.1)
+                if frame.f_code.co_filename == session._filename:
+                    if (
+                        lineno in session._breakpoint_lines
+                        or session._stepper.should_pause(frame)
+                    ):
+                        session.pause()
+                    session._trace_line(session._filename, lineno, frame)
+                else:
+                    session._pause_event.wait()
 
             def user_exception(self_inner, frame, exc_info):
                 filename = frame.f_code.co_filename
@@ -101,6 +257,21 @@ class DebuggerSession:
 
         return ServerBdb()
 
+    def _trace_line(self, filename: str, lineno: int, frame: types.FrameType):
+        paused = self.is_paused()
+        if self._line_events.should_emit(paused):
+            ev = pb2.Event(
+                line_changed_event=pb2.LineChangedEvent(
+                    filename=filename, lineno=lineno
+                )
+            )
+            self._event_queue.put(ev)
+
+        if paused:
+            self._frame = frame
+            self._pause_event.wait()
+            self._frame = None
+
     def _run_debugger(self):
         if self._running:
             return
@@ -127,7 +298,12 @@ class DebuggerSession:
 
             try:
                 compiled_code = compile(self._code, self._filename, "exec")
-                self._debugger.runctx(compiled_code, globals(), locals())
+                if self._trace_mode == pb2.TRACE_MODE_BREAKPOINTS:
+                    self._quitting = False
+                    self._monitor = _breakpoint_monitor
+                    self._monitor.run(self, compiled_code, globals(), locals())
+                else:
+                    self._debugger.runctx(compiled_code, globals(), locals())
             finally:
                 sys.stdout.flush()
                 sys.stderr.flush()
@@ -141,6 +317,9 @@ class DebuggerSession:
             )
             status = f"error: exception was raised"
         finally:
+            self._monitor = None
+            self._frame = None
+            self._stepper.cancel()
             self._event_queue.put(
                 pb2.Event(finished_event=pb2.FinishedEvent(status=status))
             )
@@ -162,6 +341,7 @@ class DebuggerSession:
 
         self._filename = filename
         self._code = code
+        self._update_breakpoint_lines()
 
         linecache.cache[self._filename] = (
             len(code),
@@ -175,16 +355,39 @@ class DebuggerSession:
         self._event_queue.put(pb2.Event(started_event=pb2.StartedEvent()))
         self._thread.start()
 
+    def set_trace_mode(self, trace_mode: int):
+        self._trace_mode = trace_mode
+
+    def set_line_event_mode(
+        self, line_event_mode: int, rate: typing.Optional[float] = None
+    ):
+        self._line_events.configure(line_event_mode, rate)
+
     def pause(self):
         self._event_queue.put(pb2.Event(paused_event=pb2.PausedEvent()))
         self._pause_event.clear()
+        if self._monitor:
+            self._monitor.refresh()
 
     def resume(self):
+        self._stepper.cancel()
+        self._event_queue.put(pb2.Event(resumed_event=pb2.ResumedEvent()))
+        self._pause_event.set()
+
+    def step(self, step_mode: int):
+        self._stepper.request(step_mode, self._frame)
+        if self._monitor:
+            self._monitor.refresh()
         self._event_queue.put(pb2.Event(resumed_event=pb2.ResumedEvent()))
         self._pause_event.set()
 
     def stop(self):
-        self._debugger.set_quit()
+        self._stepper.cancel()
+        if self._monitor:
+            self._quitting = True
+            self._monitor.refresh()
+        else:
+            self._debugger.set_quit()
         self._pause_event.set()
         self._running = False
 
@@ -199,6 +402,9 @@ class DebuggerSession:
             return False
 
         self._breakpoints.append((filename, lineno))
+        self._update_breakpoint_lines()
+        if self._monitor:
+            self._monitor.refresh()
         return True
 
     def remove_breakpoint(self, filename: str, lineno: int) -> bool:
@@ -210,9 +416,22 @@ class DebuggerSession:
             for bp_filename, bp_lineno in self._breakpoints
             if not (bp_filename == filename and bp_lineno == lineno)
         ]
+        self._update_breakpoint_lines()
 
         return True
 
+    def _update_breakpoint_lines(self):
+        if self._filename is None:
+            self._breakpoint_lines = set()
+            return
+
+        filename = os.path.abspath(self._filename)
+        self._breakpoint_lines = {
+            bp_lineno
+            for bp_filename, bp_lineno in self._breakpoints
+            if os.path.abspath(bp_filename) == filename
+        }
+
     def get_breakpoints(self):
         return self._breakpoints
 
@@ -223,6 +442,19 @@ class DebuggerSession:
         except queue.Empty:
             return None
 
+    def get_events(self, timeout: int = 1, max_events: int = EVENT_BATCH_SIZE):
+        event = self.get_event(timeout=timeout)
+        if event is None:
+            return []
+
+        events = [event]
+        while len(events) < max_events:
+            try:
+                events.append(self._event_queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
 
 class DebuggerService(pb2_grpc.DebuggerServiceServicer):
     def __init__(self):
@@ -249,6 +481,20 @@ class DebuggerService(pb2_grpc.DebuggerServiceServicer):
         session.set_source(request.filename, request.data)
         return Empty()
 
+    def Configure(self, request, context):
+        session = self._get_session(request.session.id)
+        if not session:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Session not found")
+
+        if request.HasField("trace_mode"):
+            session.set_trace_mode(request.trace_mode)
+        if request.HasField("line_event_mode"):
+            rate = (
+                request.line_event_rate if request.HasField("line_event_rate") else None
+            )
+            session.set_line_event_mode(request.line_event_mode, rate)
+        return Empty()
+
     def Start(self, request, context):
         session = self._get_session(request.id)
         if not session:
@@ -296,6 +542,18 @@ class DebuggerService(pb2_grpc.DebuggerServiceServicer):
         session.stop()
         return Empty()
 
+    def Step(self, request, context):
+        session = self._get_session(request.session.id)
+        if not session:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Session not found")
+        if not session.is_running():
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Session not running")
+        if not session.is_paused():
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Session not paused")
+
+        session.step(request.step_mode)
+        return Empty()
+
     def AddBreakpoint(self, request, context):
         session = self._get_session(request.session.id)
         if not session:
@@ -340,6 +598,16 @@ class DebuggerService(pb2_grpc.DebuggerServiceServicer):
             else:
                 break
 
+    def ListenEventBatches(self, request, context):
+        session = self._get_session(request.id)
+        if not session:
+            context.abort(grpc.StatusCode.NOT_FOUND, "Session not found")
+
+        while context.is_active():
+            events = session.get_events(timeout=1)
+            if events:
+                yield pb2.Events(events=events)
+
     def _get_session(self, session_id):
         with self.sessions_lock:
             return self.sessions.get(session_id, None)
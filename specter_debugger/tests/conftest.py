@@ -0,0 +1,36 @@
+import sys
+import typing
+
+import pytest
+
+from specter_debugger.server import DebuggerSession
+from specter_debugger.proto import specter_pb2 as pb2
+
+SOURCE_FILE_NAME = "<script>"
+
+
+@pytest.fixture
+def make_session(monkeypatch):
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    sessions: list[DebuggerSession] = []
+
+    def _make_session(
+        source: str,
+        trace_mode: int = pb2.TRACE_MODE_FULL,
+        breakpoints: typing.Iterable[int] = (),
+    ) -> DebuggerSession:
+        session = DebuggerSession(f"session-{len(sessions)}")
+        session.set_source(SOURCE_FILE_NAME, source.encode("utf-8"))
+        session.set_trace_mode(trace_mode)
+        for lineno in breakpoints:
+            assert session.add_breakpoint(SOURCE_FILE_NAME, lineno)
+        sessions.append(session)
+        return session
+
+    yield _make_session
+
+    for session in sessions:
+        if session.is_running():
+            session.stop()
+            session._thread.join(timeout=5)
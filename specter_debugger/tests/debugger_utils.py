@@ -0,0 +1,19 @@
+from specter_debugger.server import DebuggerSession
+from specter_debugger.proto import specter_pb2 as pb2
+
+
+def wait_for_event(
+    session: DebuggerSession, event_type: str, timeout: float = 5
+) -> pb2.Event:
+    while True:
+        event = session.get_event(timeout=timeout)
+        assert event is not None, f"no {event_type} within {timeout}s"
+        if event.WhichOneof("event") == event_type:
+            return event
+
+
+def wait_for_pause(session: DebuggerSession, timeout: float = 5) -> int:
+    wait_for_event(session, "paused_event", timeout)
+    return wait_for_event(
+        session, "line_changed_event", timeout
+    ).line_changed_event.lineno
@@ -0,0 +1,52 @@
+import sys
+
+from specter_debugger.proto import specter_pb2 as pb2
+from specter_debugger.server import BreakpointMonitor
+
+from debugger_utils import wait_for_event, wait_for_pause
+
+SOURCE = """\
+total = 0
+for i in range(3):
+    total += i
+print(total)
+"""
+
+
+def test_concurrent_sessions_in_breakpoint_mode(make_session):
+    first = make_session(SOURCE, pb2.TRACE_MODE_BREAKPOINTS, breakpoints=[3])
+    second = make_session(SOURCE, pb2.TRACE_MODE_BREAKPOINTS, breakpoints=[4])
+
+    first.start()
+    assert wait_for_pause(first) == 3
+
+    second.start()
+    assert wait_for_pause(second) == 4
+
+    for _ in range(2):
+        first.resume()
+        assert wait_for_pause(first) == 3
+    first.resume()
+    second.resume()
+
+    for session in (first, second):
+        status = wait_for_event(session, "finished_event").finished_event.status
+        assert status == "success"
+        session._thread.join(timeout=5)
+
+    assert sys.monitoring.get_tool(BreakpointMonitor.TOOL_ID) is None
+
+
+def test_stop_releases_monitoring_tool(make_session):
+    session = make_session(
+        "while True:\n    pass\n", pb2.TRACE_MODE_BREAKPOINTS, breakpoints=[2]
+    )
+
+    session.start()
+    assert wait_for_pause(session) == 2
+    session.stop()
+
+    status = wait_for_event(session, "finished_event").finished_event.status
+    assert status == "success"
+    session._thread.join(timeout=5)
+    assert sys.monitoring.get_tool(BreakpointMonitor.TOOL_ID) is None
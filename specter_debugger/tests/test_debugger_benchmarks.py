@@ -0,0 +1,125 @@
+import concurrent.futures
+import sys
+import time
+
+import grpc
+import pytest
+
+from specter_debugger.server import DebuggerService, DebuggerSession
+from specter_debugger.proto import specter_pb2 as pb2
+from specter_debugger.proto import specter_pb2_grpc as pb2_grpc
+from google.protobuf.empty_pb2 import Empty
+
+pytestmark = pytest.mark.benchmark
+
+SOURCE_FILE_NAME = "<script>"
+
+LOOP_SOURCE = """\
+def work(n):
+    total = 0
+    for i in range(n):
+        total += i
+    return total
+
+def unused():
+    return None
+
+for _ in range({calls}):
+    work({iterations})
+"""
+
+
+def report(name: str, **values: float) -> None:
+    print(f"\n{name}: " + ", ".join(f"{k}={v:.2f}" for k, v in values.items()))
+
+
+def time_session(session: DebuggerSession) -> float:
+    start = time.perf_counter()
+    session.start()
+    session._thread.join(timeout=120)
+    return (time.perf_counter() - start) * 1000
+
+
+def test_breakpoint_mode_loop_overhead(make_session):
+    source = LOOP_SOURCE.format(calls=5, iterations=20000)
+    compiled = compile(source, SOURCE_FILE_NAME, "exec")
+    start = time.perf_counter()
+    exec(compiled, {})
+    plain_ms = (time.perf_counter() - start) * 1000
+
+    full_ms = time_session(make_session(source, pb2.TRACE_MODE_FULL))
+    breakpoints_ms = time_session(
+        make_session(source, pb2.TRACE_MODE_BREAKPOINTS, breakpoints=[8])
+    )
+
+    report(
+        "loop overhead",
+        plain_ms=plain_ms,
+        full_ms=full_ms,
+        breakpoints_ms=breakpoints_ms,
+    )
+    assert breakpoints_ms * 10 < full_ms
+
+
+@pytest.fixture
+def debugger_stub(monkeypatch):
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=4))
+    pb2_grpc.add_DebuggerServiceServicer_to_server(DebuggerService(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    yield pb2_grpc.DebuggerServiceStub(channel)
+    channel.close()
+    server.stop(0)
+
+
+def stream_session(
+    stub: pb2_grpc.DebuggerServiceStub,
+    batched: bool,
+    line_event_mode: int = pb2.LINE_EVENT_MODE_ALL,
+) -> dict[str, float]:
+    session = stub.CreateSession(Empty())
+    source = LOOP_SOURCE.format(calls=2, iterations=10000)
+    stub.SetSource(
+        pb2.SourceSet(
+            session=session, filename=SOURCE_FILE_NAME, data=source.encode("utf-8")
+        )
+    )
+    stub.Configure(pb2.SessionConfig(session=session, line_event_mode=line_event_mode))
+
+    listen = stub.ListenEventBatches if batched else stub.ListenEvents
+    stream = listen(session)
+    start = time.perf_counter()
+    stub.Start(session)
+
+    messages = events = 0
+    for message in stream:
+        batch = message.events if batched else [message]
+        messages += 1
+        events += len(batch)
+        if any(event.WhichOneof("event") == "finished_event" for event in batch):
+            break
+    stream.cancel()
+    return {
+        "ms": (time.perf_counter() - start) * 1000,
+        "messages": messages,
+        "events": events,
+    }
+
+
+def test_event_stream_throughput(debugger_stub):
+    single = stream_session(debugger_stub, batched=False)
+    batched = stream_session(debugger_stub, batched=True)
+    sampled = stream_session(debugger_stub, True, pb2.LINE_EVENT_MODE_SAMPLED)
+    off = stream_session(debugger_stub, True, pb2.LINE_EVENT_MODE_OFF)
+
+    report("ListenEvents", **single)
+    report("ListenEventBatches", **batched)
+    report("ListenEventBatches sampled", **sampled)
+    report("ListenEventBatches off", **off)
+    assert batched["events"] == single["events"]
+    assert batched["messages"] < single["messages"]
+    assert batched["ms"] < single["ms"]
+    assert off["events"] < sampled["events"] < batched["events"]
@@ -0,0 +1,95 @@
+import statistics
+import time
+
+import pytest
+
+from specter_debugger.proto import specter_pb2 as pb2
+
+from debugger_utils import wait_for_event, wait_for_pause
+
+TRACE_MODES = [pb2.TRACE_MODE_FULL, pb2.TRACE_MODE_BREAKPOINTS]
+
+SOURCE = """\
+def outer():
+    def inner():
+        x = 1
+        return x
+    y = inner()
+    return y
+
+outer()
+print("done")
+"""
+
+LOOP_SOURCE = """\
+total = 0
+for i in range(100):
+    total += i
+print(total)
+"""
+
+MAX_RESUME_LATENCY = 0.001
+
+
+def finish(session):
+    session.resume()
+    status = wait_for_event(session, "finished_event").finished_event.status
+    assert status == "success"
+    session._thread.join(timeout=5)
+
+
+@pytest.mark.parametrize("trace_mode", TRACE_MODES)
+def test_step_into_over_out(make_session, trace_mode):
+    session = make_session(SOURCE, trace_mode, breakpoints=[5])
+    session.start()
+    assert wait_for_pause(session) == 5
+
+    session.step(pb2.STEP_MODE_INTO)
+    assert wait_for_pause(session) == 3
+    session.step(pb2.STEP_MODE_OVER)
+    assert wait_for_pause(session) == 4
+    session.step(pb2.STEP_MODE_OUT)
+    assert wait_for_pause(session) == 6
+    session.step(pb2.STEP_MODE_OVER)
+    assert wait_for_pause(session) == 9
+
+    finish(session)
+
+
+@pytest.mark.parametrize("trace_mode", TRACE_MODES)
+def test_step_over_skips_calls(make_session, trace_mode):
+    session = make_session(SOURCE, trace_mode, breakpoints=[5])
+    session.start()
+    assert wait_for_pause(session) == 5
+
+    session.step(pb2.STEP_MODE_OVER)
+    assert wait_for_pause(session) == 6
+
+    finish(session)
+
+
+@pytest.mark.parametrize("trace_mode", TRACE_MODES)
+def test_resume_and_step_latency(make_session, trace_mode):
+    session = make_session(LOOP_SOURCE, trace_mode, breakpoints=[3])
+    session.start()
+    assert wait_for_pause(session) == 3
+
+    latencies = []
+    for _ in range(20):
+        start = time.perf_counter()
+        session.resume()
+        assert wait_for_pause(session) == 3
+        latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        session.step(pb2.STEP_MODE_OVER)
+        assert wait_for_pause(session) == 2
+        latencies.append(time.perf_counter() - start)
+
+        session.step(pb2.STEP_MODE_OVER)
+        assert wait_for_pause(session) == 3
+
+    assert statistics.median(latencies) < MAX_RESUME_LATENCY
+
+    session.remove_breakpoint("<script>", 3)
+    finish(session)
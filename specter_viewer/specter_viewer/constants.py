@@ -15,3 +15,6 @@ SPECTER_VIEVER_DEBUGGER_HOST = str(
 SPECTER_VIEVER_DEBUGGER_PORT = int(
     os.environ.get("SPECTER_VIEVER_DEBUGGER_PORT", "5678")
 )
+SPECTER_VIEVER_DEBUGGER_LINE_EVENT_RATE = float(
+    os.environ.get("SPECTER_VIEVER_DEBUGGER_LINE_EVENT_RATE", "30")
+)
@@ -6,6 +6,7 @@ from PySide6.QtCore import Qt
 
 from specter.client import Client
 
+from specter_viewer.models import GRPCSnapshotCache, GRPCRequestExecutor
 from specter_viewer.widgets import (
     MethodsDock,
     ObjectsDock,
@@ -14,6 +15,8 @@ from specter_viewer.widgets import (
     EditorDock,
     ViewerWidget,
     ToolBar,
+    SnapshotCacheDock,
+    RequestStatsDock,
 )
 
 
@@ -29,12 +32,21 @@ class MainWindow(QMainWindow):
         self.resize(800, 600)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
 
+        self._snapshot_cache = GRPCSnapshotCache(self._client, parent=self)
+        self._executor = GRPCRequestExecutor(parent=self)
+
         self._objects_dock = ObjectsDock(self._client)
-        self._properties_dock = PropertiesDock(self._client)
-        self._methods_dock = MethodsDock(self._client)
+        self._properties_dock = PropertiesDock(
+            self._client, self._snapshot_cache, self._executor
+        )
+        self._methods_dock = MethodsDock(
+            self._client, self._snapshot_cache, self._executor
+        )
         self._recorder_dock = RecorderDock(self._client)
         self._editor_dock = EditorDock(self._client)
         self._viewer_widget = ViewerWidget(self._client)
+        self._snapshot_cache_dock = SnapshotCacheDock(self._snapshot_cache)
+        self._request_stats_dock = RequestStatsDock(self._executor)
 
         self.setCentralWidget(self._viewer_widget)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self._objects_dock)
@@ -42,9 +54,19 @@ class MainWindow(QMainWindow):
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self._methods_dock)
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._recorder_dock)
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._editor_dock)
+        self.addDockWidget(
+            Qt.DockWidgetArea.BottomDockWidgetArea, self._snapshot_cache_dock
+        )
+        self.addDockWidget(
+            Qt.DockWidgetArea.BottomDockWidgetArea, self._request_stats_dock
+        )
 
         self.tabifyDockWidget(self._methods_dock, self._properties_dock)
         self.tabifyDockWidget(self._recorder_dock, self._editor_dock)
+        self.tabifyDockWidget(self._editor_dock, self._snapshot_cache_dock)
+        self.tabifyDockWidget(self._snapshot_cache_dock, self._request_stats_dock)
+        self._snapshot_cache_dock.hide()
+        self._request_stats_dock.hide()
 
         self._toolbar = ToolBar(self._client)
         self.addToolBar(self._toolbar)
@@ -53,8 +75,13 @@ class MainWindow(QMainWindow):
         self._objects_dock.current_object_changed.connect(
             self._on_current_object_changed
         )
+        self._objects_dock.prefetch_requested.connect(self._snapshot_cache.prefetch)
+        self._executor.request_failed.connect(self._on_request_failed)
 
     def _on_current_object_changed(self, object_id: str):
         self._properties_dock.set_object(object_id)
         self._methods_dock.set_object(object_id)
         self._viewer_widget.set_object(object_id)
+
+    def _on_request_failed(self, name: str, message: str):
+        self.statusBar().showMessage(f"{name} failed: {message}", 5000)
@@ -10,8 +10,26 @@ from specter_viewer.models.recorder import (
 from specter_viewer.models.methods import (
     GRPCMethodsModel,
 )
+from specter_viewer.models.requests import (
+    GRPCRequestExecutor,
+    LatencyHistogram,
+)
+from specter_viewer.models.snapshots import (
+    GRPCSnapshotCache,
+    SnapshotStats,
+)
+from specter_viewer.models.preview import (
+    PreviewOptions,
+    PreviewComposer,
+)
 from specter_viewer.models.proxies import (
     MultiColumnSortFilterProxyModel,
+    ColumnFilter,
+    PredicateFilter,
+    SubstringFilter,
+    RegexFilter,
+    NumericRangeFilter,
+    FilterStats,
 )
 
 __all__ = [
@@ -19,5 +37,17 @@ __all__ = [
     "GRPCPropertiesModel",
     "GRPCRecorderConsoleItem",
     "GRPCMethodsModel",
+    "GRPCSnapshotCache",
+    "GRPCRequestExecutor",
+    "LatencyHistogram",
+    "SnapshotStats",
+    "PreviewOptions",
+    "PreviewComposer",
     "MultiColumnSortFilterProxyModel",
+    "ColumnFilter",
+    "PredicateFilter",
+    "SubstringFilter",
+    "RegexFilter",
+    "NumericRangeFilter",
+    "FilterStats",
 ]
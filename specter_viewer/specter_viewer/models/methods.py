@@ -1,7 +1,8 @@
-import dataclasses
 import datetime
 import typing
 import enum
+import functools
+import collections
 
 from PySide6.QtGui import QFont, QBrush, QColor
 
@@ -14,25 +15,59 @@ from PySide6.QtCore import (
     QSortFilterProxyModel,
 )
 
-from specter.proto.specter_pb2 import ObjectId, Method, MethodCall
+from specter.proto.specter_pb2 import ObjectId, Method, Methods, MethodCall
 from specter.client import Client, convert_to_value, convert_from_value
 
+from specter_viewer.models.requests import GRPCRequestExecutor
+from specter_viewer.models.snapshots import GRPCSnapshotCache
 from specter_viewer.models.utils import (
-    flatten_dict_field,
-    unflatten_dict_field,
-    create_properties_dataclass,
+    PropertyPath,
+    PropertyField,
+    PropertyTree,
 )
 
+METHOD_SCHEMA_CACHE_SIZE = 2048
+
+_method_schema_cache: collections.OrderedDict[bytes, typing.Optional[PropertyTree]] = (
+    collections.OrderedDict()
+)
+
+
+def get_method_schema(method: Method) -> typing.Optional[PropertyTree]:
+    signature = method.SerializeToString(deterministic=True)
+
+    if signature in _method_schema_cache:
+        _method_schema_cache.move_to_end(signature)
+        return _method_schema_cache[signature]
+
+    schema = PropertyTree()
+    for parameter in method.parameters:
+        base_value = convert_from_value(parameter.default_value)
+
+        if base_value is None:
+            schema = None
+            break
+
+        schema.add_root(parameter.parameter_name, base_value)
+
+    _method_schema_cache[signature] = schema
+    if len(_method_schema_cache) > METHOD_SCHEMA_CACHE_SIZE:
+        _method_schema_cache.popitem(last=False)
+
+    return schema
+
 
 class BaseTreeItem:
     def __init__(self, name: str, parent: typing.Optional["BaseTreeItem"] = None):
         self._name = name
         self._parent = parent
         self._children: typing.List["BaseTreeItem"] = []
+        self._row = 0
         if parent is not None:
             parent.append_child(self)
 
     def append_child(self, child: "BaseTreeItem"):
+        child._row = len(self._children)
         self._children.append(child)
 
     def child(self, row: int) -> typing.Optional["BaseTreeItem"]:
@@ -48,10 +83,7 @@ class BaseTreeItem:
 
     def row(self) -> int:
         if self._parent:
-            try:
-                return self._parent._children.index(self)
-            except ValueError:
-                pass
+            return self._row
         return 0
 
     @property
@@ -71,14 +103,20 @@ class PropertiesTreeItem(BaseTreeItem):
     def __init__(
         self,
         name: str,
-        field: typing.Optional[dataclasses.Field],
+        path: PropertyPath,
+        field: typing.Optional[PropertyField],
         parent: typing.Optional[BaseTreeItem],
     ):
         super().__init__(name, parent)
+        self._path = path
         self._field = field
 
     @property
-    def field(self) -> typing.Optional[dataclasses.Field]:
+    def path(self) -> PropertyPath:
+        return self._path
+
+    @property
+    def field(self) -> typing.Optional[PropertyField]:
         return self._field
 
 
@@ -86,21 +124,29 @@ class MethodTreeItem(BaseTreeItem):
     def __init__(
         self,
         name: str,
-        dataclass_instance: object,
-        call_action: typing.Callable[[], None],
+        schema: PropertyTree,
+        call_action: typing.Callable[[PropertyTree], None],
         parent: typing.Optional[BaseTreeItem],
     ):
         super().__init__(name, parent)
-        self._dataclass_instance = dataclass_instance
+        self._schema = schema
+        self._property_tree = None
         self._call_action = call_action
+        self.populated = False
 
     @property
-    def dataclass_instance(self) -> object:
-        return self._dataclass_instance
+    def schema(self) -> PropertyTree:
+        return self._schema
+
+    @property
+    def property_tree(self) -> PropertyTree:
+        if self._property_tree is None:
+            self._property_tree = self._schema.copy()
+        return self._property_tree
 
     @property
     def call_action(self) -> typing.Callable[[], None]:
-        return self._call_action
+        return lambda: self._call_action(self.property_tree)
 
 
 class HasNoDefaultError(Exception):
@@ -127,7 +173,7 @@ class MethodsModel(QAbstractItemModel):
     def set_methods(
         self,
         method_data_list: typing.List[
-            typing.Tuple[str, object, typing.Callable[[], None]]
+            typing.Tuple[str, PropertyTree, typing.Callable[[PropertyTree], None]]
         ],
     ):
         self._method_data_list = method_data_list
@@ -137,50 +183,59 @@ class MethodsModel(QAbstractItemModel):
         self.beginResetModel()
         self._root_node._children.clear()
 
-        for func_name, dc_instance, call_action in self._method_data_list:
-            if not dataclasses.is_dataclass(dc_instance):
-                continue
+        for func_name, schema, call_action in self._method_data_list:
+            MethodTreeItem(func_name, schema, call_action, self._root_node)
+        self.endResetModel()
 
-            func_tree_item = MethodTreeItem(
-                func_name, dc_instance, call_action, self._root_node
-            )
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            item = parent.internalPointer()
+            if isinstance(item, MethodTreeItem) and not item.populated:
+                return len(item.schema.fields()) > 0
+        return super().hasChildren(parent)
 
-            data_hierarchy = {}
-            for cur_field in dataclasses.fields(dc_instance):
-                if "display_path" in cur_field.metadata:
-                    path = cur_field.metadata["display_path"].split("/")
-                    current_dict = data_hierarchy
-                    for i, cur_path in enumerate(path):
-                        if cur_path not in current_dict:
-                            current_dict[cur_path] = {}
-                        current_dict = current_dict[path[i]]
-                    current_dict[cur_field.name] = {}
-                else:
-                    data_hierarchy[cur_field.name] = {}
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid():
+            return False
 
-            self._build_dataclass_sub_tree(dc_instance, data_hierarchy, func_tree_item)
-        self.endResetModel()
+        item = parent.internalPointer()
+        return isinstance(item, MethodTreeItem) and not item.populated
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        item = parent.internalPointer()
+        item.populated = True
 
-    def _build_dataclass_sub_tree(
+        count = len({field.path[0] for field in item.schema.fields()})
+        if count == 0:
+            return
+
+        self.beginInsertRows(parent.siblingAtColumn(0), 0, count - 1)
+        self._build_property_sub_tree(item.schema, item)
+        self.endInsertRows()
+
+    def _build_property_sub_tree(
         self,
-        dataclass_instance: object,
-        data_hierarchy: typing.Dict,
+        schema: PropertyTree,
         parent_tree_item: BaseTreeItem,
     ) -> None:
-        name_field_dict = {
-            field.name: field for field in dataclasses.fields(dataclass_instance)
-        }
-        for key, value in data_hierarchy.items():
-            cur_field = name_field_dict.get(key, None)
-            if cur_field:
-                item = PropertiesTreeItem(
-                    name=key, field=cur_field, parent=parent_tree_item
-                )
-            else:
-                item = PropertiesTreeItem(name=key, field=None, parent=parent_tree_item)
-
-            if isinstance(value, dict) and len(value) > 0:
-                self._build_dataclass_sub_tree(dataclass_instance, value, item)
+        path_items = {}
+        for field in schema.fields():
+            parent_item = parent_tree_item
+            for depth in range(1, len(field.path) + 1):
+                path = field.path[:depth]
+                item = path_items.get(path, None)
+                if item is None:
+                    item = PropertiesTreeItem(
+                        name=path[-1],
+                        path=path,
+                        field=field if depth == len(field.path) else None,
+                        parent=parent_item,
+                    )
+                    path_items[path] = item
+                parent_item = item
 
     def parent(self, index: QModelIndex) -> QModelIndex:
         if not index.isValid():
@@ -220,21 +275,10 @@ class MethodsModel(QAbstractItemModel):
                     return "Value / Action"
         return None
 
-    def get_default_value(self, data_class_field: dataclasses.Field) -> typing.Any:
-        if (
-            hasattr(data_class_field, "default")
-            and data_class_field.default != dataclasses.MISSING
-        ):
-            return data_class_field.default
-        elif (
-            hasattr(data_class_field, "default_factory")
-            and data_class_field.default_factory != dataclasses.MISSING
-        ):
-            return data_class_field.default_factory()
-        else:
-            raise HasNoDefaultError(
-                f"Could not get default value for field {data_class_field.name}"
-            )
+    def get_default_value(self, field: typing.Optional[PropertyField]) -> typing.Any:
+        if field is None:
+            raise HasNoDefaultError("Could not get default value for a group")
+        return field.default
 
     def data(
         self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
@@ -260,10 +304,10 @@ class MethodsModel(QAbstractItemModel):
 
         elif isinstance(item, PropertiesTreeItem):
             owning_method_item = item.find_ancestor(MethodTreeItem)
-            if not owning_method_item or not owning_method_item.dataclass_instance:
+            if not owning_method_item:
                 return None
 
-            dataclass_instance = owning_method_item.dataclass_instance
+            property_tree = owning_method_item.property_tree
 
             if item.field is None:
                 if index.column() == 0:
@@ -275,7 +319,7 @@ class MethodsModel(QAbstractItemModel):
                 if index.column() == 0:
                     return item.field.metadata.get("display_name", item.name)
                 else:
-                    ret_val = getattr(dataclass_instance, item.name, None)
+                    ret_val = property_tree.get(item.path)
                     if ret_val is None:
                         return ""
                     elif isinstance(ret_val, datetime.datetime):
@@ -286,7 +330,7 @@ class MethodsModel(QAbstractItemModel):
                         return ", ".join([str(item_val) for item_val in ret_val])
                     return ret_val
             elif role == Qt.ItemDataRole.EditRole:
-                return getattr(dataclass_instance, item.name, None)
+                return property_tree.get(item.path)
             elif role == Qt.ItemDataRole.ToolTipRole:
                 result_str = item.field.metadata.get("help", "")
                 if item.field.metadata.get("required", False):
@@ -323,7 +367,7 @@ class MethodsModel(QAbstractItemModel):
             elif role == Qt.ItemDataRole.FontRole:
                 try:
                     default_val = self.get_default_value(item.field)
-                    cur_val = getattr(dataclass_instance, item.name, None)
+                    cur_val = property_tree.get(item.path)
                     if cur_val != default_val:
                         font = QFont()
                         font.setBold(True)
@@ -334,7 +378,7 @@ class MethodsModel(QAbstractItemModel):
             elif role == Qt.ItemDataRole.BackgroundRole:
                 if (
                     item.field.metadata.get("required", False)
-                    and getattr(dataclass_instance, item.name, None) is None
+                    and property_tree.get(item.path) is None
                 ):
                     return QBrush(QColor(255, 0, 0, 50))
                 return None
@@ -360,19 +404,19 @@ class MethodsModel(QAbstractItemModel):
                 return False
 
             owning_method_item = tree_item.find_ancestor(MethodTreeItem)
-            if not owning_method_item or not owning_method_item.dataclass_instance:
+            if not owning_method_item:
                 return False
 
-            dataclass_instance = owning_method_item.dataclass_instance
+            property_tree = owning_method_item.property_tree
 
             if role == Qt.ItemDataRole.EditRole:
-                setattr(dataclass_instance, tree_item.name, value)
+                property_tree.set(tree_item.path, value)
                 self.dataChanged.emit(index, index)
                 return True
             elif role == MethodsModel.CustomDataRoles.DefaultValueRole:
                 try:
                     default_value = self.get_default_value(tree_item.field)
-                    setattr(dataclass_instance, tree_item.name, default_value)
+                    property_tree.set(tree_item.path, default_value)
                     self.dataChanged.emit(index, index)
                     return True
                 except HasNoDefaultError:
@@ -451,81 +495,73 @@ class MethodsModel(QAbstractItemModel):
 
 
 class GRPCMethodsModel(MethodsModel):
-    def __init__(self, client: Client, parent=None):
+    def __init__(
+        self,
+        client: Client,
+        snapshot_cache: typing.Optional[GRPCSnapshotCache] = None,
+        executor: typing.Optional[GRPCRequestExecutor] = None,
+        parent=None,
+    ):
         super().__init__(parent)
         self._client = client
+        self._snapshot_cache = snapshot_cache
+        self._executor = executor or GRPCRequestExecutor(parent=self)
+        self._request_key = f"GetMethods@{id(self)}"
         self._object_id = None
 
     def set_object(self, object_id: str):
         self._object_id = object_id
-        self._fetch_initial_state()
 
-    def _fetch_initial_state(self):
         if self._object_id is None:
+            self._executor.cancel(self._request_key)
             self.set_methods([])
-            return False
+            return
 
-        methods_data = []
-        try:
-            response = self._client.object_stub.GetMethods(ObjectId(id=self._object_id))
-        except Exception as e:
-            self.set_methods([])
-            return False
+        self._executor.submit(
+            "GetMethods",
+            functools.partial(self._fetch_initial_state, object_id),
+            on_result=functools.partial(self._apply_initial_state, object_id),
+            on_error=lambda _: self.set_methods([]),
+            key=self._request_key,
+        )
+
+    def _fetch_initial_state(self, object_id: str) -> Methods:
+        if self._snapshot_cache is not None:
+            return self._snapshot_cache.get_methods(object_id)
+        return self._client.object_stub.GetMethods(ObjectId(id=object_id))
+
+    def _apply_initial_state(self, object_id: str, response: Methods) -> None:
+        if object_id != self._object_id:
+            return
 
+        methods_data = []
         for method in response.methods:
-            dataclass_instance = self._create_dataclass_instance(method)
-            if dataclass_instance is None:
+            schema = get_method_schema(method)
+            if schema is None:
                 continue
 
-            call_method = self._create_call_method(
-                method.method_name, dataclass_instance
-            )
-            methods_data.append((method.method_name, dataclass_instance, call_method))
+            call_method = self._create_call_method(method.method_name)
+            methods_data.append((method.method_name, schema, call_method))
 
         self.set_methods(methods_data)
-        return True
-
-    def _create_call_method(self, method_name, dataclass_instance):
-        def call_method(method_name=method_name, dataclass_instance=dataclass_instance):
-            root_fields = set()
-            for field in dataclasses.fields(dataclass_instance):
-                root_field = field.name.split("_", 1)[0]
-                root_fields.add(root_field)
-
-            arguments = []
-            for root_field in root_fields:
-                value_to_send = unflatten_dict_field(dataclass_instance, root_field)
-
-                arguments.append(convert_to_value(value_to_send))
-
-            self._client.object_stub.CallMethod(
-                MethodCall(
-                    object_id=ObjectId(id=self._object_id),
-                    method_name=method_name,
-                    arguments=arguments,
-                )
-            )
-
-        return call_method
-
-    def _create_dataclass_instance(self, method: Method):
-        fields = []
-        values = {}
-
-        for parameter in method.parameters:
-            base_path = parameter.parameter_name
-            base_value = convert_from_value(parameter.default_value)
 
-            if base_value is None:
-                return None
-
-            prop_fields, prop_values = flatten_dict_field(
-                base_value,
-                base_path,
-                field_prefix=base_path,
-                editable=True,
+    def _create_call_method(self, method_name):
+        def call_method(property_tree, method_name=method_name):
+            arguments = [
+                convert_to_value(property_tree.serialize(root_name))
+                for root_name in property_tree.roots()
+            ]
+
+            self._executor.submit(
+                "CallMethod",
+                functools.partial(
+                    self._client.object_stub.CallMethod,
+                    MethodCall(
+                        object_id=ObjectId(id=self._object_id),
+                        method_name=method_name,
+                        arguments=arguments,
+                    ),
+                ),
             )
-            fields.extend(prop_fields)
-            values.update(prop_values)
 
-        return create_properties_dataclass(fields, values)
+        return call_method
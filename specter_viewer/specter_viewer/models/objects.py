@@ -100,6 +100,27 @@ class ObjectsModel(QAbstractItemModel):
         elif role == ObjectsModel.CustomDataRoles.QueryRole:
             return node.query
 
+    def column_data(
+        self, column: int, parent=QModelIndex(), role=Qt.ItemDataRole.DisplayRole
+    ) -> list[typing.Any]:
+        parent_node = parent.internalPointer() if parent.isValid() else self._root
+        if role != Qt.ItemDataRole.DisplayRole:
+            return [
+                self.data(self.index(row, column, parent), role)
+                for row in range(len(parent_node.children))
+            ]
+
+        match column:
+            case ObjectsModel.Columns.Name:
+                return [node.name for node in parent_node.children]
+            case ObjectsModel.Columns.Type:
+                return [node.type for node in parent_node.children]
+            case ObjectsModel.Columns.Path:
+                return [node.path for node in parent_node.children]
+            case ObjectsModel.Columns.Id:
+                return [node.id for node in parent_node.children]
+        return [None] * len(parent_node.children)
+
     def headerData(
         self, section, orientation, role=Qt.ItemDataRole.DisplayRole
     ) -> typing.Any:
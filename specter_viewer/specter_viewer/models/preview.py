@@ -0,0 +1,132 @@
+import time
+import collections
+
+from PySide6.QtGui import QImage, QPainter
+
+from specter.proto.specter_pb2 import PreviewRequest, PreviewImage, PreviewFormat
+
+
+class PreviewOptions:
+    def __init__(
+        self,
+        max_width: int = 0,
+        max_height: int = 0,
+        max_fps: float = 0.0,
+        format: PreviewFormat = PreviewFormat.PNG,
+        allow_delta: bool = True,
+    ):
+        self.max_width = max_width
+        self.max_height = max_height
+        self.max_fps = max_fps
+        self.format = format
+        self.allow_delta = allow_delta
+
+    def to_request(self, object_id: str) -> PreviewRequest:
+        return PreviewRequest(
+            id=object_id,
+            max_width=self.max_width,
+            max_height=self.max_height,
+            max_fps=self.max_fps,
+            format=self.format,
+            allow_delta=self.allow_delta,
+        )
+
+
+class PreviewStats:
+    FPS_WINDOW_S = 1.0
+    DECODE_SMOOTHING = 0.1
+
+    def __init__(self):
+        self.decoded = 0
+        self.displayed = 0
+        self.dropped = 0
+        self.decode_ms = 0.0
+        self._display_times: collections.deque[float] = collections.deque()
+
+    @property
+    def fps(self) -> float:
+        since = time.monotonic() - self.FPS_WINDOW_S
+        recent = sum(1 for display_time in self._display_times if display_time >= since)
+        return recent / self.FPS_WINDOW_S
+
+    def record_decode(self, decode_ms: float) -> None:
+        if self.decoded == 0:
+            self.decode_ms = decode_ms
+        else:
+            self.decode_ms += (decode_ms - self.decode_ms) * self.DECODE_SMOOTHING
+        self.decoded += 1
+
+    def record_drop(self) -> None:
+        self.dropped += 1
+
+    def record_display(self) -> None:
+        now = time.monotonic()
+        self.displayed += 1
+        self._display_times.append(now)
+        while self._display_times[0] < now - self.FPS_WINDOW_S:
+            self._display_times.popleft()
+
+
+def decode_preview_image(
+    data: bytes, format: PreviewFormat, width: int, height: int
+) -> QImage:
+    if format == PreviewFormat.RAW:
+        if width <= 0 or height <= 0 or len(data) < width * height * 4:
+            return QImage()
+        return QImage(
+            memoryview(data), width, height, width * 4, QImage.Format_RGBA8888
+        )
+
+    return QImage.fromData(data)
+
+
+class PreviewComposer:
+    PAINTABLE_FORMATS = (
+        QImage.Format_RGB32,
+        QImage.Format_ARGB32,
+        QImage.Format_ARGB32_Premultiplied,
+        QImage.Format_RGBA8888,
+        QImage.Format_RGBA8888_Premultiplied,
+    )
+
+    def __init__(self):
+        self._frame = QImage()
+
+    @property
+    def frame(self) -> QImage:
+        return self._frame
+
+    def reset(self) -> None:
+        self._frame = QImage()
+
+    def _accepts_delta(self, preview: PreviewImage) -> bool:
+        if self._frame.isNull():
+            return False
+        if preview.width and preview.width != self._frame.width():
+            return False
+        return not preview.height or preview.height == self._frame.height()
+
+    def compose(self, preview: PreviewImage) -> QImage:
+        image = preview.image
+        if image:
+            self._frame = decode_preview_image(
+                image, preview.format, preview.width, preview.height
+            )
+        elif not preview.dirty_rects:
+            self.reset()
+
+        if preview.dirty_rects and self._accepts_delta(preview):
+            if self._frame.format() not in self.PAINTABLE_FORMATS:
+                self._frame.convertTo(QImage.Format_ARGB32_Premultiplied)
+
+            painter = QPainter(self._frame)
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            for rect in preview.dirty_rects:
+                patch = decode_preview_image(
+                    rect.image, preview.format, rect.width, rect.height
+                )
+                if not patch.isNull():
+                    painter.drawImage(rect.x, rect.y, patch)
+            painter.end()
+
+        return self._frame
@@ -1,30 +1,31 @@
 import enum
 import typing
 import datetime
-import dataclasses
+import functools
 
 from PySide6.QtCore import (
     Qt,
     QObject,
     QMetaObject,
+    QTimer,
     Slot,
     QModelIndex,
-    QSortFilterProxyModel,
     QPersistentModelIndex,
     QAbstractItemModel,
     Q_ARG,
 )
 from PySide6.QtGui import QFont, QBrush, QColor
 
-from specter.proto.specter_pb2 import ObjectId, PropertyUpdate
+from specter.proto.specter_pb2 import ObjectId, Properties, PropertyUpdate
 from specter.client import Client, StreamReader, convert_to_value, convert_from_value
 
+from specter_viewer.models.requests import GRPCRequestExecutor
+from specter_viewer.models.snapshots import GRPCSnapshotCache
 from specter_viewer.models.utils import (
-    ObservableDict,
-    EmptyDataclass,
-    flatten_dict_field,
-    unflatten_dict_field,
-    create_properties_dataclass,
+    PropertyPath,
+    PropertyField,
+    PropertyTree,
+    iter_leaves,
 )
 
 
@@ -32,19 +33,27 @@ class PropertiesTreeItem(object):
     def __init__(
         self,
         name: str,
-        item_data: typing.Any,
-        field: dataclasses.Field | None,
+        path: PropertyPath,
+        field: PropertyField | None,
         parent: typing.Optional["PropertiesTreeItem"] = None,
     ) -> None:
         self.name = name
-        self.item_data = item_data
+        self.path = path
         self.field = field
         self.parent_item = parent
         self.child_items = []
+        self.child_row = 0
 
     def append_child(self, item: "PropertiesTreeItem") -> None:
+        item.child_row = len(self.child_items)
         self.child_items.append(item)
 
+    def remove_child(self, row: int) -> "PropertiesTreeItem":
+        item = self.child_items.pop(row)
+        for sibling in self.child_items[row:]:
+            sibling.child_row -= 1
+        return item
+
     def child(self, row: int) -> "PropertiesTreeItem":
         return self.child_items[row]
 
@@ -54,10 +63,7 @@ class PropertiesTreeItem(object):
     def column_count(self) -> int:
         return 2
 
-    def data(self) -> typing.Any:
-        return self.item_data
-
-    def get_field(self) -> dataclasses.Field | None:
+    def get_field(self) -> PropertyField | None:
         return self.field
 
     def parent(self) -> "PropertiesTreeItem | None":
@@ -65,7 +71,7 @@ class PropertiesTreeItem(object):
 
     def row(self) -> int:
         if self.parent_item:
-            return self.parent_item.child_items.index(self)
+            return self.child_row
         return 0
 
 
@@ -81,89 +87,176 @@ class PropertiesModel(QAbstractItemModel):
         AttributeNameRole = Qt.ItemDataRole.UserRole + 3
         TreeItemRole = Qt.ItemDataRole.UserRole + 4
 
+    LAYOUT_CHANGE_THRESHOLD = 16
+
     def __init__(
         self,
-        dataclass_instance: object,
+        property_tree: typing.Optional[PropertyTree] = None,
         parent: typing.Optional[QObject] = None,
-        allow_non_field_attrs: bool = False,
     ) -> None:
         super().__init__(parent)
-        self._allow_non_field_attrs = allow_non_field_attrs
-        self.set_dataclass_instance(dataclass_instance)
-
-    def set_dataclass_instance(self, dataclass_instance: typing.Any) -> None:
-        if not dataclasses.is_dataclass(dataclass_instance):
-            raise TypeError(
-                f"Expected a dataclass instance, got {type(dataclass_instance)} - make sure @dataclass is"
-                "used on the class definition"
-            )
+        self._property_tree = None
+        self.set_property_tree(property_tree or PropertyTree())
 
-        dataclass_fields = dataclasses.fields(dataclass_instance)
-        dataclass_field_names = [field.name for field in dataclass_fields]
-        if not self._allow_non_field_attrs:
-            for attr in dir(dataclass_instance):
-                if not attr.startswith("__"):
-                    if attr not in dataclass_field_names and not callable(
-                        getattr(dataclass_instance, attr)
-                    ):
-                        raise AttributeError(
-                            f"Attribute {attr} is not a field of the dataclass. "
-                            "This most likely happened because "
-                            " @dataclass decorator to the class definition"
-                        )
+    def set_property_tree(self, property_tree: PropertyTree) -> None:
+        if (
+            self._property_tree is not None
+            and property_tree.signature() == self._property_tree.signature()
+        ):
+            self._update_property_tree(property_tree)
+            return
 
         self.beginResetModel()
 
-        self._dataclass = dataclass_instance
-        self._root_node = PropertiesTreeItem("Root", None, None, None)
+        self._property_tree = property_tree
+        self._root_node = PropertiesTreeItem("Root", (), None, None)
+        self._path_items = {}
 
-        self.data_hierachy = {}
+        self._build_tree(self._property_tree.fields())
+        self.endResetModel()
+
+    def get_property_tree(self) -> PropertyTree:
+        return self._property_tree
+
+    def add_root_property(
+        self, name: str, value: typing.Any, editable: bool = True
+    ) -> None:
+        if self._property_tree.has_root(name):
+            self.remove_root_property(name)
 
-        if dataclass_instance is None:
-            self.modelReset.emit()
-            self.endResetModel()
+        fields = self._property_tree.add_root(name, value, editable)
+        if not fields:
             return
 
-        for cur_field in dataclasses.fields(self._dataclass):
-            if "display_path" in cur_field.metadata:
-                path = cur_field.metadata["display_path"].split("/")
-                current_dict = self.data_hierachy
-                for i, cur_path in enumerate(path):
-                    if cur_path not in current_dict:
-                        current_dict[cur_path] = {}
-                    current_dict = current_dict[path[i]]
-                current_dict[cur_field.name] = {}
-            else:
-                self.data_hierachy[cur_field.name] = {}
+        row = self._root_node.child_count()
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._build_tree(fields)
+        self.endInsertRows()
 
-        self._build_tree(self._dataclass, self.data_hierachy, self._root_node)
-        self.modelReset.emit()
-        self.endResetModel()
+    def remove_root_property(self, name: str) -> None:
+        self._property_tree.remove_root(name)
 
-    def get_dataclass(self) -> typing.Any:
-        return self._dataclass
+        item = self._path_items.get((name,), None)
+        if item is None:
+            return
 
-    def _build_tree(
-        self,
-        data: "DataclassInstance",  # type:ignore
-        data_hierarchy: typing.Dict,
-        parent: PropertiesTreeItem,
-    ) -> None:
-        name_field_dict = {field.name: field for field in dataclasses.fields(data)}
-        for key, value in data_hierarchy.items():
-            item_data = None
-            if key in data.__dict__:
-                item_data = data.__dict__[key]
-
-            item = PropertiesTreeItem(
-                name=key,
-                item_data=item_data,
-                field=name_field_dict.get(key, None),
-                parent=parent,
+        row = item.row()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._forget_items(self._root_node.remove_child(row))
+        self.endRemoveRows()
+
+    def update_root_property(self, name: str, value: typing.Any) -> None:
+        self.update_root_properties({name: value})
+
+    def update_root_properties(self, values: dict[str, typing.Any]) -> None:
+        changed_leaves = []
+        rebuilt_roots = {}
+        for name, value in values.items():
+            leaves = list(iter_leaves((name,), value))
+            root_fields = self._property_tree.root_fields(name)
+            if root_fields and {path for path, _ in leaves} != {
+                field.path for field in root_fields
+            }:
+                rebuilt_roots[name] = (value, root_fields[0].metadata["editable"])
+                continue
+
+            for path, leaf_value in leaves:
+                item = self._path_items.get(path, None)
+                if item is None or item.field is None:
+                    continue
+                if self._property_tree.get(path) != leaf_value:
+                    changed_leaves.append((item, leaf_value))
+
+        relayout = len(changed_leaves) > self.LAYOUT_CHANGE_THRESHOLD
+        if relayout:
+            self.layoutAboutToBeChanged.emit()
+
+        changed_rows = {}
+        for item, leaf_value in changed_leaves:
+            self._property_tree.set(item.path, leaf_value)
+            changed_rows.setdefault(item.parent(), []).append(item.row())
+
+        if relayout:
+            self.layoutChanged.emit()
+        else:
+            for parent_item, rows in changed_rows.items():
+                parent_index = QModelIndex()
+                if parent_item is not self._root_node:
+                    parent_index = self.createIndex(parent_item.row(), 0, parent_item)
+                self.dataChanged.emit(
+                    self.index(min(rows), 0, parent_index),
+                    self.index(max(rows), 1, parent_index),
+                )
+
+        for name, (value, editable) in rebuilt_roots.items():
+            self.add_root_property(name, value, editable)
+
+    def _update_property_tree(self, property_tree: PropertyTree) -> None:
+        changed_items = [
+            item
+            for path, item in self._path_items.items()
+            if item.field is not None
+            and (
+                self._property_tree.get(path) != property_tree.get(path)
+                or item.field.default != property_tree.field(path).default
+            )
+        ]
+
+        relayout = len(changed_items) > self.LAYOUT_CHANGE_THRESHOLD
+        if relayout:
+            self.layoutAboutToBeChanged.emit()
+
+        self._property_tree = property_tree
+        for path, item in self._path_items.items():
+            if item.field is not None:
+                item.field = property_tree.field(path)
+
+        if relayout:
+            self.layoutChanged.emit()
+            return
+
+        for item in changed_items:
+            self.dataChanged.emit(
+                self.createIndex(item.row(), 0, item),
+                self.createIndex(item.row(), 1, item),
             )
-            parent.append_child(item)
-            if isinstance(value, dict) and len(value) > 0:
-                self._build_tree(data, value, item)
+
+    def _build_tree(self, fields: typing.Iterable[PropertyField]) -> None:
+        for field in fields:
+            parent_item = self._root_node
+            for depth in range(1, len(field.path) + 1):
+                path = field.path[:depth]
+                item = self._path_items.get(path, None)
+                if item is None:
+                    item = PropertiesTreeItem(
+                        name=path[-1],
+                        path=path,
+                        field=field if depth == len(field.path) else None,
+                        parent=parent_item,
+                    )
+                    parent_item.append_child(item)
+                    self._path_items[path] = item
+                parent_item = item
+
+    def _forget_items(self, item: PropertiesTreeItem) -> None:
+        self._path_items.pop(item.path, None)
+        for child_item in item.child_items:
+            self._forget_items(child_item)
+
+    def _find_index(self, path: PropertyPath, column: int = 0) -> QModelIndex:
+        item = self._path_items.get(path, None)
+        if item is None:
+            return QModelIndex()
+
+        return self.createIndex(item.row(), column, item)
+
+    def _set_property_value(self, item: PropertiesTreeItem, value: typing.Any) -> bool:
+        self._property_tree.set(item.path, value)
+        self.dataChanged.emit(
+            self.createIndex(item.row(), 0, item),
+            self.createIndex(item.row(), 1, item),
+        )
+        return True
 
     def parent(self, index: QModelIndex) -> QModelIndex:
         if not index.isValid():
@@ -203,18 +296,10 @@ class PropertiesModel(QAbstractItemModel):
         else:
             return None
 
-    def get_default_value(self, data_class_field: dataclasses.Field) -> typing.Any:
-        if (
-            hasattr(data_class_field, "default")
-            and data_class_field.default != dataclasses.MISSING
-        ):
-            return data_class_field.default
-        elif hasattr(data_class_field, "default_factory"):
-            return data_class_field.default_factory()  # type: ignore
-        else:
-            raise HasNoDefaultError(
-                f"Could not get default value for field {data_class_field.name}"
-            )
+    def get_default_value(self, field: PropertyField | None) -> typing.Any:
+        if field is None:
+            raise HasNoDefaultError("Could not get default value for a group")
+        return field.default
 
     def data(
         self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
@@ -223,18 +308,17 @@ class PropertiesModel(QAbstractItemModel):
             return None
 
         node: PropertiesTreeItem = index.internalPointer()  # type: ignore
-        name_field_dict = {
-            field.name: field for field in dataclasses.fields(self._dataclass)
-        }
+        field = node.field
 
         if role == Qt.ItemDataRole.DisplayRole:
             if index.column() == 0:
-                try:
-                    return name_field_dict[node.name].metadata["display_name"]
-                except (IndexError, KeyError, AttributeError):
+                if field is None:
                     return node.name
+                return field.metadata.get("display_name", node.name)
             else:
-                ret_val = self._dataclass.__dict__.get(node.name, None)
+                ret_val = None
+                if field is not None:
+                    ret_val = self._property_tree.get(node.path)
                 if ret_val is None:
                     return ""
                 elif isinstance(ret_val, datetime.datetime):
@@ -245,54 +329,43 @@ class PropertiesModel(QAbstractItemModel):
                     return ", ".join([str(item) for item in ret_val])
                 return ret_val
         elif role == Qt.ItemDataRole.EditRole:
-            return self._dataclass.__dict__.get(node.name, None)
+            if field is None:
+                return None
+            return self._property_tree.get(node.path)
         elif role == Qt.ItemDataRole.ToolTipRole:
-            if name_field_dict.get(node.name, None) is None:
+            if field is None:
                 return node.name
             result_str = ""
-            result_str += name_field_dict[node.name].metadata.get("help", "")
+            result_str += field.metadata.get("help", "")
 
-            if name_field_dict[node.name].metadata.get("required", False):
+            if field.metadata.get("required", False):
                 result_str += " <b style='color:red'>(required)</b>"
             try:
-                item_type_name = name_field_dict[node.name].type.__name__
+                item_type_name = field.type.__name__
             except AttributeError:
-                item_type_name = str(name_field_dict[node.name].type)
+                item_type_name = str(field.type)
             result_str += f" (type: {item_type_name[:20]})"
-
-            try:
-                result_str += f" (default: {str(self.get_default_value(name_field_dict[node.name]))[:20]})"
-            except HasNoDefaultError:
-                pass
+            result_str += f" (default: {str(self.get_default_value(field))[:20]})"
 
             return result_str
         elif role == PropertiesModel.CustomDataRoles.TypeRole:
-            result = name_field_dict.get(node.name, None)
-            if result:
-                return result.type
-            else:
+            if field is None:
                 return None
+            return field.type
         elif role == PropertiesModel.CustomDataRoles.AttributeNameRole:
             return node.name
         elif role == PropertiesModel.CustomDataRoles.FieldRole:
-            result = name_field_dict.get(node.name, None)
-            return result
+            return field
         elif role == PropertiesModel.CustomDataRoles.DefaultValueRole:
-            if name_field_dict.get(node.name, None) is None:
-                raise HasNoDefaultError(
-                    f"Field {node.name} is not a field of the dataclass"
-                )
-            return self.get_default_value(name_field_dict[node.name])
+            return self.get_default_value(field)
         elif role == PropertiesModel.CustomDataRoles.TreeItemRole:
             return node
         elif role == Qt.ItemDataRole.FontRole:
-            if name_field_dict.get(node.name, None) is None:
+            if field is None:
                 return None
 
-            default_val = None
-
-            default_val = self.get_default_value(name_field_dict[node.name])
-            cur_val = self._dataclass.__dict__.get(node.name, None)
+            default_val = self.get_default_value(field)
+            cur_val = self._property_tree.get(node.path)
 
             if cur_val != default_val:
                 font = QFont()
@@ -300,15 +373,11 @@ class PropertiesModel(QAbstractItemModel):
                 return font
             return None
         elif role == Qt.ItemDataRole.BackgroundRole:
-            if name_field_dict.get(node.name, None) is None:
+            if field is None:
                 return None
-            if hasattr(name_field_dict[node.name], "metadata"):
-                is_required = name_field_dict[node.name].metadata.get("required", False)
-                if (
-                    is_required
-                    and self._dataclass.__dict__.get(node.name, None) is None
-                ):
-                    return QBrush(QColor(255, 0, 0, 50))
+            is_required = field.metadata.get("required", False)
+            if is_required and self._property_tree.get(node.path) is None:
+                return QBrush(QColor(255, 0, 0, 50))
             return None
 
         return None
@@ -319,22 +388,16 @@ class PropertiesModel(QAbstractItemModel):
         value: typing.Any,
         role: int = Qt.ItemDataRole.EditRole,
     ) -> bool:
+        tree_item = index.internalPointer()
+        assert isinstance(tree_item, PropertiesTreeItem)
+
+        if tree_item.field is None:
+            return False
         if role == Qt.ItemDataRole.EditRole:
-            tree_item = index.internalPointer()
-            assert isinstance(tree_item, PropertiesTreeItem)
-            self._dataclass.__dict__[tree_item.name] = value
-            self.dataChanged.emit(index, index)
-            return True
+            return self._set_property_value(tree_item, value)
         if role == PropertiesModel.CustomDataRoles.DefaultValueRole:
-            tree_item = index.internalPointer()
-            assert isinstance(
-                tree_item, PropertiesTreeItem
-            ), "Can't get default value for non-treeitem"
-            assert (
-                tree_item.field is not None
-            ), "Can't get default value for property without field"
-            self._dataclass.__dict__[tree_item.name] = self.get_default_value(
-                tree_item.field
+            return self._set_property_value(
+                tree_item, self.get_default_value(tree_item.field)
             )
         return False
 
@@ -368,10 +431,7 @@ class PropertiesModel(QAbstractItemModel):
             return False
         tree_item = index.internalPointer()
         assert isinstance(tree_item, PropertiesTreeItem)
-        field = tree_item.field
-        if field is None:
-            return False
-        return hasattr(field, "default")
+        return tree_item.field is not None
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 2
@@ -393,85 +453,117 @@ class PropertiesModel(QAbstractItemModel):
 
 
 class GRPCPropertiesModel(PropertiesModel):
-    def __init__(self, client: Client, parent=None):
-        super().__init__(EmptyDataclass(), parent)
+    UPDATE_INTERVAL_MS = 16
+
+    def __init__(
+        self,
+        client: Client,
+        snapshot_cache: typing.Optional[GRPCSnapshotCache] = None,
+        executor: typing.Optional[GRPCRequestExecutor] = None,
+        parent=None,
+    ):
+        super().__init__(PropertyTree(), parent)
 
         self._client = client
+        self._snapshot_cache = snapshot_cache
+        self._executor = executor or GRPCRequestExecutor(parent=self)
+        self._request_key = f"GetProperties@{id(self)}"
         self._stream_reader = None
         self._object_id = None
+        self._pending_updates: dict[str, typing.Any] = {}
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._apply_pending_updates)
 
     def set_object(self, object_id: str):
         self._object_id = object_id
-
-        self._fetch_initial_state()
+        self._update_timer.stop()
+        self._pending_updates = {}
 
         if self._stream_reader:
             self._stream_reader.stop()
-
-        if self._object_id is not None:
-            self._stream_reader = StreamReader(
-                stream=self._client.object_stub.ListenPropertiesChanges(
-                    ObjectId(id=self._object_id)
-                ),
-                on_data=self._handle_properties_changes,
-            )
-        else:
             self._stream_reader = None
 
-    def _fetch_initial_state(self) -> bool:
         if self._object_id is None:
-            self.set_dataclass_instance(EmptyDataclass())
-            return False
+            self._executor.cancel(self._request_key)
+            self.set_property_tree(PropertyTree())
+            return
 
-        try:
-            response = self._client.object_stub.GetProperties(
-                ObjectId(id=self._object_id)
-            )
-        except Exception:
-            self.set_dataclass_instance(EmptyDataclass())
-            return False
+        self._executor.submit(
+            "GetProperties",
+            functools.partial(self._fetch_initial_state, object_id),
+            on_result=functools.partial(self._apply_initial_state, object_id),
+            on_error=lambda _: self.set_property_tree(PropertyTree()),
+            key=self._request_key,
+        )
+
+    def _fetch_initial_state(self, object_id: str) -> Properties:
+        if self._snapshot_cache is not None:
+            return self._snapshot_cache.get_properties(object_id)
+        return self._client.object_stub.GetProperties(ObjectId(id=object_id))
 
-        fields = []
-        values = {}
+    def _apply_initial_state(self, object_id: str, response: Properties) -> None:
+        if object_id != self._object_id:
+            return
+
+        self._apply_server_state(object_id, response)
+
+        self._stream_reader = StreamReader(
+            stream=self._client.object_stub.ListenPropertiesChanges(
+                ObjectId(id=object_id)
+            ),
+            on_data=self._handle_properties_changes,
+        )
+
+    def _apply_server_state(self, object_id: str, response: Properties) -> None:
+        if object_id != self._object_id:
+            return
+
+        property_tree = PropertyTree()
 
         for prop in response.properties:
-            base_path = prop.property_name
             base_value = convert_from_value(prop.value)
-            editable = not prop.read_only
-
             if base_value is None:
                 continue
 
-            prop_fields, prop_values = flatten_dict_field(
-                base_value,
-                base_path,
-                field_prefix=base_path,
-                editable=editable,
+            property_tree.add_root(
+                prop.property_name, base_value, editable=not prop.read_only
             )
-            fields.extend(prop_fields)
-            values.update(prop_values)
 
-        dataclass_instance = create_properties_dataclass(
-            fields, values, self._change_property
-        )
-        self.set_dataclass_instance(dataclass_instance)
-        return True
+        self.set_property_tree(property_tree)
 
-    def _change_property(
-        self, field_name: str, old_value: typing.Any, new_value: typing.Any
-    ):
-        root_field = field_name.split("_", 1)[0]
-        value_to_send = unflatten_dict_field(
-            self.get_dataclass(), root_field, [(field_name, new_value)]
+    def _handle_update_failed(self, object_id: str, error: Exception) -> None:
+        if object_id != self._object_id:
+            return
+
+        self._executor.submit(
+            "GetProperties",
+            functools.partial(self._fetch_initial_state, object_id),
+            on_result=functools.partial(self._apply_server_state, object_id),
         )
 
-        self._client.object_stub.UpdateProperty(
-            PropertyUpdate(
-                object_id=ObjectId(id=self._object_id),
-                property_name=root_field,
-                value=convert_to_value(value_to_send),
-            )
+    def _set_property_value(self, item: PropertiesTreeItem, value: typing.Any) -> bool:
+        if self.get_property_tree().get(item.path) == value:
+            return True
+
+        root_name = item.path[0]
+        value_to_send = self.get_property_tree().serialize_with(item.path, value)
+        super()._set_property_value(item, value)
+
+        self._executor.submit(
+            "UpdateProperty",
+            functools.partial(
+                self._client.object_stub.UpdateProperty,
+                PropertyUpdate(
+                    object_id=ObjectId(id=self._object_id),
+                    property_name=root_name,
+                    value=convert_to_value(value_to_send),
+                ),
+            ),
+            on_error=functools.partial(self._handle_update_failed, self._object_id),
         )
+        return True
 
     def _handle_properties_changes(self, change):
         if change.HasField("added"):
@@ -481,6 +573,7 @@ class GRPCPropertiesModel(PropertiesModel):
                 Qt.QueuedConnection,
                 Q_ARG(str, change.added.property_name),
                 Q_ARG("QVariant", change.added.value),
+                Q_ARG(bool, change.added.read_only),
             )
         elif change.HasField("removed"):
             QMetaObject.invokeMethod(
@@ -499,56 +592,28 @@ class GRPCPropertiesModel(PropertiesModel):
                 Q_ARG("QVariant", change.updated.new_value),
             )
 
-    @Slot(str, "QVariant")
-    def _handle_property_added(self, property, value):
-        pass
+    @Slot(str, "QVariant", bool)
+    def _handle_property_added(self, property, value, read_only):
+        base_value = convert_from_value(value)
+        if base_value is None:
+            return
 
-    @Slot(str, "QVariant")
+        self._apply_pending_updates()
+        self.add_root_property(property, base_value, editable=not read_only)
+
+    @Slot(str)
     def _handle_property_removed(self, property):
-        pass
+        self._apply_pending_updates()
+        self.remove_root_property(property)
 
     @Slot(str, "QVariant", "QVariant")
     def _handle_property_updated(self, property, old_value, new_value):
-        instance = self.get_dataclass()
-        observed_dict: ObservableDict = getattr(instance, "__dict__")
-        updated_value = convert_from_value(new_value)
-
-        def flatten(prefix: str, value):
-            result = {}
-            if isinstance(value, dict):
-                for k, v in value.items():
-                    nested = flatten(f"{prefix}_{k}" if prefix else k, v)
-                    result.update(nested)
-            else:
-                result[prefix] = value
-            return result
-
-        flat_updates = flatten(property, updated_value)
-
-        for k, v in flat_updates.items():
-            if k in observed_dict:
-                index = self._find_index(k)
-                observed_dict._super_setitem(k, v)
-                self.dataChanged.emit(
-                    self.index(index.row(), 0, index.parent()),
-                    self.index(index.row(), 1, index.parent()),
-                )
-
-    def _find_index(
-        self, property_name: str, parent: QModelIndex = QModelIndex()
-    ) -> QModelIndex | None:
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if not index.isValid():
-                continue
-
-            field = index.data(PropertiesModel.CustomDataRoles.FieldRole)
-            if field is not None:
-                if field.name == property_name:
-                    return index
-
-            child_index = self._find_index(property_name, parent=index)
-            if child_index is not None:
-                return child_index
-
-        return None
+        self._pending_updates[property] = convert_from_value(new_value)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _apply_pending_updates(self):
+        self._update_timer.stop()
+        pending_updates, self._pending_updates = self._pending_updates, {}
+        if pending_updates:
+            self.update_root_properties(pending_updates)
@@ -1,6 +1,8 @@
+import abc
 import math
 import numbers
 import typing
+import re
 
 from PySide6.QtCore import (
     Qt,
@@ -11,10 +13,125 @@ from PySide6.QtCore import (
     QSortFilterProxyModel,
 )
 
-
 FilterFunctionType = typing.Callable[
     [int, QModelIndex | QPersistentModelIndex, QAbstractItemModel], bool
 ]
+CompiledFilterType = typing.Callable[[typing.Any], bool]
+
+
+class ColumnFilter(abc.ABC):
+    def __init__(
+        self,
+        columns: int | list[int],
+        role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole,
+    ):
+        self.columns = [columns] if isinstance(columns, int) else list(columns)
+        self.role = role
+
+    @abc.abstractmethod
+    def compile(self) -> CompiledFilterType:
+        raise NotImplementedError()
+
+
+class PredicateFilter(ColumnFilter):
+    def __init__(
+        self,
+        columns: int | list[int],
+        predicate: CompiledFilterType,
+        role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole,
+    ):
+        super().__init__(columns, role)
+        self.predicate = predicate
+
+    def compile(self) -> CompiledFilterType:
+        return self.predicate
+
+
+class SubstringFilter(ColumnFilter):
+    def __init__(
+        self,
+        text: str,
+        columns: int | list[int],
+        case_sensitive: bool = False,
+        role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole,
+    ):
+        super().__init__(columns, role)
+        self.text = text
+        self.case_sensitive = case_sensitive
+
+    def compile(self) -> CompiledFilterType:
+        if self.case_sensitive:
+            text = self.text
+            return lambda value: value is not None and text in str(value)
+
+        text = self.text.lower()
+        return lambda value: value is not None and text in str(value).lower()
+
+
+class RegexFilter(ColumnFilter):
+    def __init__(
+        self,
+        pattern: str,
+        columns: int | list[int],
+        flags: re.RegexFlag = re.IGNORECASE,
+        role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole,
+    ):
+        super().__init__(columns, role)
+        self.pattern = pattern
+        self.flags = flags
+
+    def compile(self) -> CompiledFilterType:
+        search = re.compile(self.pattern, self.flags).search
+        return lambda value: value is not None and search(str(value)) is not None
+
+
+class NumericRangeFilter(ColumnFilter):
+    def __init__(
+        self,
+        columns: int | list[int],
+        minimum: float | None = None,
+        maximum: float | None = None,
+        role: Qt.ItemDataRole = Qt.ItemDataRole.EditRole,
+    ):
+        super().__init__(columns, role)
+        self.minimum = -math.inf if minimum is None else minimum
+        self.maximum = math.inf if maximum is None else maximum
+
+    def compile(self) -> CompiledFilterType:
+        minimum, maximum = self.minimum, self.maximum
+        return lambda value: (
+            isinstance(value, numbers.Number)
+            and not isinstance(value, bool)
+            and minimum <= value <= maximum
+        )
+
+
+class FilterStats:
+    def __init__(self):
+        self.evaluated = 0
+        self.rejected = 0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.evaluated if self.evaluated else 0.0
+
+    def __repr__(self):
+        return f"<FilterStats evaluated={self.evaluated} rejected={self.rejected}>"
+
+
+def _column_values(
+    model: QAbstractItemModel,
+    column: int,
+    parent: QModelIndex | QPersistentModelIndex,
+    role: Qt.ItemDataRole,
+) -> list[typing.Any]:
+    column_data = getattr(model, "column_data", None)
+    if column_data is not None:
+        return column_data(column, parent, role)
+    return [
+        model.index(row, column, parent).data(role)
+        for row in range(model.rowCount(parent))
+    ]
 
 
 class MultiColumnSortFilterProxyModel(QSortFilterProxyModel):
@@ -22,38 +139,61 @@ class MultiColumnSortFilterProxyModel(QSortFilterProxyModel):
         super().__init__(parent)
         self._sort_columns: list[int] = []
         self._sort_orders: list[Qt.SortOrder] = []
+        self._uniform_sort_order: Qt.SortOrder | None = None
+        self._sort_key_cache: dict[tuple[int, int, int], list[tuple]] = {}
+        self._source_connections: list[tuple] = []
         self._filter_functions: typing.Dict[str, FilterFunctionType] = {}
+        self._column_filters: dict[str, tuple[ColumnFilter, CompiledFilterType]] = {}
+        self._filter_stats: dict[str, FilterStats] = {}
+        self._accepted_rows_cache: dict[QPersistentModelIndex, list[bool]] = {}
 
-    def _val_less_than(self, leftval, rightval):
-        if leftval is None or (
-            isinstance(leftval, numbers.Number) and math.isnan(leftval)
-        ):
-            return True
-        elif rightval is None or (
-            isinstance(rightval, numbers.Number) and math.isnan(rightval)
-        ):
-            return False
-        return leftval < rightval
+    @staticmethod
+    def _sort_key_value(value: typing.Any) -> tuple:
+        if value is None or (isinstance(value, numbers.Number) and math.isnan(value)):
+            return (0,)
+        return (1, value)
+
+    @staticmethod
+    def _parent_key(parent: QModelIndex) -> tuple[int, int, int]:
+        return parent.row(), parent.column(), parent.internalId()
+
+    def _sort_keys(self, parent: QModelIndex) -> list[tuple]:
+        parent_key = self._parent_key(parent)
+        keys = self._sort_key_cache.get(parent_key)
+        if keys is None:
+            columns = [
+                _column_values(
+                    self.sourceModel(), column, parent, Qt.ItemDataRole.EditRole
+                )
+                for column in self._sort_columns
+            ]
+            keys = [
+                tuple(self._sort_key_value(value) for value in row_values)
+                for row_values in zip(*columns)
+            ]
+            self._sort_key_cache[parent_key] = keys
+        return keys
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         if len(self._sort_columns) == 0:
             return super().lessThan(left, right)
-        else:
-            for column, order in zip(self._sort_columns, self._sort_orders):
-                left = self.sourceModel().index(left.row(), column)
-                right = self.sourceModel().index(right.row(), column)
-                leftval = left.data(role=Qt.ItemDataRole.EditRole)
-                rightval = right.data(role=Qt.ItemDataRole.EditRole)
-                if self._val_less_than(leftval, rightval) == self._val_less_than(
-                    leftval=rightval, rightval=leftval
-                ):
-                    continue
-                else:
-                    return (
-                        self._val_less_than(leftval, rightval)
-                        if order == Qt.SortOrder.AscendingOrder
-                        else self._val_less_than(leftval, rightval)
-                    )
+
+        keys = self._sort_keys(left.parent())
+        left_key = keys[left.row()]
+        right_key = keys[right.row()]
+        if self._uniform_sort_order is not None:
+            if self._uniform_sort_order == Qt.SortOrder.AscendingOrder:
+                return left_key < right_key
+            return right_key < left_key
+
+        for left_value, right_value, order in zip(
+            left_key, right_key, self._sort_orders
+        ):
+            if left_value == right_value:
+                continue
+            if order == Qt.SortOrder.AscendingOrder:
+                return left_value < right_value
+            return right_value < left_value
 
         return False
 
@@ -64,8 +204,57 @@ class MultiColumnSortFilterProxyModel(QSortFilterProxyModel):
             orders = [Qt.SortOrder.AscendingOrder] * len(columns)
         self._sort_columns = columns
         self._sort_orders = orders
+        self._uniform_sort_order = orders[0] if len(set(orders)) == 1 else None
+        self.clear_sort_key_cache()
         self.invalidate()
 
+    def clear_sort_key_cache(self) -> None:
+        self._sort_key_cache.clear()
+
+    def _clear_source_caches(self) -> None:
+        self._sort_key_cache.clear()
+        self._accepted_rows_cache.clear()
+
+    def _on_source_rows_about_to_be_inserted(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        self._accepted_rows_cache.pop(QPersistentModelIndex(parent), None)
+        self._sort_key_cache.pop(self._parent_key(parent), None)
+
+    def _on_source_data_changed(
+        self,
+        top_left: QModelIndex,
+        bottom_right: QModelIndex,
+        roles: list[int] | None = None,
+    ) -> None:
+        self._accepted_rows_cache.pop(QPersistentModelIndex(top_left.parent()), None)
+        if roles and Qt.ItemDataRole.EditRole not in roles:
+            return
+        self._sort_key_cache.pop(self._parent_key(top_left.parent()), None)
+
+    def setSourceModel(self, source_model: QAbstractItemModel | None) -> None:
+        for signal, slot in self._source_connections:
+            signal.disconnect(slot)
+        self._source_connections = []
+        self._clear_source_caches()
+
+        if source_model is not None:
+            self._source_connections = [
+                (source_model.dataChanged, self._on_source_data_changed),
+                (
+                    source_model.rowsAboutToBeInserted,
+                    self._on_source_rows_about_to_be_inserted,
+                ),
+                (source_model.rowsAboutToBeRemoved, self._clear_source_caches),
+                (source_model.rowsAboutToBeMoved, self._clear_source_caches),
+                (source_model.layoutAboutToBeChanged, self._clear_source_caches),
+                (source_model.modelAboutToBeReset, self._clear_source_caches),
+            ]
+            for signal, slot in self._source_connections:
+                signal.connect(slot)
+
+        super().setSourceModel(source_model)
+
     def set_filter_function(self, function_name: str, function: FilterFunctionType):
         invalidate = False
         if function_name in self._filter_functions:
@@ -81,11 +270,98 @@ class MultiColumnSortFilterProxyModel(QSortFilterProxyModel):
     def get_filter_functions(self) -> typing.Dict[str, FilterFunctionType]:
         return self._filter_functions
 
+    def set_column_filter(self, filter_name: str, column_filter: ColumnFilter):
+        self._column_filters[filter_name] = (column_filter, column_filter.compile())
+        self._filter_stats[filter_name] = FilterStats()
+        self._accepted_rows_cache.clear()
+        self.invalidateFilter()
+
+    def remove_column_filter(self, filter_name: str):
+        if filter_name not in self._column_filters:
+            return
+        del self._column_filters[filter_name]
+        del self._filter_stats[filter_name]
+        self._accepted_rows_cache.clear()
+        self.invalidateFilter()
+
+    def clear_column_filters(self):
+        self._column_filters = {}
+        self._filter_stats = {}
+        self._accepted_rows_cache.clear()
+        self.invalidateFilter()
+
+    def get_column_filters(self) -> dict[str, ColumnFilter]:
+        return {name: entry[0] for name, entry in self._column_filters.items()}
+
+    def get_filter_stats(self) -> dict[str, FilterStats]:
+        return self._filter_stats
+
+    def _evaluate_column_filters(
+        self, source_parent: QModelIndex | QPersistentModelIndex
+    ) -> list[bool]:
+        source_model = self.sourceModel()
+        row_count = source_model.rowCount(source_parent)
+        candidates = list(range(row_count))
+        column_values: dict[tuple[int, int], list[typing.Any]] = {}
+
+        filter_names = sorted(
+            self._column_filters,
+            key=lambda name: self._filter_stats[name].rejection_rate,
+            reverse=True,
+        )
+        for filter_name in filter_names:
+            if not candidates:
+                break
+
+            column_filter, predicate = self._column_filters[filter_name]
+            arrays = []
+            for column in column_filter.columns:
+                key = (column, column_filter.role)
+                if key not in column_values:
+                    column_values[key] = _column_values(
+                        source_model, column, source_parent, column_filter.role
+                    )
+                arrays.append(column_values[key])
+
+            if len(arrays) == 1:
+                values = arrays[0]
+                survivors = [row for row in candidates if predicate(values[row])]
+            else:
+                survivors = [
+                    row
+                    for row in candidates
+                    if any(predicate(values[row]) for values in arrays)
+                ]
+
+            stats = self._filter_stats[filter_name]
+            stats.evaluated += len(candidates)
+            stats.rejected += len(candidates) - len(survivors)
+            candidates = survivors
+
+        accepted = [False] * row_count
+        for row in candidates:
+            accepted[row] = True
+        return accepted
+
+    def _column_filters_accept_row(
+        self, source_row: int, source_parent: QModelIndex | QPersistentModelIndex
+    ) -> bool:
+        parent_key = QPersistentModelIndex(source_parent)
+        accepted = self._accepted_rows_cache.get(parent_key)
+        if accepted is None or source_row >= len(accepted):
+            accepted = self._evaluate_column_filters(source_parent)
+            self._accepted_rows_cache[parent_key] = accepted
+        return accepted[source_row]
+
     def filterAcceptsRow(
         self, source_row: int, source_parent: QModelIndex | QPersistentModelIndex
     ) -> bool:
         if not super().filterAcceptsRow(source_row, source_parent):
             return False
+        if self._column_filters and not self._column_filters_accept_row(
+            source_row, source_parent
+        ):
+            return False
         for function in self._filter_functions.values():
             try:
                 if not function(source_row, source_parent, self.sourceModel()):
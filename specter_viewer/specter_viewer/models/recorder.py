@@ -1,16 +1,35 @@
-import typing
+import os
 import abc
-
-from PySide6.QtCore import Qt, QObject, Signal, QAbstractItemModel, QModelIndex
+import time
+import array
+import struct
+import typing
+import tempfile
+import threading
+import collections
+
+from PySide6.QtCore import (
+    Qt,
+    QObject,
+    Signal,
+    Slot,
+    QTimer,
+    QAbstractItemModel,
+    QAbstractListModel,
+    QModelIndex,
+)
 from PySide6.QtWidgets import QStyle, QApplication
 
 from google.protobuf import empty_pb2
 
+from specter.proto.specter_pb2 import RecorderCommand
 from specter.client import Client, StreamReader
 
+LINE_CACHE_SIZE = 1000
+
 
 class BaseConsoleItem(QObject):
-    loadedLinesChanged = Signal(list, int)
+    lineCountChanged = Signal(int)
     dataChanged = Signal()
 
     @abc.abstractmethod
@@ -18,9 +37,16 @@ class BaseConsoleItem(QObject):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def get_current_line_list(self) -> typing.Tuple[list[str], int]:
+    def line_count(self) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def line(self, index: int) -> str:
         raise NotImplementedError()
 
+    def close(self) -> None:
+        pass
+
 
 EVENT_FORMATTERS = {
     "context_menu_opened": lambda ev: f"ContextMenuOpened {ev.object_query.query}",
@@ -42,22 +68,123 @@ EVENT_FORMATTERS = {
     "window_minimized": lambda ev: f"WindowMinimized {ev.object_query.query}",
     "window_maximized": lambda ev: f"WindowMaximized {ev.object_query.query}",
     "window_closed": lambda ev: f"WindowClosed {ev.object_query.query}",
+    "idle_gap": lambda ev: f"IdleGap duration={ev.duration:.1f}s",
 }
 
 
+def format_event(action: RecorderCommand) -> str:
+    which = action.WhichOneof("event")
+    assert which
+
+    formatter = EVENT_FORMATTERS.get(which, lambda ev: f"Unknown event: {which}")
+    return formatter(getattr(action, which))
+
+
+class RecorderEventStore(typing.Sequence[RecorderCommand]):
+    RECORD_HEADER = struct.Struct("<I")
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(prefix="specter-recording-")
+        self._offsets = array.array("Q")
+        self._size = 0
+        self._lock = threading.Lock()
+        self._lines: collections.OrderedDict[int, str] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return RecorderCommand.FromString(self._read(index))
+
+    def __iter__(self) -> typing.Iterator[RecorderCommand]:
+        with self._lock:
+            size = self._size
+
+        offset = 0
+        while offset < size:
+            chunk = os.pread(
+                self._file.fileno(), min(self.READ_CHUNK_SIZE, size - offset), offset
+            )
+            view = memoryview(chunk)
+            position = 0
+            while position + self.RECORD_HEADER.size <= len(chunk):
+                (length,) = self.RECORD_HEADER.unpack_from(chunk, position)
+                end = position + self.RECORD_HEADER.size + length
+                if end > len(chunk) and position > 0:
+                    break
+                if end > len(chunk):
+                    chunk = os.pread(self._file.fileno(), end, offset)
+                    view = memoryview(chunk)
+                yield RecorderCommand.FromString(
+                    view[position + self.RECORD_HEADER.size : end]
+                )
+                position = end
+            offset += position
+
+    def append(self, action: RecorderCommand) -> int:
+        payload = action.SerializeToString()
+        record = self.RECORD_HEADER.pack(len(payload)) + payload
+
+        with self._lock:
+            os.pwrite(self._file.fileno(), record, self._size)
+            self._offsets.append(self._size + self.RECORD_HEADER.size)
+            self._size += len(record)
+            return len(self._offsets) - 1
+
+    def line(self, index: int) -> str:
+        with self._lock:
+            line = self._lines.get(index)
+            if line is not None:
+                self._lines.move_to_end(index)
+                return line
+
+        line = format_event(self[index])
+
+        with self._lock:
+            self._lines[index] = line
+            while len(self._lines) > LINE_CACHE_SIZE:
+                self._lines.popitem(last=False)
+        return line
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _read(self, index: int) -> bytes:
+        if index < 0:
+            index += len(self._offsets)
+
+        with self._lock:
+            offset = self._offsets[index]
+            end = (
+                self._offsets[index + 1] - self.RECORD_HEADER.size
+                if index + 1 < len(self._offsets)
+                else self._size
+            )
+        return os.pread(self._file.fileno(), end - offset, offset)
+
+
 class GRPCRecorderConsoleItem(BaseConsoleItem):
+    _linesAppended = Signal()
+
     def __init__(self, id: str, client: Client, parent=None):
         super().__init__(parent)
         self._id = id
-        self._lines: list[str] = []
-        self._events: list[typing.Any] = []
+        self._events = RecorderEventStore()
         self._client = client
         self._stream_reader = None
+        self._notify_pending = threading.Event()
+        self._linesAppended.connect(self._notify_line_count)
+
+    def line_count(self) -> int:
+        return len(self._events)
 
-    def get_current_line_list(self) -> typing.Tuple[list[str], int]:
-        return self._lines, 0
+    def line(self, index: int) -> str:
+        return self._events.line(index)
 
-    def get_events(self) -> list[typing.Any]:
+    def get_events(self) -> RecorderEventStore:
         return self._events
 
     def data(self, role: Qt.ItemDataRole, column: int = 0) -> typing.Any:
@@ -81,18 +208,82 @@ class GRPCRecorderConsoleItem(BaseConsoleItem):
     def is_running(self) -> bool:
         return self._stream_reader is not None
 
-    def handle_recorded_action(self, action):
-        which = action.WhichOneof("event")
-        assert which
+    def close(self) -> None:
+        self.stop()
+        self._events.close()
 
-        ev = getattr(action, which)
-        formatter = EVENT_FORMATTERS.get(which, lambda ev: f"Unknown event: {which}")
-        text = formatter(ev)
+    def handle_recorded_action(self, action):
+        assert action.WhichOneof("event")
 
+        if not action.timestamp:
+            action.timestamp = time.time()
         self._events.append(action)
-        self._lines.append(text)
+        if not self._notify_pending.is_set():
+            self._notify_pending.set()
+            self._linesAppended.emit()
 
-        self.loadedLinesChanged.emit([text], len(self._lines))
+    @Slot()
+    def _notify_line_count(self):
+        self._notify_pending.clear()
+        self.lineCountChanged.emit(len(self._events))
+
+
+class ConsoleLinesModel(QAbstractListModel):
+    def __init__(self, update_interval: float = 0.05, parent=None):
+        super().__init__(parent)
+        self._item: typing.Optional[BaseConsoleItem] = None
+        self._row_count = 0
+        self._pending_row_count = 0
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(int(update_interval * 1000))
+        self._update_timer.timeout.connect(self._apply_pending_rows)
+
+    def item(self) -> typing.Optional[BaseConsoleItem]:
+        return self._item
+
+    def set_item(self, item: typing.Optional[BaseConsoleItem]):
+        if self._item is not None:
+            self._item.lineCountChanged.disconnect(self._on_line_count_changed)
+        self._update_timer.stop()
+
+        self.beginResetModel()
+        self._item = item
+        self._row_count = item.line_count() if item is not None else 0
+        self._pending_row_count = self._row_count
+        self.endResetModel()
+
+        if item is not None:
+            item.lineCountChanged.connect(self._on_line_count_changed)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def data(
+        self, index: QModelIndex, role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole
+    ):
+        if not index.isValid() or self._item is None:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._item.line(index.row())
+        return None
+
+    @Slot(int)
+    def _on_line_count_changed(self, count: int):
+        self._pending_row_count = max(self._pending_row_count, count)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _apply_pending_rows(self):
+        if self._pending_row_count <= self._row_count:
+            return
+
+        self.beginInsertRows(
+            QModelIndex(), self._row_count, self._pending_row_count - 1
+        )
+        self._row_count = self._pending_row_count
+        self.endInsertRows()
 
 
 class ConsoleModel(QAbstractItemModel):
@@ -103,16 +294,26 @@ class ConsoleModel(QAbstractItemModel):
         super().__init__(*args, **kwargs)
         self._console_pixmap = QStyle.StandardPixmap.SP_TitleBarMaxButton
         self._console_icon = QApplication.style().standardIcon(self._console_pixmap)
-        self._item_list = []
+        self._item_list: list[BaseConsoleItem] = []
+        self._item_rows: dict[BaseConsoleItem, int] = {}
+        self._stale_row: typing.Optional[int] = None
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 3
 
     def removeRow(self, row: int, parent: QModelIndex) -> bool:
+        if parent.isValid() or not 0 <= row < len(self._item_list):
+            return False
+
         self.beginRemoveRows(parent, row, row)
-        del self._item_list[row]
+        item = self._item_list.pop(row)
+        del self._item_rows[item]
+        if self._stale_row is None or row < self._stale_row:
+            self._stale_row = row
+        item.dataChanged.disconnect(self._on_item_data_changed)
         self.endRemoveRows()
-        self.modelReset.emit()
+
+        item.close()
         return True
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -133,16 +334,30 @@ class ConsoleModel(QAbstractItemModel):
             return QModelIndex()
 
     def append_row(self, item: BaseConsoleItem):
-        self.beginInsertRows(QModelIndex(), self.rowCount(), self.rowCount())
+        row = len(self._item_list)
+        self.beginInsertRows(QModelIndex(), row, row)
         self._item_list.append(item)
-        item.dataChanged.connect(
-            lambda *_: self.dataChanged.emit(
-                self.index(self.rowCount() - 1, 0), self.index(self.rowCount() - 1, 2)
-            )
-        )
-
+        self._item_rows[item] = row
+        item.dataChanged.connect(self._on_item_data_changed)
         self.endInsertRows()
 
+    def row_of(self, item: BaseConsoleItem) -> int:
+        if self._stale_row is not None:
+            for row in range(self._stale_row, len(self._item_list)):
+                self._item_rows[self._item_list[row]] = row
+            self._stale_row = None
+        return self._item_rows.get(item, -1)
+
+    @Slot()
+    def _on_item_data_changed(self):
+        row = self.row_of(self.sender())
+        if row < 0:
+            return
+
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1)
+        )
+
     def add_item(self, item: BaseConsoleItem):
         self.append_row(item)
 
@@ -162,7 +377,7 @@ class ConsoleModel(QAbstractItemModel):
             return self._console_icon
         elif role == ConsoleModel.ConsoleItemRole:
             return item
-        elif role == ConsoleModel.ConsoleItemRole:
+        elif role == ConsoleModel.RecordedEventsRole:
             if isinstance(item, GRPCRecorderConsoleItem):
                 return item.get_events()
             return []
@@ -0,0 +1,148 @@
+import time
+import bisect
+import typing
+import threading
+import concurrent.futures
+
+import grpc
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+
+class LatencyHistogram:
+    BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        threshold = percentile / 100 * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                if bucket < len(self.BUCKETS_MS):
+                    return min(self.BUCKETS_MS[bucket], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+
+class RequestHandle:
+    def __init__(self, name: str, key: typing.Optional[str]):
+        self.name = name
+        self.key = key
+        self._cancelled = threading.Event()
+        self._future: typing.Optional[concurrent.futures.Future] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+
+
+class GRPCRequestExecutor(QObject):
+    latency_recorded = Signal(str)
+    request_failed = Signal(str, str)
+    _request_finished = Signal(object)
+
+    def __init__(self, max_workers: int = 4, parent: typing.Optional[QObject] = None):
+        super().__init__(parent)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="grpc-request"
+        )
+        self._lock = threading.Lock()
+        self._latest: dict[str, RequestHandle] = {}
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._request_finished.connect(self._on_request_finished)
+
+    def submit(
+        self,
+        name: str,
+        call: typing.Callable[[], typing.Any],
+        on_result: typing.Optional[typing.Callable[[typing.Any], None]] = None,
+        on_error: typing.Optional[typing.Callable[[Exception], None]] = None,
+        key: typing.Optional[str] = None,
+    ) -> RequestHandle:
+        handle = RequestHandle(name, key)
+
+        if key is not None:
+            with self._lock:
+                superseded = self._latest.get(key)
+                self._latest[key] = handle
+            if superseded is not None:
+                superseded.cancel()
+
+        handle._future = self._executor.submit(
+            self._run, handle, call, on_result, on_error
+        )
+        return handle
+
+    def cancel(self, key: str) -> None:
+        with self._lock:
+            handle = self._latest.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+    def get_histograms(self) -> dict[str, LatencyHistogram]:
+        with self._lock:
+            return dict(self._histograms)
+
+    def _run(self, handle, call, on_result, on_error) -> None:
+        if handle.cancelled:
+            return
+
+        result, error = None, None
+        start = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            error = e
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            histogram = self._histograms.setdefault(handle.name, LatencyHistogram())
+            histogram.record(latency_ms)
+        self.latency_recorded.emit(handle.name)
+
+        self._request_finished.emit((handle, result, error, on_result, on_error))
+
+    @Slot(object)
+    def _on_request_finished(self, payload) -> None:
+        handle, result, error, on_result, on_error = payload
+        if handle.cancelled:
+            return
+
+        if handle.key is not None:
+            with self._lock:
+                if self._latest.get(handle.key) is handle:
+                    del self._latest[handle.key]
+
+        if error is not None:
+            if isinstance(error, grpc.RpcError):
+                self.request_failed.emit(handle.name, error.details())
+            else:
+                self.request_failed.emit(handle.name, str(error))
+            if on_error:
+                on_error(error)
+        elif on_result:
+            on_result(result)
@@ -0,0 +1,245 @@
+import typing
+import threading
+import collections
+import concurrent.futures
+
+from PySide6.QtCore import QObject, Signal
+
+from specter.proto.specter_pb2 import (
+    ObjectId,
+    Property,
+    Properties,
+    Methods,
+    PropertyChange,
+)
+from specter.client import Client, StreamReader
+
+
+class SnapshotStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ObjectSnapshot:
+    def __init__(self, object_id: str):
+        self.object_id = object_id
+        self.methods = Methods()
+        self._properties: collections.OrderedDict[str, Property] = (
+            collections.OrderedDict()
+        )
+        self._pending_changes: typing.Optional[list[PropertyChange]] = []
+        self._lock = threading.Lock()
+        self._stream_reader = None
+
+    def properties(self) -> Properties:
+        with self._lock:
+            return Properties(properties=list(self._properties.values()))
+
+    def load(self, properties: Properties, methods: Methods) -> None:
+        with self._lock:
+            self.methods = methods
+            self._properties = collections.OrderedDict(
+                (prop.property_name, prop) for prop in properties.properties
+            )
+            pending_changes, self._pending_changes = self._pending_changes, None
+            for change in pending_changes:
+                self._apply_change(change)
+
+    def apply_change(self, change: PropertyChange) -> None:
+        with self._lock:
+            if self._pending_changes is not None:
+                self._pending_changes.append(change)
+            else:
+                self._apply_change(change)
+
+    def _apply_change(self, change: PropertyChange) -> None:
+        if change.HasField("added"):
+            self._properties[change.added.property_name] = Property(
+                property_name=change.added.property_name,
+                value=change.added.value,
+                read_only=change.added.read_only,
+            )
+        elif change.HasField("removed"):
+            self._properties.pop(change.removed.property_name, None)
+        elif change.HasField("updated"):
+            prop = self._properties.get(change.updated.property_name)
+            if prop is not None:
+                self._properties[prop.property_name] = Property(
+                    property_name=prop.property_name,
+                    value=change.updated.new_value,
+                    read_only=prop.read_only,
+                )
+
+    def listen(self, client: Client) -> None:
+        self._stream_reader = StreamReader(
+            stream=client.object_stub.ListenPropertiesChanges(
+                ObjectId(id=self.object_id)
+            ),
+            on_data=self.apply_change,
+        )
+
+    def close(self) -> None:
+        if self._stream_reader:
+            self._stream_reader.stop()
+            self._stream_reader = None
+
+
+class GRPCSnapshotCache(QObject):
+    stats_changed = Signal()
+
+    def __init__(
+        self,
+        client: Client,
+        capacity: int = 16,
+        max_workers: int = 2,
+        parent: typing.Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self._client = client
+        self._capacity = capacity
+        self._snapshots: collections.OrderedDict[str, ObjectSnapshot] = (
+            collections.OrderedDict()
+        )
+        self._in_flight: dict[str, concurrent.futures.Future] = {}
+        self._last_lookup: typing.Optional[str] = None
+        self._lock = threading.Lock()
+        self._stats = SnapshotStats()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="snapshot-prefetch"
+        )
+
+    def get_properties(self, object_id: str) -> Properties:
+        return self._get_snapshot(object_id).properties()
+
+    def get_methods(self, object_id: str) -> Methods:
+        return self._get_snapshot(object_id).methods
+
+    def prefetch(self, object_ids: typing.Iterable[str]) -> None:
+        with self._lock:
+            object_ids = [
+                object_id
+                for object_id in dict.fromkeys(object_ids)
+                if object_id
+                and object_id not in self._snapshots
+                and object_id not in self._in_flight
+            ][: max(self._capacity // 2, 1)]
+
+            futures = {}
+            for object_id in object_ids:
+                futures[object_id] = concurrent.futures.Future()
+                self._in_flight[object_id] = futures[object_id]
+
+        for object_id, future in futures.items():
+            self._executor.submit(self._load_snapshot, object_id, future, True)
+
+    def invalidate(self, object_id: str) -> None:
+        with self._lock:
+            snapshot = self._snapshots.pop(object_id, None)
+
+        if snapshot:
+            snapshot.close()
+            self.stats_changed.emit()
+
+    def clear(self) -> None:
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+            self._snapshots.clear()
+
+        for snapshot in snapshots:
+            snapshot.close()
+        self.stats_changed.emit()
+
+    def get_stats(self) -> SnapshotStats:
+        return self._stats
+
+    def cached_objects(self) -> list[str]:
+        with self._lock:
+            return list(self._snapshots.keys())
+
+    def _get_snapshot(self, object_id: str) -> ObjectSnapshot:
+        owner = False
+        with self._lock:
+            counted = object_id != self._last_lookup
+            self._last_lookup = object_id
+            snapshot = self._snapshots.get(object_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(object_id)
+                if counted:
+                    self._stats.hits += 1
+            else:
+                future = self._in_flight.get(object_id)
+                if future is None:
+                    owner = True
+                    future = concurrent.futures.Future()
+                    self._in_flight[object_id] = future
+                if counted:
+                    self._stats.misses += 1
+
+        if snapshot is None:
+            if owner:
+                self._load_snapshot(object_id, future)
+            try:
+                snapshot = future.result()
+            except Exception:
+                if owner:
+                    raise
+                return self._get_snapshot(object_id)
+
+        self.stats_changed.emit()
+        return snapshot
+
+    def _load_snapshot(
+        self,
+        object_id: str,
+        future: concurrent.futures.Future,
+        prefetched: bool = False,
+    ) -> None:
+        snapshot = ObjectSnapshot(object_id)
+        snapshot.listen(self._client)
+        try:
+            self._fetch_snapshot(snapshot)
+        except Exception as e:
+            snapshot.close()
+            with self._lock:
+                self._in_flight.pop(object_id, None)
+            future.set_exception(e)
+            return
+
+        self._store_snapshot(snapshot)
+        with self._lock:
+            self._in_flight.pop(object_id, None)
+            if prefetched:
+                self._stats.prefetched += 1
+
+        future.set_result(snapshot)
+        self.stats_changed.emit()
+
+    def _fetch_snapshot(self, snapshot: ObjectSnapshot) -> None:
+        object_id_msg = ObjectId(id=snapshot.object_id)
+        properties = self._client.object_stub.GetProperties(object_id_msg)
+        methods = self._client.object_stub.GetMethods(object_id_msg)
+        snapshot.load(properties, methods)
+
+    def _store_snapshot(self, snapshot: ObjectSnapshot) -> None:
+        evicted = []
+        with self._lock:
+            previous = self._snapshots.pop(snapshot.object_id, None)
+            if previous is not None:
+                evicted.append(previous)
+
+            self._snapshots[snapshot.object_id] = snapshot
+            while len(self._snapshots) > self._capacity:
+                _, oldest = self._snapshots.popitem(last=False)
+                evicted.append(oldest)
+                self._stats.evicted += 1
+
+        for evicted_snapshot in evicted:
+            evicted_snapshot.close()
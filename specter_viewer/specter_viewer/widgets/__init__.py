@@ -6,6 +6,8 @@ from specter_viewer.widgets.recorder import RecorderDock
 from specter_viewer.widgets.editor import EditorDock
 from specter_viewer.widgets.viewer import ViewerWidget
 from specter_viewer.widgets.toolbar import ToolBar
+from specter_viewer.widgets.snapshots import SnapshotCacheDock
+from specter_viewer.widgets.requests import RequestStatsDock
 
 __all__ = [
     "ProcessTable",
@@ -16,4 +18,6 @@ __all__ = [
     "EditorDock",
     "ViewerWidget",
     "ToolBar",
+    "SnapshotCacheDock",
+    "RequestStatsDock",
 ]
@@ -11,8 +11,9 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QToolButton,
     QApplication,
+    QStyle,
 )
-from PySide6.QtCore import Qt, QObject, QSize, Signal, QRect
+from PySide6.QtCore import Qt, QObject, QSize, Signal, QRect, QSignalBlocker
 from PySide6.QtGui import (
     QSyntaxHighlighter,
     QTextCharFormat,
@@ -37,11 +38,13 @@ from pygments.styles import get_style_by_name
 
 from specter.client import Client
 from specter_debugger import DebuggerClient
+from specter_debugger.proto import specter_pb2 as debugger_pb2
 
 from specter_viewer.constants import (
     SPECTER_VIEVER_DEBUGGER_PATH,
     SPECTER_VIEVER_DEBUGGER_HOST,
     SPECTER_VIEVER_DEBUGGER_PORT,
+    SPECTER_VIEVER_DEBUGGER_LINE_EVENT_RATE,
 )
 
 
@@ -51,7 +54,7 @@ def pygments_style_to_qt(style_name="lightbulb"):
     qt_styles = {}
     for token, style_def in style.styles.items():
         if not style_def or style_def.strip() == "":
-            continue 
+            continue
         fmt = QTextCharFormat()
         parts = style_def.split()
         for p in parts:
@@ -82,12 +85,12 @@ class PythonHighlighter(QSyntaxHighlighter):
         return PythonLexer()
 
     def _create_format_getter(self):
-        def is_dark()->bool:
+        def is_dark() -> bool:
             app = QApplication.instance()
             if hasattr(app, "styleHints") and hasattr(app.styleHints(), "colorScheme"):
                 return app.styleHints().colorScheme().value == 2
             return False
-            
+
         return pygments_style_to_qt("lightbulb" if is_dark() else "default")
 
     def highlightBlock(self, text):
@@ -97,7 +100,6 @@ class PythonHighlighter(QSyntaxHighlighter):
             if fmt:
                 self.setFormat(pos, len(value), fmt)
             pos += len(value)
-    
 
 
 class LineNumberArea(QWidget):
@@ -376,13 +378,33 @@ class SpecterDebugger(QObject):
 
             session = self._client.create_session()
             self._session_id = session.id
-            self._client.listen_events(self._session_id, self._on_event)
+            self._client.configure(
+                self._session_id,
+                line_event_mode=debugger_pb2.LINE_EVENT_MODE_SAMPLED,
+                line_event_rate=SPECTER_VIEVER_DEBUGGER_LINE_EVENT_RATE,
+            )
+            self._client.listen_event_batches(self._session_id, self._on_events)
             self._client.set_source(
                 self._session_id, SOURCE_CODE_FILE_NAME, "".encode("utf-8")
             )
 
         return self._client
 
+    def _on_events(self, events):
+        last_line_event = max(
+            (
+                index
+                for index, event in enumerate(events)
+                if event.HasField("line_changed_event")
+            ),
+            default=-1,
+        )
+
+        for index, event in enumerate(events):
+            if event.HasField("line_changed_event") and index != last_line_event:
+                continue
+            self._on_event(event)
+
     def _on_event(self, event):
         event_type = event.WhichOneof("event")
 
@@ -424,6 +446,14 @@ class SpecterDebugger(QObject):
     def resume(self):
         self.client.resume(self._session_id)
 
+    @returns_bool_on_exception
+    def step(self, step_mode: int):
+        self.client.step(self._session_id, step_mode)
+
+    @returns_bool_on_exception
+    def set_trace_mode(self, trace_mode: int):
+        self.client.configure(self._session_id, trace_mode=trace_mode)
+
     @returns_bool_on_exception
     def set_source(self, source: str):
         self.client.set_source(
@@ -464,9 +494,28 @@ class EditorDock(QDockWidget):
         self._stop_button = self._make_tool_button("Stop", ":/icons/stop.png")
         self._resume_button = self._make_tool_button("Continue", ":/icons/resume.png")
 
+        self._step_over_button = self._make_style_button(
+            "Step Over", QStyle.StandardPixmap.SP_ArrowForward
+        )
+        self._step_into_button = self._make_style_button(
+            "Step Into", QStyle.StandardPixmap.SP_ArrowDown
+        )
+        self._step_out_button = self._make_style_button(
+            "Step Out", QStyle.StandardPixmap.SP_ArrowUp
+        )
+        self._fast_run_button = self._make_style_button(
+            "Fast Run (trace breakpoints only)",
+            QStyle.StandardPixmap.SP_MediaSeekForward,
+        )
+        self._fast_run_button.setCheckable(True)
+
         top_layout.addWidget(self._start_button)
         top_layout.addWidget(self._stop_button)
         top_layout.addWidget(self._resume_button)
+        top_layout.addWidget(self._step_over_button)
+        top_layout.addWidget(self._step_into_button)
+        top_layout.addWidget(self._step_out_button)
+        top_layout.addWidget(self._fast_run_button)
         top_layout.addStretch()
         main_layout.addLayout(top_layout)
 
@@ -504,6 +553,16 @@ class EditorDock(QDockWidget):
         self._start_button.clicked.connect(self._on_start_clicked)
         self._stop_button.clicked.connect(self._on_stop_clicked)
         self._resume_button.clicked.connect(self._on_resume_clicked)
+        self._step_over_button.clicked.connect(
+            functools.partial(self._on_step_clicked, debugger_pb2.STEP_MODE_OVER)
+        )
+        self._step_into_button.clicked.connect(
+            functools.partial(self._on_step_clicked, debugger_pb2.STEP_MODE_INTO)
+        )
+        self._step_out_button.clicked.connect(
+            functools.partial(self._on_step_clicked, debugger_pb2.STEP_MODE_OUT)
+        )
+        self._fast_run_button.toggled.connect(self._on_fast_run_toggled)
 
         self._code_editor.textChanged.connect(self._on_code_changed)
         self._code_editor.try_add_breakpoint.connect(self._on_try_add_breakpoint)
@@ -528,10 +587,24 @@ class EditorDock(QDockWidget):
         btn.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
         return btn
 
+    def _make_style_button(
+        self, tooltip: str, pixmap: QStyle.StandardPixmap
+    ) -> QToolButton:
+        btn = QToolButton()
+        btn.setIcon(self.style().standardIcon(pixmap))
+        btn.setToolTip(tooltip)
+        btn.setAutoRaise(True)
+        btn.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        return btn
+
     def _update_states(self, running: bool, paused: bool):
         self._start_button.setEnabled(not running)
         self._stop_button.setEnabled(running)
         self._resume_button.setEnabled(running and paused)
+        self._step_over_button.setEnabled(running and paused)
+        self._step_into_button.setEnabled(running and paused)
+        self._step_out_button.setEnabled(running and paused)
+        self._fast_run_button.setEnabled(not running)
         self._code_editor.setReadOnly(running)
 
     def _on_start_clicked(self):
@@ -548,6 +621,20 @@ class EditorDock(QDockWidget):
         if self._debugger.resume():
             self._update_states(running=True, paused=False)
 
+    def _on_step_clicked(self, step_mode: int):
+        if self._debugger.step(step_mode):
+            self._update_states(running=True, paused=False)
+
+    def _on_fast_run_toggled(self, checked: bool):
+        trace_mode = (
+            debugger_pb2.TRACE_MODE_BREAKPOINTS
+            if checked
+            else debugger_pb2.TRACE_MODE_FULL
+        )
+        if not self._debugger.set_trace_mode(trace_mode):
+            with QSignalBlocker(self._fast_run_button):
+                self._fast_run_button.setChecked(not checked)
+
     def _on_code_started(self):
         self._output_console.append("--- Code Execution Started ---\n")
 
@@ -15,8 +15,11 @@ from specter.client import Client
 
 from specter_viewer.delegates.methods import MethodButtonDelegate
 from specter_viewer.models.proxies import MultiColumnSortFilterProxyModel
+from specter_viewer.models.requests import GRPCRequestExecutor
+from specter_viewer.models.snapshots import GRPCSnapshotCache
 from specter_viewer.models.methods import (
     MethodsModel,
+    MethodTreeItem,
     PropertiesTreeItem,
     HasNoDefaultError,
     GRPCMethodsModel,
@@ -63,6 +66,8 @@ class MethodsTreeView(QTreeView):
 
         if expanded:
             self._expanded_items.add(item_path)
+            if self.model().canFetchMore(index):
+                self.model().fetchMore(index)
         else:
             self._expanded_items.discard(item_path)
 
@@ -71,12 +76,14 @@ class MethodsTreeView(QTreeView):
             return
 
         item_path = self._get_item_path(index)
-        if item_path in self._expanded_items:
-            self.expand(index)
-        else:
-            self.collapse(index)
+        if item_path not in self._expanded_items:
+            return
 
         model = self.model()
+        if model and model.canFetchMore(index):
+            model.fetchMore(index)
+        self.expand(index)
+
         if model:
             for row in range(model.rowCount(index)):
                 child_index = model.index(row, 0, index)
@@ -152,14 +159,23 @@ class MethodsTreeView(QTreeView):
 
 
 class MethodsDock(QDockWidget):
-    def __init__(self, client: Client):
+    def __init__(
+        self,
+        client: Client,
+        snapshot_cache: typing.Optional[GRPCSnapshotCache] = None,
+        executor: typing.Optional[GRPCRequestExecutor] = None,
+    ):
         super().__init__("Methods")
         self._client = client
+        self._snapshot_cache = snapshot_cache
+        self._executor = executor
         self._init_ui()
         self._init_connection()
 
     def _init_ui(self):
-        self._model = GRPCMethodsModel(self._client)
+        self._model = GRPCMethodsModel(
+            self._client, self._snapshot_cache, self._executor
+        )
 
         self._proxy_model = MultiColumnSortFilterProxyModel(self)
         self._proxy_model.setSourceModel(self._model)
@@ -224,6 +240,14 @@ class MethodsDock(QDockWidget):
         if data and search_text in str(data).lower():
             return True
 
+        item = model.data(index, MethodsModel.CustomDataRoles.TreeItemRole)
+        if isinstance(item, MethodTreeItem) and not item.populated:
+            return any(
+                search_text in key.lower()
+                for field in item.schema.fields()
+                for key in field.path
+            )
+
         for i in range(model.rowCount(index)):
             if self._subtree_matches(model.index(i, 0, index), model, search_text):
                 return True
@@ -234,6 +258,4 @@ class MethodsDock(QDockWidget):
         self._proxy_model.invalidateFilter()
 
     def set_object(self, object_id: str):
-        self._proxy_model.setSourceModel(None)
         self._model.set_object(object_id)
-        self._proxy_model.setSourceModel(self._model)
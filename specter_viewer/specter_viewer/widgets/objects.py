@@ -1,3 +1,5 @@
+import typing
+
 from PySide6.QtWidgets import (
     QDockWidget,
     QWidget,
@@ -21,11 +23,18 @@ from google.protobuf import empty_pb2
 from specter.client import Client, StreamReader
 
 from specter_viewer.models.objects import GRPCObjectsModel
-from specter_viewer.models.proxies import MultiColumnSortFilterProxyModel
+from specter_viewer.models.proxies import (
+    MultiColumnSortFilterProxyModel,
+    SubstringFilter,
+)
 
 
 class ObjectsDock(QDockWidget):
     current_object_changed = Signal(str)
+    prefetch_requested = Signal(list)
+
+    PREFETCH_SIBLINGS = 4
+    PREFETCH_CHILDREN = 4
 
     def __init__(self, client: Client):
         super().__init__("Objects")
@@ -42,7 +51,7 @@ class ObjectsDock(QDockWidget):
             [GRPCObjectsModel.Columns.Name],
             [Qt.SortOrder.DescendingOrder],
         )
-        self._proxy_model.set_filter_function("search_filter", self._search_filter)
+        self._proxy_model.setRecursiveFilteringEnabled(True)
 
         self._search = QLineEdit()
         self._search.setPlaceholderText("Search objects...")
@@ -51,6 +60,7 @@ class ObjectsDock(QDockWidget):
         self._view.setModel(self._proxy_model)
         self._view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self._view.setAlternatingRowColors(True)
+        self._view.setMouseTracking(True)
 
         container = QWidget()
         layout = QVBoxLayout()
@@ -62,6 +72,7 @@ class ObjectsDock(QDockWidget):
     def _init_connection(self):
         self._view.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self._search.textChanged.connect(self._on_search_text_changed)
+        self._view.entered.connect(self._on_item_hovered)
 
     def _init_selection_stream(self):
         self._selection_stream = StreamReader(
@@ -95,36 +106,24 @@ class ObjectsDock(QDockWidget):
         )
         self._view.scrollTo(proxy_index)
 
-    def _search_filter(
-        self,
-        source_row: int,
-        source_parent: QModelIndex,
-        source_model: GRPCObjectsModel,
-    ):
-        search_text = self._search.text().strip().lower()
+    def _on_search_text_changed(self):
+        search_text = self._search.text().strip()
         if not search_text:
-            return True
-
-        for col in (
-            GRPCObjectsModel.Columns.Name,
-            GRPCObjectsModel.Columns.Path,
-            GRPCObjectsModel.Columns.Type,
-            GRPCObjectsModel.Columns.Id,
-        ):
-            index = source_model.index(source_row, col, source_parent)
-            data = source_model.data(index, Qt.ItemDataRole.DisplayRole)
-            if data and search_text in str(data).lower():
-                return True
-
-        parent_index = source_model.index(source_row, 0, source_parent)
-        for i in range(source_model.rowCount(parent_index)):
-            if self._search_filter(i, parent_index, source_model):
-                return True
-
-        return False
+            self._proxy_model.remove_column_filter("search_filter")
+            return
 
-    def _on_search_text_changed(self):
-        self._proxy_model.invalidateFilter()
+        self._proxy_model.set_column_filter(
+            "search_filter",
+            SubstringFilter(
+                search_text,
+                columns=[
+                    GRPCObjectsModel.Columns.Name,
+                    GRPCObjectsModel.Columns.Path,
+                    GRPCObjectsModel.Columns.Type,
+                    GRPCObjectsModel.Columns.Id,
+                ],
+            ),
+        )
 
     def _on_selection_changed(self):
         selected_indexes = self._view.selectionModel().selectedIndexes()
@@ -139,3 +138,42 @@ class ObjectsDock(QDockWidget):
             )
 
         self.current_object_changed.emit(object_id)
+
+        if selected_index.isValid():
+            self.prefetch_requested.emit(self._likely_next_objects(selected_index))
+
+    def _on_item_hovered(self, index: QModelIndex):
+        object_id = self._object_id(index)
+        if object_id:
+            self.prefetch_requested.emit([object_id])
+
+    def _likely_next_objects(self, index: QModelIndex) -> list[str]:
+        index = index.siblingAtColumn(0)
+        parent = index.parent()
+
+        candidates = []
+        for offset in range(1, self.PREFETCH_SIBLINGS + 1):
+            for row in (index.row() + offset, index.row() - offset):
+                if 0 <= row < self._proxy_model.rowCount(parent):
+                    candidates.append(self._proxy_model.index(row, 0, parent))
+
+        for row in range(
+            min(self._proxy_model.rowCount(index), self.PREFETCH_CHILDREN)
+        ):
+            candidates.append(self._proxy_model.index(row, 0, index))
+
+        return [
+            object_id
+            for object_id in map(self._object_id, candidates)
+            if object_id is not None
+        ]
+
+    def _object_id(self, index: QModelIndex) -> typing.Optional[str]:
+        if not index.isValid():
+            return None
+
+        source_index = self._proxy_model.mapToSource(index)
+        return self._model.data(
+            source_index.sibling(source_index.row(), GRPCObjectsModel.Columns.Id),
+            Qt.ItemDataRole.DisplayRole,
+        )
@@ -16,6 +16,8 @@ from PySide6.QtWidgets import (
 from specter.client import Client
 
 from specter_viewer.models.proxies import MultiColumnSortFilterProxyModel
+from specter_viewer.models.requests import GRPCRequestExecutor
+from specter_viewer.models.snapshots import GRPCSnapshotCache
 from specter_viewer.models.properties import (
     GRPCPropertiesModel,
     HasNoDefaultError,
@@ -41,11 +43,13 @@ class PropertiesView(QTreeView):
         self.customContextMenuRequested.connect(self.reset_expansion_state)
 
     def _on_expansion_change(self, index: QModelIndex, expanded: bool) -> None:
-        attr_name = index.data(GRPCPropertiesModel.CustomDataRoles.AttributeNameRole)
-        if expanded and attr_name not in self._expanded_items:
-            self._expanded_items.add(attr_name)
-        elif not expanded and attr_name in self._expanded_items:
-            self._expanded_items.remove(attr_name)
+        tree_item: PropertiesTreeItem = index.data(
+            GRPCPropertiesModel.CustomDataRoles.TreeItemRole
+        )
+        if expanded:
+            self._expanded_items.add(tree_item.path)
+        else:
+            self._expanded_items.discard(tree_item.path)
 
     def _get_set_expansion_state(self, index: QModelIndex) -> None:
         if index is None or not index.isValid():
@@ -54,7 +58,7 @@ class PropertiesView(QTreeView):
         tree_item: PropertiesTreeItem = index.data(
             GRPCPropertiesModel.CustomDataRoles.TreeItemRole
         )
-        if tree_item.name in self._expanded_items:
+        if tree_item.path in self._expanded_items:
             self.expand(index)
         else:
             self.collapse(index)
@@ -125,14 +129,23 @@ class PropertiesView(QTreeView):
 
 
 class PropertiesDock(QDockWidget):
-    def __init__(self, client: Client):
+    def __init__(
+        self,
+        client: Client,
+        snapshot_cache: typing.Optional[GRPCSnapshotCache] = None,
+        executor: typing.Optional[GRPCRequestExecutor] = None,
+    ):
         super().__init__("Properties")
         self._client = client
+        self._snapshot_cache = snapshot_cache
+        self._executor = executor
         self._init_ui()
         self._init_connection()
 
     def _init_ui(self):
-        self._model = GRPCPropertiesModel(self._client)
+        self._model = GRPCPropertiesModel(
+            self._client, self._snapshot_cache, self._executor
+        )
         self._proxy_model = MultiColumnSortFilterProxyModel(self)
         self._proxy_model.setSourceModel(self._model)
         self._proxy_model.sort_by_columns(
@@ -206,6 +219,4 @@ class PropertiesDock(QDockWidget):
         self._proxy_model.invalidateFilter()
 
     def set_object(self, object_id: str):
-        self._proxy_model.setSourceModel(None)
         self._model.set_object(object_id)
-        self._proxy_model.setSourceModel(self._model)
@@ -12,9 +12,11 @@ from PySide6.QtWidgets import (
     QFrame,
     QHeaderView,
     QSplitter,
-    QPlainTextEdit,
+    QListView,
     QTableView,
     QFileDialog,
+    QStyle,
+    QLabel,
 )
 from PySide6.QtGui import QIcon, QPixmap, QTextCursor
 from PySide6.QtCore import (
@@ -29,13 +31,16 @@ from PySide6.QtCore import (
 )
 
 from specter.client import Client
-from specter.scripts.generator import CodeGenerator
+from specter.scripts.generator import CodeGenerator, BatchedCodeGenerator
+from specter.scripts.compactor import RecordingCompactor
 
 from specter_viewer.delegates.recorder import RecorderWidgetDelegate
+from specter_viewer.widgets.editor import CodeEditor
 from specter_viewer.models.proxies import MultiColumnSortFilterProxyModel
 from specter_viewer.models.recorder import (
     GRPCRecorderConsoleItem,
     ConsoleModel,
+    ConsoleLinesModel,
     BaseConsoleItem,
 )
 
@@ -53,18 +58,18 @@ class Ui_ConsoleWidget(object):
         self.splitter.setObjectName("splitter")
         self.splitter.setOrientation(Qt.Horizontal)
         self.splitter.setHandleWidth(5)
-        self.consoleTextEdit = QPlainTextEdit(self.splitter)
-        self.consoleTextEdit.setObjectName("consoleTextEdit")
+        self.consoleView = QListView(self.splitter)
+        self.consoleView.setObjectName("consoleView")
         sizePolicy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.consoleTextEdit.sizePolicy().hasHeightForWidth()
-        )
-        self.consoleTextEdit.setSizePolicy(sizePolicy)
-        self.consoleTextEdit.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        self.consoleTextEdit.setLineWrapMode(QPlainTextEdit.NoWrap)
-        self.splitter.addWidget(self.consoleTextEdit)
+        sizePolicy.setHeightForWidth(self.consoleView.sizePolicy().hasHeightForWidth())
+        self.consoleView.setSizePolicy(sizePolicy)
+        self.consoleView.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.consoleView.setUniformItemSizes(True)
+        self.consoleView.setLayoutMode(QListView.LayoutMode.Batched)
+        self.consoleView.setWordWrap(False)
+        self.splitter.addWidget(self.consoleView)
         self.fileSelectionTableView = QTableView(self.splitter)
         self.fileSelectionTableView.setObjectName("fileSelectionTableView")
         self.splitter.addWidget(self.fileSelectionTableView)
@@ -79,22 +84,24 @@ class Ui_ConsoleWidget(object):
         ConsoleWidget.setWindowTitle(
             QCoreApplication.translate("ConsoleWidget", "Form", None)
         )
-        self.consoleTextEdit.setPlainText("")
 
 
 class ConsoleWidget(QWidget):
     def __init__(
         self,
         parent: typing.Optional[QWidget] = None,
-        display_max_blocks=1000,
         ui_text_min_update_interval: float = 0.05,
     ) -> None:
         super().__init__(parent)
         self._ui = Ui_ConsoleWidget()
         self._ui.setupUi(self)
 
-        self._display_max_blocks = display_max_blocks
-        self._ui.consoleTextEdit.setMaximumBlockCount(display_max_blocks)
+        self._lines_model = ConsoleLinesModel(ui_text_min_update_interval, self)
+        self._ui.consoleView.setModel(self._lines_model)
+        self._follow_tail = True
+        scroll_bar = self._ui.consoleView.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_console_scrolled)
+        scroll_bar.rangeChanged.connect(self._on_console_range_changed)
         self._files_proxy_model = MultiColumnSortFilterProxyModel(self)
         self._ui.fileSelectionTableView.setModel(self._files_proxy_model)
 
@@ -119,7 +126,12 @@ class ConsoleWidget(QWidget):
 
         self.set_console_width_percentage(50)
 
-        self._ui.consoleTextEdit.setReadOnly(True)
+        self._ui.consoleView.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers
+        )
+        self._ui.consoleView.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
 
         self._ui.fileSelectionTableView.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows
@@ -139,26 +151,17 @@ class ConsoleWidget(QWidget):
             self.delete_file_selector_at_index
         )
 
-        self._current_linechange_connect = None
         self._ui.fileSelectionTableView.viewport().setMouseTracking(True)
 
         self._ui.fileSelectionTableView.selectionModel().selectionChanged.connect(
             self.selection_changed
         )
-        self._ui_text_min_update_interval = ui_text_min_update_interval
-
-        self.currently_loaded_lines = [0, 0]
 
     def selection_changed(self, selection: QItemSelection):
-        if self._current_linechange_connect is not None:
-            self.disconnect(self._current_linechange_connect)
-            self._current_linechange_connect = None
-
         if len(selection.indexes()) == 0:
-            self._ui.consoleTextEdit.setPlainText("")
+            self._lines_model.set_item(None)
             return
         elif selection.indexes()[0].isValid():
-            self._ui.consoleTextEdit.setPlainText("")
             index = selection.indexes()[0]
             item = self._files_proxy_model.data(
                 index, role=Qt.ItemDataRole.UserRole + 1
@@ -167,75 +170,16 @@ class ConsoleWidget(QWidget):
                 item, BaseConsoleItem
             ), "Item is not of type BaseConsoleItem"
 
-            self._current_linechange_connect = item.loadedLinesChanged.connect(
-                self.process_line_change
-            )
+            self._follow_tail = True
+            self._lines_model.set_item(item)
+            self._ui.consoleView.scrollToBottom()
 
-            cur_line_list, from_index = item.get_current_line_list()
-            self.process_line_change(cur_line_list, from_index)
+    def _on_console_scrolled(self, value: int):
+        self._follow_tail = value >= self._ui.consoleView.verticalScrollBar().maximum()
 
-            self._ui.consoleTextEdit.verticalScrollBar().setValue(
-                self._ui.consoleTextEdit.verticalScrollBar().maximum()
-            )
-
-    @staticmethod
-    def _get_index_nth_occurence(string: str, char: str, occurence: int) -> int:
-        counter = 0
-        if occurence <= 0:
-            return 0
-        for i, char in enumerate(string):
-            if char == "\n":
-                counter += 1
-            if counter >= occurence:
-                return i
-
-        return -1
-
-    def process_line_change(self, new_line_list: list[str], from_line: int = 0):
-        if len(new_line_list) > self._display_max_blocks:
-            from_line = from_line + len(new_line_list) - self._display_max_blocks
-            new_line_list = new_line_list[-self._display_max_blocks :]
-
-        new_loaded_lines = [
-            min(self.currently_loaded_lines[0], from_line),
-            max(from_line + len(new_line_list), self.currently_loaded_lines[1]),
-        ]
-        shift = 0
-
-        if new_loaded_lines[1] - new_loaded_lines[0] > self._display_max_blocks:
-            shift = new_loaded_lines[1] - self._display_max_blocks - new_loaded_lines[0]
-            new_loaded_lines = (
-                new_loaded_lines[1] - self._display_max_blocks,
-                new_loaded_lines[1],
-            )
-
-        start_line = max(from_line - self.currently_loaded_lines[0], 0)
-
-        at_end_scrollbar = (
-            self._ui.consoleTextEdit.verticalScrollBar().value()
-            > self._ui.consoleTextEdit.verticalScrollBar().maximum() - 4
-        )
-
-        cur_cursor = self._ui.consoleTextEdit.textCursor()
-        cur_cursor.movePosition(QTextCursor.MoveOperation.Start)
-        cur_cursor.movePosition(
-            QTextCursor.MoveOperation.Down,
-            QTextCursor.MoveMode.MoveAnchor,
-            start_line,
-        )
-
-        cur_cursor.insertText("".join([i + "\n" for i in new_line_list]))
-
-        if at_end_scrollbar:
-            self._ui.consoleTextEdit.verticalScrollBar().setValue(
-                self._ui.consoleTextEdit.verticalScrollBar().maximum() - 1
-            )
-        else:
-            self._ui.consoleTextEdit.verticalScrollBar().setValue(
-                self._ui.consoleTextEdit.verticalScrollBar().value() - shift
-            )
-
-        self.currently_loaded_lines = new_loaded_lines
+    def _on_console_range_changed(self, minimum: int, maximum: int):
+        if self._follow_tail:
+            self._ui.consoleView.verticalScrollBar().setValue(maximum)
 
     def dragMoveEvent(self, event) -> bool:
         event.setAccepted(True)
@@ -334,7 +278,65 @@ class ConsoleWidget(QWidget):
     )
 
 
+class ScriptPreview(CodeEditor):
+    def __init__(self, parent: typing.Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self._item: typing.Optional[GRPCRecorderConsoleItem] = None
+        self._generator = CodeGenerator()
+        self._compactor = RecordingCompactor()
+        self._fed_events = 0
+        self._committed_position = 0
+
+    def set_item(self, item: typing.Optional[GRPCRecorderConsoleItem]):
+        if self._item is not None:
+            self._item.lineCountChanged.disconnect(self._on_line_count_changed)
+
+        self._item = item
+        self._generator = CodeGenerator()
+        self._compactor = RecordingCompactor()
+        self._fed_events = 0
+        self._committed_position = 0
+        self.clear()
+
+        if item is not None:
+            item.lineCountChanged.connect(self._on_line_count_changed)
+            self._on_line_count_changed(item.line_count())
+
+    def _on_line_count_changed(self, count: int):
+        if not self.isVisible() or self._item is None:
+            return
+
+        events = self._item.get_events()
+        chunks = []
+        for index in range(self._fed_events, count):
+            for event in self._compactor.feed(events[index]):
+                chunks.extend(self._generator.feed(event))
+        self._fed_events = max(self._fed_events, count)
+
+        cursor = QTextCursor(self.document())
+        cursor.setPosition(self._committed_position)
+        cursor.movePosition(
+            QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor
+        )
+        cursor.insertText("".join(chunks))
+        self._committed_position = cursor.position()
+        cursor.insertText(
+            "".join(self._generator.preview_pending(self._compactor.pending()))
+        )
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._item is not None:
+            self._on_line_count_changed(self._item.line_count())
+
+
 class RecorderDock(QDockWidget):
+    EXPORT_FILTERS = {
+        "Python Files (*.py)": CodeGenerator,
+        "Batched Python Files (*.py)": BatchedCodeGenerator,
+    }
+
     def __init__(self, client: Client):
         super().__init__("Recorder")
         self._client = client
@@ -344,9 +346,7 @@ class RecorderDock(QDockWidget):
 
     def _init_ui(self):
         self._model = ConsoleModel()
-        self._view = ConsoleWidget(
-            ui_text_min_update_interval=0.1, display_max_blocks=5000
-        )
+        self._view = ConsoleWidget(ui_text_min_update_interval=0.1)
         self._view.set_model(self._model)
         self._view.set_console_width_percentage(80)
 
@@ -355,6 +355,22 @@ class RecorderDock(QDockWidget):
         self._pause_button = self._make_tool_button("Pause", ":/icons/pause.png")
         self._stop_button = self._make_tool_button("Stop", ":/icons/stop.png")
         self._export_button = self._make_tool_button("Export", ":/icons/export.png")
+        self._preview_button = QToolButton()
+        self._preview_button.setIcon(
+            self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
+        )
+        self._preview_button.setToolTip("Preview Script")
+        self._preview_button.setAutoRaise(True)
+        self._preview_button.setCheckable(True)
+
+        self._export_report = QLabel()
+
+        self._script_preview = ScriptPreview()
+        self._script_preview.hide()
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self._view)
+        splitter.addWidget(self._script_preview)
 
         toolbar_layout = QHBoxLayout()
         toolbar_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -363,13 +379,15 @@ class RecorderDock(QDockWidget):
         toolbar_layout.addWidget(self._pause_button)
         toolbar_layout.addWidget(self._stop_button)
         toolbar_layout.addWidget(self._export_button)
+        toolbar_layout.addWidget(self._preview_button)
+        toolbar_layout.addWidget(self._export_report)
 
         toolbar_widget = QWidget()
         toolbar_widget.setLayout(toolbar_layout)
 
         main_layout = QVBoxLayout()
         main_layout.addWidget(toolbar_widget)
-        main_layout.addWidget(self._view, stretch=1)
+        main_layout.addWidget(splitter, stretch=1)
 
         container = QWidget()
         container.setLayout(main_layout)
@@ -389,10 +407,14 @@ class RecorderDock(QDockWidget):
         self._pause_button.clicked.connect(self._on_pause_recording)
         self._stop_button.clicked.connect(self._on_stop_recording)
         self._export_button.clicked.connect(self._on_export_recording)
+        self._preview_button.toggled.connect(self._script_preview.setVisible)
 
         self._view._ui.fileSelectionTableView.selectionModel().selectionChanged.connect(
             self._update_buttons
         )
+        self._view._ui.fileSelectionTableView.selectionModel().selectionChanged.connect(
+            self._update_script_preview
+        )
 
     def _on_start_recording(self):
         console_item = GRPCRecorderConsoleItem("Recording", self._client)
@@ -417,18 +439,23 @@ class RecorderDock(QDockWidget):
         console_item = self._get_current_console_item()
         assert console_item
 
-        code_generator = CodeGenerator()
-        script_text = code_generator.generate(console_item.get_events())
-
-        file_path, _ = QFileDialog.getSaveFileName(
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Save Python Script",
             "recording.py",
-            "Python Files (*.py)",
+            ";;".join(self.EXPORT_FILTERS),
         )
         if file_path:
+            code_generator = self.EXPORT_FILTERS.get(selected_filter, CodeGenerator)()
+            compactor = RecordingCompactor()
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(script_text)
+                code_generator.write(compactor.compact(console_item.get_events()), f)
+            self._export_report.setText(
+                f"Exported {os.path.basename(file_path)}: {compactor.report}"
+            )
+
+    def _update_script_preview(self):
+        self._script_preview.set_item(self._get_current_console_item())
 
     def _update_buttons(self):
         console_item = self._get_current_console_item()
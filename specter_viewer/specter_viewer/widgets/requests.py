@@ -0,0 +1,49 @@
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+)
+
+from specter_viewer.models.requests import GRPCRequestExecutor
+
+
+class RequestStatsDock(QDockWidget):
+    COLUMNS = ["RPC", "Count", "Mean (ms)", "p50 (ms)", "p95 (ms)", "Max (ms)"]
+
+    def __init__(self, executor: GRPCRequestExecutor):
+        super().__init__("Requests")
+        self._executor = executor
+        self._init_ui()
+        self._init_connection()
+        self._refresh()
+
+    def _init_ui(self):
+        self._table = QTableWidget(0, len(self.COLUMNS))
+        self._table.setHorizontalHeaderLabels(self.COLUMNS)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        self.setWidget(self._table)
+
+    def _init_connection(self):
+        self._executor.latency_recorded.connect(self._refresh)
+
+    @Slot()
+    def _refresh(self):
+        histograms = sorted(self._executor.get_histograms().items())
+        self._table.setRowCount(len(histograms))
+
+        for row, (name, histogram) in enumerate(histograms):
+            values = [
+                name,
+                str(histogram.count),
+                f"{histogram.mean_ms:.1f}",
+                f"{histogram.percentile(50):.1f}",
+                f"{histogram.percentile(95):.1f}",
+                f"{histogram.max_ms:.1f}",
+            ]
+            for column, value in enumerate(values):
+                self._table.setItem(row, column, QTableWidgetItem(value))
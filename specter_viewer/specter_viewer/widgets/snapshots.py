@@ -0,0 +1,55 @@
+from PySide6.QtWidgets import (
+    QDockWidget,
+    QWidget,
+    QVBoxLayout,
+    QFormLayout,
+    QLabel,
+    QListWidget,
+)
+
+from specter_viewer.models.snapshots import GRPCSnapshotCache
+
+
+class SnapshotCacheDock(QDockWidget):
+    def __init__(self, snapshot_cache: GRPCSnapshotCache):
+        super().__init__("Prefetch")
+        self._snapshot_cache = snapshot_cache
+        self._init_ui()
+        self._init_connection()
+        self._refresh()
+
+    def _init_ui(self):
+        self._hits = QLabel()
+        self._misses = QLabel()
+        self._hit_rate = QLabel()
+        self._prefetched = QLabel()
+        self._evicted = QLabel()
+        self._cached_objects = QListWidget()
+
+        form = QFormLayout()
+        form.addRow("Hits", self._hits)
+        form.addRow("Misses", self._misses)
+        form.addRow("Hit rate", self._hit_rate)
+        form.addRow("Prefetched", self._prefetched)
+        form.addRow("Evicted", self._evicted)
+
+        container = QWidget()
+        layout = QVBoxLayout()
+        layout.addLayout(form)
+        layout.addWidget(self._cached_objects)
+        container.setLayout(layout)
+        self.setWidget(container)
+
+    def _init_connection(self):
+        self._snapshot_cache.stats_changed.connect(self._refresh)
+
+    def _refresh(self):
+        stats = self._snapshot_cache.get_stats()
+        self._hits.setText(str(stats.hits))
+        self._misses.setText(str(stats.misses))
+        self._hit_rate.setText(f"{stats.hit_rate:.0%}")
+        self._prefetched.setText(str(stats.prefetched))
+        self._evicted.setText(str(stats.evicted))
+
+        self._cached_objects.clear()
+        self._cached_objects.addItems(self._snapshot_cache.cached_objects())
@@ -1,5 +1,12 @@
+import time
+import threading
+
 from PySide6.QtWidgets import (
     QMenu,
+    QLabel,
+    QSlider,
+    QFileDialog,
+    QMessageBox,
     QWidget,
     QVBoxLayout,
     QGraphicsView,
@@ -7,17 +14,30 @@ from PySide6.QtWidgets import (
     QGraphicsPixmapItem,
 )
 from PySide6.QtGui import (
+    QImage,
     QPixmap,
+    QPainter,
     QWheelEvent,
     QMouseEvent,
     QKeySequence,
     QAction,
     QIcon,
 )
-from PySide6.QtCore import Qt, QByteArray, QMetaObject, Slot, Q_ARG
+from PySide6.QtCore import Qt, QMetaObject, QTimer, Slot
+
+from specter.client import (
+    Client,
+    StreamReader,
+    PreviewRecorder,
+    PreviewRecording,
+    PreviewRecordingException,
+)
 
-from specter.proto.specter_pb2 import ObjectId
-from specter.client import Client, StreamReader
+from specter_viewer.models.preview import (
+    PreviewOptions,
+    PreviewComposer,
+    PreviewStats,
+)
 
 
 class ZoomableGraphicsView(QGraphicsView):
@@ -58,6 +78,8 @@ class ZoomableGraphicsView(QGraphicsView):
         self.addAction(self.action_zoom_to_fit)
         self.addAction(self.action_reset_view)
 
+        self._context_actions: list[QAction] = []
+
     def wheelEvent(self, event: QWheelEvent):
         if event.angleDelta().y() > 0:
             self.zoom_by_factor(self.zoom_factor)
@@ -99,8 +121,15 @@ class ZoomableGraphicsView(QGraphicsView):
         menu.addSeparator()
         menu.addAction(self.action_zoom_to_fit)
         menu.addAction(self.action_reset_view)
+        if self._context_actions:
+            menu.addSeparator()
+            menu.addActions(self._context_actions)
         menu.exec(event.globalPos())
 
+    def add_context_action(self, action: QAction):
+        self.addAction(action)
+        self._context_actions.append(action)
+
     def zoom_to_fit(self):
         if not self.scene() or self.scene().sceneRect().isEmpty():
             return
@@ -120,6 +149,14 @@ class ViewerWidget(QWidget):
         self._stream_reader = None
         self._current_pixmap = QPixmap()
         self._object_id = None
+        self._preview_options = PreviewOptions()
+        self._composer = PreviewComposer()
+        self._stats = PreviewStats()
+        self._frame_lock = threading.Lock()
+        self._pending_frame = None
+        self._recorder = None
+        self._recording = None
+        self._playback_index = -1
         self._init_ui()
         self.setWindowTitle("Viewer")
 
@@ -133,46 +170,229 @@ class ViewerWidget(QWidget):
         self._pixmap_item = QGraphicsPixmapItem()
         self._scene.addItem(self._pixmap_item)
 
+        self._overlay = QLabel(self._view.viewport())
+        self._overlay.setStyleSheet(
+            "background-color: rgba(0, 0, 0, 160); color: white; padding: 4px;"
+        )
+        self._overlay.move(8, 8)
+        self._overlay.hide()
+
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setInterval(500)
+        self._overlay_timer.timeout.connect(self._update_overlay)
+
+        self.action_show_stats = QAction("Show Statistics", self)
+        self.action_show_stats.setShortcut(QKeySequence("I"))
+        self.action_show_stats.setCheckable(True)
+        self.action_show_stats.toggled.connect(self._set_overlay_visible)
+        self._view.add_context_action(self.action_show_stats)
+
+        self.action_record = QAction("Record Preview...", self)
+        self.action_record.setCheckable(True)
+        self.action_record.toggled.connect(self._on_record_toggled)
+        self._view.add_context_action(self.action_record)
+
+        self.action_open_recording = QAction("Open Recording...", self)
+        self.action_open_recording.triggered.connect(self._on_open_recording)
+        self._view.add_context_action(self.action_open_recording)
+
+        self.action_close_recording = QAction("Close Recording", self)
+        self.action_close_recording.setEnabled(False)
+        self.action_close_recording.triggered.connect(self.close_recording)
+        self._view.add_context_action(self.action_close_recording)
+
+        self._playback_slider = QSlider(Qt.Orientation.Horizontal)
+        self._playback_slider.valueChanged.connect(self._on_playback_slider_moved)
+        self._playback_slider.hide()
+
         self.layout.addWidget(self._view)
+        self.layout.addWidget(self._playback_slider)
         self.setLayout(self.layout)
 
     def _display_image(self, preview_message):
-        QMetaObject.invokeMethod(
-            self,
-            "_update_pixmap",
-            Qt.QueuedConnection,
-            Q_ARG("QVariant", preview_message),
-        )
+        recorder = self._recorder
+        if recorder:
+            recorder.append(preview_message)
 
-    @Slot("QVariant")
-    def _update_pixmap(self, preview_message):
-        if not hasattr(preview_message, "image") or not preview_message.image:
+        start = time.perf_counter()
+        frame = QImage(self._composer.compose(preview_message))
+        decode_ms = (time.perf_counter() - start) * 1000
+
+        with self._frame_lock:
+            self._stats.record_decode(decode_ms)
+            update_scheduled = self._pending_frame is not None
+            if update_scheduled:
+                self._stats.record_drop()
+            self._pending_frame = frame
+
+        if not update_scheduled:
+            QMetaObject.invokeMethod(self, "_update_pixmap", Qt.QueuedConnection)
+
+    @Slot()
+    def _update_pixmap(self):
+        with self._frame_lock:
+            frame, self._pending_frame = self._pending_frame, None
+        if frame is None:
+            return
+
+        if frame.isNull():
             self._current_pixmap = QPixmap()
             self._pixmap_item.setPixmap(QPixmap())
+        elif self._can_reuse_pixmap(frame):
+            self._pixmap_item.setPixmap(QPixmap())
+            self._draw_frame(frame)
+            self._pixmap_item.setPixmap(self._current_pixmap)
+        else:
+            self._current_pixmap = QPixmap(frame.size())
+            if frame.hasAlphaChannel():
+                self._current_pixmap.fill(Qt.GlobalColor.transparent)
+            self._draw_frame(frame)
+            self._pixmap_item.setPixmap(self._current_pixmap)
+            self._scene.setSceneRect(self._current_pixmap.rect())
+
+        with self._frame_lock:
+            self._stats.record_display()
+        self._update_overlay()
+
+    def _draw_frame(self, frame: QImage):
+        painter = QPainter(self._current_pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.drawImage(0, 0, frame)
+        painter.end()
+
+    def _can_reuse_pixmap(self, frame: QImage) -> bool:
+        return (
+            not self._current_pixmap.isNull()
+            and self._current_pixmap.size() == frame.size()
+            and (self._current_pixmap.hasAlphaChannel() or not frame.hasAlphaChannel())
+        )
+
+    def _set_overlay_visible(self, visible: bool):
+        self._overlay.setVisible(visible)
+        if visible:
+            self._overlay_timer.start()
+            self._update_overlay()
+        else:
+            self._overlay_timer.stop()
+
+    def _update_overlay(self):
+        if not self._overlay.isVisible():
             return
 
-        image_bytes = preview_message.image
-        q_byte_array = QByteArray(image_bytes)
-        new_pixmap = QPixmap()
+        with self._frame_lock:
+            text = (
+                f"FPS: {self._stats.fps:.1f}\n"
+                f"Decode: {self._stats.decode_ms:.1f} ms\n"
+                f"Dropped: {self._stats.dropped}"
+            )
+        self._overlay.setText(text)
+        self._overlay.adjustSize()
 
-        if new_pixmap.loadFromData(q_byte_array):
-            self._current_pixmap = new_pixmap
-            self._pixmap_item.setPixmap(self._current_pixmap)
-            self._scene.setSceneRect(self._current_pixmap.rect())
+    def get_stats(self) -> PreviewStats:
+        return self._stats
+
+    def preview_options(self) -> PreviewOptions:
+        return self._preview_options
+
+    def set_preview_options(self, options: PreviewOptions):
+        self._preview_options = options
+        self.set_object(self._object_id)
+
+    def start_recording(self, path: str):
+        self.stop_recording()
+        self._recorder = PreviewRecorder(path)
+
+    def stop_recording(self):
+        recorder, self._recorder = self._recorder, None
+        if recorder:
+            recorder.close()
+
+    def open_recording(self, path: str):
+        recording = PreviewRecording(path)
+
+        self.set_object(None)
+        self._recording = recording
+        self._playback_index = -1
+
+        duration_ms = int((recording.end_time - recording.start_time) * 1000)
+        self._playback_slider.blockSignals(True)
+        self._playback_slider.setRange(0, duration_ms)
+        self._playback_slider.setValue(0)
+        self._playback_slider.blockSignals(False)
+        self._playback_slider.show()
+        self.action_close_recording.setEnabled(True)
+
+        self.seek(recording.start_time)
+
+    def close_recording(self):
+        recording, self._recording = self._recording, None
+        if recording:
+            recording.close()
+
+        self._playback_index = -1
+        self._playback_slider.hide()
+        self.action_close_recording.setEnabled(False)
+
+    def seek(self, timestamp: float):
+        if not self._recording or not len(self._recording):
+            return
+
+        index = self._recording.find(timestamp)
+        keyframe = self._recording.keyframe(index)
+        if keyframe <= self._playback_index <= index:
+            start = self._playback_index + 1
         else:
-            self._current_pixmap = QPixmap()
-            self._pixmap_item.setPixmap(QPixmap())
+            start = keyframe
+            self._composer.reset()
+
+        for preview_message in self._recording.frames(index, start):
+            self._composer.compose(preview_message)
+        self._playback_index = index
+
+        with self._frame_lock:
+            self._pending_frame = QImage(self._composer.frame)
+        self._update_pixmap()
+
+    def _on_playback_slider_moved(self, value: int):
+        if self._recording:
+            self.seek(self._recording.start_time + value / 1000)
+
+    def _on_record_toggled(self, checked: bool):
+        if not checked:
+            self.stop_recording()
+            return
+
+        path = QFileDialog.getExistingDirectory(self, "Record Preview")
+        if path:
+            self.start_recording(path)
+        else:
+            self.action_record.setChecked(False)
+
+    def _on_open_recording(self):
+        path = QFileDialog.getExistingDirectory(self, "Open Recording")
+        if not path:
+            return
+
+        try:
+            self.open_recording(path)
+        except PreviewRecordingException as e:
+            QMessageBox.warning(self, "Open Recording", str(e))
 
     def set_object(self, object_id: str):
         self._object_id = object_id
+        if object_id is not None:
+            self.close_recording()
 
         if self._stream_reader:
             self._stream_reader.stop()
+        self._composer.reset()
+        with self._frame_lock:
+            self._pending_frame = None
 
         if self._object_id is not None:
             self._stream_reader = StreamReader(
                 stream=self._client.preview_stub.ListenPreview(
-                    ObjectId(id=self._object_id)
+                    self._preview_options.to_request(self._object_id)
                 ),
                 on_data=self._display_image,
             )
@@ -0,0 +1,150 @@
+import time
+import typing
+import concurrent.futures
+
+import grpc
+
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QIODevice, QRect
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from specter.proto.specter_pb2 import PreviewFormat, PreviewImage, PreviewRect
+from specter.proto.specter_pb2_grpc import (
+    PreviewerServiceServicer,
+    add_PreviewerServiceServicer_to_server,
+)
+
+ENCODE_FORMATS = {PreviewFormat.PNG: "PNG", PreviewFormat.JPEG: "JPEG"}
+
+
+def encode_image(image: QImage, format: PreviewFormat) -> bytes:
+    if format == PreviewFormat.RAW:
+        image = image.convertToFormat(QImage.Format_RGBA8888)
+        return bytes(image.constBits())[: image.sizeInBytes()]
+
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, ENCODE_FORMATS[format])
+    return bytes(data.data())
+
+
+class FakePreviewer(PreviewerServiceServicer):
+    def __init__(
+        self,
+        width: int = 320,
+        height: int = 240,
+        frames: int = 10,
+        patch: tuple[int, int] = (64, 48),
+        resize_at: typing.Optional[int] = None,
+    ):
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.patch = patch
+        self.resize_at = resize_at
+        self.sent: list[QImage] = []
+        self.keyframes = 0
+
+    def frame_size(self, index: int) -> tuple[int, int]:
+        if self.resize_at is not None and index >= self.resize_at:
+            return self.width // 2, self.height // 2
+        return self.width, self.height
+
+    def patch_rect(self, index: int) -> QRect:
+        width, height = self.frame_size(index)
+        patch_width, patch_height = self.patch
+        x = (index * 16) % max(1, width - patch_width)
+        y = (index * 8) % max(1, height - patch_height)
+        return QRect(x, y, patch_width, patch_height)
+
+    def render(self, index: int) -> QImage:
+        width, height = self.frame_size(index)
+        image = QImage(width, height, QImage.Format_RGBA8888)
+        image.fill(QColor(40, 80, 120))
+        painter = QPainter(image)
+        painter.fillRect(
+            self.patch_rect(index), QColor((index * 37) % 256, 200, (index * 11) % 256)
+        )
+        painter.end()
+        return image
+
+    def _keyframe(self, frame: QImage, format: PreviewFormat) -> PreviewImage:
+        self.keyframes += 1
+        return PreviewImage(
+            image=encode_image(frame, format),
+            format=format,
+            width=frame.width(),
+            height=frame.height(),
+        )
+
+    def _delta(
+        self, frame: QImage, rects: list[QRect], format: PreviewFormat
+    ) -> PreviewImage:
+        return PreviewImage(
+            format=format,
+            width=frame.width(),
+            height=frame.height(),
+            dirty_rects=[
+                PreviewRect(
+                    x=rect.x(),
+                    y=rect.y(),
+                    width=rect.width(),
+                    height=rect.height(),
+                    image=encode_image(frame.copy(rect), format),
+                )
+                for rect in rects
+            ],
+        )
+
+    def ListenPreview(self, request, context):
+        interval = 1 / request.max_fps if request.max_fps > 0 else 0.0
+        previous: typing.Optional[QImage] = None
+
+        for index in range(self.frames):
+            if not context.is_active():
+                return
+
+            frame = self.render(index)
+            scaled = (request.max_width and frame.width() > request.max_width) or (
+                request.max_height and frame.height() > request.max_height
+            )
+            if scaled:
+                frame = frame.scaled(
+                    request.max_width or frame.width(),
+                    request.max_height or frame.height(),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                )
+
+            if (
+                previous is None
+                or previous.size() != frame.size()
+                or not request.allow_delta
+                or scaled
+            ):
+                message = self._keyframe(frame, request.format)
+            else:
+                rects = [self.patch_rect(index - 1), self.patch_rect(index)]
+                message = self._delta(frame, rects, request.format)
+
+            self.sent.append(frame)
+            previous = frame
+            yield message
+
+            if interval:
+                time.sleep(interval)
+
+
+class FakePreviewerServer:
+    def __init__(self, previewer: FakePreviewer):
+        self.previewer = previewer
+        self._server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=2))
+        add_PreviewerServiceServicer_to_server(previewer, self._server)
+        self.port = self._server.add_insecure_port("127.0.0.1:0")
+        self._server.start()
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    def stop(self) -> None:
+        self._server.stop(0)
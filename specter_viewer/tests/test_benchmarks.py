@@ -0,0 +1,424 @@
+import time
+import typing
+import random
+import resource
+import threading
+
+import grpc
+import pytest
+
+from PySide6.QtCore import (
+    Qt,
+    QByteArray,
+    QCoreApplication,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
+from PySide6.QtGui import QImage, QPixmap, QStandardItem, QStandardItemModel
+
+from specter.client import convert_from_value, convert_to_value
+from specter.proto.specter_pb2 import (
+    PreviewFormat,
+    PreviewImage,
+    PreviewRequest,
+    RecorderCommand,
+)
+from specter.proto.specter_pb2_grpc import PreviewerServiceStub
+
+from specter_viewer.models.preview import PreviewComposer
+from specter_viewer.models.properties import (
+    GRPCPropertiesModel,
+    PropertiesModel,
+    PropertiesTreeItem,
+)
+from specter_viewer.models.proxies import MultiColumnSortFilterProxyModel
+from specter_viewer.models.recorder import GRPCRecorderConsoleItem
+from specter_viewer.models.utils import PropertyTree
+from specter_viewer.widgets.properties import PropertiesView
+from specter_viewer.widgets.recorder import ConsoleWidget
+from specter_viewer.widgets.viewer import ViewerWidget
+
+from fake_previewer import FakePreviewer, FakePreviewerServer, encode_image
+from viewer_fakes import FakeClient
+
+pytestmark = pytest.mark.benchmark
+
+
+def report(name: str, **values: float) -> None:
+    print(f"\n{name}: " + ", ".join(f"{k}={v:.2f}" for k, v in values.items()))
+
+
+class NaiveSortProxyModel(QSortFilterProxyModel):
+    def __init__(self, columns: list[int]):
+        super().__init__()
+        self._columns = columns
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        for column in self._columns:
+            left_value = left.sibling(left.row(), column).data(Qt.ItemDataRole.EditRole)
+            right_value = right.sibling(right.row(), column).data(
+                Qt.ItemDataRole.EditRole
+            )
+            if left_value != right_value:
+                return left_value < right_value
+        return False
+
+
+def make_sort_model(rows: int) -> QStandardItemModel:
+    generator = random.Random(0)
+    model = QStandardItemModel()
+    for _ in range(rows):
+        row = []
+        for value in (generator.randrange(100), generator.random()):
+            item = QStandardItem()
+            item.setData(value, Qt.ItemDataRole.EditRole)
+            row.append(item)
+        model.appendRow(row)
+    return model
+
+
+def time_sort(proxy: QSortFilterProxyModel, model: QStandardItemModel) -> float:
+    proxy.setSourceModel(model)
+    start = time.perf_counter()
+    proxy.sort(0)
+    return (time.perf_counter() - start) * 1000
+
+
+def test_sort_key_cache(qapp):
+    model = make_sort_model(10_000)
+
+    naive_ms = time_sort(NaiveSortProxyModel([0, 1]), model)
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.sort_by_columns([0, 1])
+    cached_ms = time_sort(proxy, model)
+
+    report("sort 10k rows by 2 columns", naive_ms=naive_ms, cached_ms=cached_ms)
+    assert cached_ms < naive_ms
+
+
+def stream_preview(request: PreviewRequest, frames: int = 60) -> dict[str, float]:
+    server = FakePreviewerServer(FakePreviewer(width=1280, height=720, frames=frames))
+    channel = grpc.insecure_channel(server.address)
+    composer = PreviewComposer()
+    received_bytes, compose_s = 0, 0.0
+    try:
+        start = time.perf_counter()
+        for message in PreviewerServiceStub(channel).ListenPreview(request):
+            received_bytes += message.ByteSize()
+            compose_start = time.perf_counter()
+            composer.compose(message)
+            compose_s += time.perf_counter() - compose_start
+        total_s = time.perf_counter() - start
+    finally:
+        channel.close()
+        server.stop()
+
+    return {
+        "kib_per_frame": received_bytes / frames / 1024,
+        "compose_ms": compose_s / frames * 1000,
+        "frame_ms": total_s / frames * 1000,
+    }
+
+
+def test_preview_bandwidth_and_latency(qapp):
+    modes = {
+        "full png": PreviewRequest(id="w", format=PreviewFormat.PNG),
+        "delta png": PreviewRequest(id="w", format=PreviewFormat.PNG, allow_delta=True),
+        "delta raw": PreviewRequest(id="w", format=PreviewFormat.RAW, allow_delta=True),
+        "full jpeg 640x360": PreviewRequest(
+            id="w", format=PreviewFormat.JPEG, max_width=640, max_height=360
+        ),
+    }
+    results = {name: stream_preview(request) for name, request in modes.items()}
+
+    for name, values in results.items():
+        report(f"preview 1280x720 {name}", **values)
+    assert results["delta png"]["kib_per_frame"] < results["full png"]["kib_per_frame"]
+    assert results["delta png"]["compose_ms"] < results["full png"]["compose_ms"]
+
+
+def make_recorder_command(index: int) -> RecorderCommand:
+    command = RecorderCommand()
+    command.line_edit_text_changed.object_query.query = f"q_field_{index % 50}"
+    command.line_edit_text_changed.value = f"text {index}"
+    return command
+
+
+def test_console_feed(qapp):
+    count = 100_000
+    client = FakeClient()
+    item = GRPCRecorderConsoleItem("Recording", client)
+    widget = ConsoleWidget()
+    widget.resize(800, 600)
+    widget.show()
+    widget._lines_model.set_item(item)
+    item.start()
+    stream = client.recorder_stub.streams[0]
+    commands = [make_recorder_command(index) for index in range(count)]
+
+    def produce():
+        for command in commands:
+            stream.push(command)
+
+    view = widget._ui.consoleView
+    model = widget._lines_model
+
+    def tail_visible() -> bool:
+        if model.rowCount() < count:
+            return False
+        last_rect = view.visualRect(model.index(count - 1, 0))
+        return view.viewport().rect().contains(last_rect)
+
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    max_stall_s = 0.0
+    while not tail_visible():
+        assert time.perf_counter() - start < 60
+        pump_start = time.perf_counter()
+        qapp.processEvents()
+        max_stall_s = max(max_stall_s, time.perf_counter() - pump_start)
+        time.sleep(0.001)
+    total_s = time.perf_counter() - start
+    producer.join()
+
+    report(
+        "console 100k events",
+        total_s=total_s,
+        max_stall_ms=max_stall_s * 1000,
+    )
+    assert item.line(0) and item.line(count - 1)
+    assert max_stall_s < 0.1
+
+    widget.close()
+    item.close()
+
+
+def make_raw_frames(width: int, height: int, count: int) -> list[PreviewImage]:
+    frames = []
+    for index in range(count):
+        image = QImage(width, height, QImage.Format_RGBA8888)
+        image.fill(Qt.GlobalColor.darkBlue if index % 2 else Qt.GlobalColor.darkRed)
+        frames.append(
+            PreviewImage(
+                image=encode_image(image, PreviewFormat.RAW),
+                format=PreviewFormat.RAW,
+                width=width,
+                height=height,
+            )
+        )
+    return frames
+
+
+def time_frames(present, frames: list[PreviewImage], count: int) -> dict[str, float]:
+    present(frames[0])
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+    start = time.perf_counter()
+    for index in range(count):
+        present(frames[index % len(frames)])
+    elapsed = time.perf_counter() - start
+    faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults
+    return {"fps": count / elapsed, "page_faults_per_frame": faults / count}
+
+
+def test_raw_preview_throughput(qapp):
+    frames = make_raw_frames(1920, 1080, 4)
+    count = 300
+    pixmaps = []
+
+    def present_copy(preview: PreviewImage):
+        data = QByteArray(preview.image)
+        image = QImage(
+            data,
+            preview.width,
+            preview.height,
+            preview.width * 4,
+            QImage.Format_RGBA8888,
+        ).copy()
+        pixmaps[:] = [QPixmap.fromImage(image)]
+
+    widget = ViewerWidget(FakeClient())
+
+    def present_widget(preview: PreviewImage):
+        widget._display_image(preview)
+        widget._update_pixmap()
+
+    copying = time_frames(present_copy, frames, count)
+    wrapped = time_frames(present_widget, frames, count)
+
+    report("raw 1920x1080 copying", **copying)
+    report("raw 1920x1080 viewer", **wrapped)
+    assert wrapped["fps"] > copying["fps"]
+    assert wrapped["page_faults_per_frame"] * 10 < copying["page_faults_per_frame"]
+    widget.close()
+
+
+def make_property_value(index: int, seed: int) -> object:
+    if index % 3 == 0:
+        return {"x": seed, "y": index, "width": 80 + seed, "height": 24}
+    if index % 3 == 1:
+        return f"value {index} of {seed}"
+    return index * seed
+
+
+def make_property_tree(count: int, seed: int, prefix: str = "property") -> PropertyTree:
+    property_tree = PropertyTree()
+    for index in range(count):
+        property_tree.add_root(f"{prefix}_{index}", make_property_value(index, seed))
+    return property_tree
+
+
+class ResettingPropertiesModel(PropertiesModel):
+    def set_property_tree(self, property_tree: PropertyTree) -> None:
+        self.beginResetModel()
+        self._property_tree = property_tree
+        self._root_node = PropertiesTreeItem("Root", (), None, None)
+        self._path_items = {}
+        self._build_tree(property_tree.fields())
+        self.endResetModel()
+
+
+def time_click_through(
+    model: PropertiesModel, trees: list[PropertyTree], clicks: int
+) -> float:
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+    proxy.sort_by_columns([0], [Qt.SortOrder.DescendingOrder])
+    view = PropertiesView()
+    view.setModel(proxy)
+    view.resize(400, 600)
+    view.show()
+    model.set_property_tree(trees[-1])
+    view.expandAll()
+
+    start = time.perf_counter()
+    for click in range(clicks):
+        model.set_property_tree(trees[click % len(trees)])
+        QCoreApplication.processEvents()
+    elapsed = time.perf_counter() - start
+    view.close()
+    return elapsed / clicks * 1000
+
+
+def test_properties_click_through(qapp):
+    all_changed = [make_property_tree(150, seed) for seed in range(4)]
+    few_changed = [make_property_tree(150, 1) for _ in range(4)]
+    for seed, property_tree in enumerate(few_changed):
+        for index in range(1, 15, 3):
+            property_tree.set((f"property_{index}",), f"value {index} of {seed}")
+
+    results = {}
+    for name, trees in (("all", all_changed), ("few", few_changed)):
+        results[name] = {
+            "reset_ms": time_click_through(ResettingPropertiesModel(), trees, 100),
+            "in_place_ms": time_click_through(PropertiesModel(), trees, 100),
+        }
+        report(
+            f"properties click-through 150 properties, {name} changed", **results[name]
+        )
+
+    for values in results.values():
+        assert values["in_place_ms"] < values["reset_ms"]
+
+
+def make_properties_view(model: PropertiesModel) -> PropertiesView:
+    proxy = MultiColumnSortFilterProxyModel(model)
+    proxy.setSourceModel(model)
+    proxy.sort_by_columns([0], [Qt.SortOrder.DescendingOrder])
+    view = PropertiesView()
+    view.setModel(proxy)
+    view.resize(400, 600)
+    view.show()
+    view.expandAll()
+    return view
+
+
+def time_property_updates(
+    updates: list[list[tuple[str, typing.Any]]], coalesce: bool, with_view: bool
+) -> float:
+    model = GRPCPropertiesModel(FakeClient())
+    model.set_property_tree(make_property_tree(len(updates[0]), 0))
+    view = make_properties_view(model) if with_view else None
+
+    start = time.perf_counter()
+    for frame_updates in updates:
+        for name, value in frame_updates:
+            if coalesce:
+                model._handle_property_updated(name, None, value)
+            else:
+                model.update_root_property(name, convert_from_value(value))
+        model._apply_pending_updates()
+        QCoreApplication.processEvents()
+    elapsed = time.perf_counter() - start
+
+    if view is not None:
+        view.close()
+    return elapsed / len(updates) * 1000
+
+
+def test_property_update_throughput(qapp):
+    count, frames = 200, 60
+    updates = [
+        [
+            (f"property_{index}", convert_to_value(make_property_value(index, frame)))
+            for index in range(count)
+        ]
+        for frame in range(1, frames + 1)
+    ]
+
+    results = {
+        f"{layer}_{mode}_ms": time_property_updates(updates, coalesce, with_view)
+        for layer, with_view in (("model", False), ("view", True))
+        for mode, coalesce in (("per_update", False), ("coalesced", True))
+    }
+
+    report("200 property updates per frame", **results)
+    assert results["model_coalesced_ms"] < 1000 / 60
+    assert results["view_coalesced_ms"] < results["view_per_update_ms"]
+
+
+def make_qt_struct(index: int) -> dict:
+    return {
+        "geometry": {"x": index, "y": 2 * index, "width": 640, "height": 480},
+        "font": {"family": "Sans", "point_size": 9, "bold": index % 2 == 0},
+        "palette": {
+            "window": {"red": 239, "green": 239, "blue": 239, "alpha": 255},
+            "window_text": {"red": 0, "green": 0, "blue": 0, "alpha": 255},
+        },
+        "size_policy": {"horizontal_policy": 5, "vertical_policy": 0},
+    }
+
+
+def time_per_call(function: typing.Callable[[], typing.Any], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def measure_property_tree(count: int) -> dict[str, float]:
+    structs = [make_qt_struct(index) for index in range(count)]
+    start = time.perf_counter()
+    property_tree = PropertyTree()
+    for index, struct in enumerate(structs):
+        property_tree.add_root(f"struct_{index}", struct)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    path = (f"struct_{count // 2}", "palette", "window_text", "red")
+    return {
+        "build_ms": build_ms,
+        "get_us": time_per_call(lambda: property_tree.get(path), 10_000),
+        "set_us": time_per_call(lambda: property_tree.set(path, 128), 10_000),
+        "serialize_with_us": time_per_call(
+            lambda: property_tree.serialize_with(path, 64), 10_000
+        ),
+    }
+
+
+def test_property_tree_nested_structs():
+    small, large = measure_property_tree(20), measure_property_tree(200)
+
+    report("property tree 20 nested structs", **small)
+    report("property tree 200 nested structs", **large)
+    for name in ("get_us", "set_us", "serialize_with_us"):
+        assert large[name] < small[name] * 3
@@ -0,0 +1,114 @@
+import grpc
+import pytest
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QColor, QImage
+
+from specter.proto.specter_pb2 import (
+    PreviewFormat,
+    PreviewImage,
+    PreviewRect,
+    PreviewRequest,
+)
+from specter.proto.specter_pb2_grpc import PreviewerServiceStub
+
+from specter_viewer.models.preview import PreviewComposer
+
+from fake_previewer import FakePreviewer, FakePreviewerServer, encode_image
+
+
+def solid_image(width: int, height: int, color: QColor) -> QImage:
+    image = QImage(width, height, QImage.Format_RGBA8888)
+    image.fill(color)
+    return image
+
+
+def keyframe(image: QImage) -> PreviewImage:
+    return PreviewImage(
+        image=encode_image(image, PreviewFormat.RAW),
+        format=PreviewFormat.RAW,
+        width=image.width(),
+        height=image.height(),
+    )
+
+
+def delta(width: int, height: int, rect: QRect, color: QColor) -> PreviewImage:
+    patch = solid_image(rect.width(), rect.height(), color)
+    return PreviewImage(
+        format=PreviewFormat.RAW,
+        width=width,
+        height=height,
+        dirty_rects=[
+            PreviewRect(
+                x=rect.x(),
+                y=rect.y(),
+                width=rect.width(),
+                height=rect.height(),
+                image=encode_image(patch, PreviewFormat.RAW),
+            )
+        ],
+    )
+
+
+def pixel(image: QImage, x: int, y: int) -> QColor:
+    return image.pixelColor(x, y)
+
+
+def test_delta_rects_are_drawn_over_keyframe(qapp):
+    composer = PreviewComposer()
+    composer.compose(keyframe(solid_image(8, 6, QColor("blue"))))
+
+    frame = composer.compose(delta(8, 6, QRect(2, 1, 3, 2), QColor("red")))
+
+    assert frame.size().toTuple() == (8, 6)
+    assert pixel(frame, 2, 1) == QColor("red")
+    assert pixel(frame, 4, 2) == QColor("red")
+    assert pixel(frame, 5, 1) == QColor("blue")
+    assert pixel(frame, 2, 3) == QColor("blue")
+
+
+def test_delta_before_keyframe_is_ignored(qapp):
+    composer = PreviewComposer()
+
+    frame = composer.compose(delta(8, 6, QRect(0, 0, 2, 2), QColor("red")))
+    assert frame.isNull()
+
+    frame = composer.compose(keyframe(solid_image(8, 6, QColor("blue"))))
+    assert pixel(frame, 0, 0) == QColor("blue")
+
+
+def test_size_change_needs_a_keyframe(qapp):
+    composer = PreviewComposer()
+    composer.compose(keyframe(solid_image(8, 6, QColor("blue"))))
+
+    frame = composer.compose(delta(4, 3, QRect(0, 0, 2, 2), QColor("red")))
+    assert frame.size().toTuple() == (8, 6)
+    assert pixel(frame, 0, 0) == QColor("blue")
+
+    frame = composer.compose(keyframe(solid_image(4, 3, QColor("green"))))
+    frame = composer.compose(delta(4, 3, QRect(0, 0, 2, 2), QColor("red")))
+    assert frame.size().toTuple() == (4, 3)
+    assert pixel(frame, 0, 0) == QColor("red")
+    assert pixel(frame, 3, 2) == QColor("green")
+
+
+@pytest.mark.parametrize("format", [PreviewFormat.PNG, PreviewFormat.RAW])
+def test_composed_stream_matches_server_frames(qapp, format):
+    previewer = FakePreviewer(width=160, height=120, frames=12, resize_at=6)
+    server = FakePreviewerServer(previewer)
+    channel = grpc.insecure_channel(server.address)
+    try:
+        stub = PreviewerServiceStub(channel)
+        composer = PreviewComposer()
+        composed = [
+            QImage(composer.compose(message)).convertToFormat(QImage.Format_RGBA8888)
+            for message in stub.ListenPreview(
+                PreviewRequest(id="window", format=format, allow_delta=True)
+            )
+        ]
+    finally:
+        channel.close()
+        server.stop()
+
+    assert previewer.keyframes == 2
+    assert composed == previewer.sent
@@ -0,0 +1,181 @@
+import time
+
+from PySide6.QtCore import Qt
+
+from specter.client import convert_to_value
+from specter.proto.specter_pb2 import (
+    Properties,
+    Property,
+    PropertyAdded,
+    PropertyChange,
+    PropertyRemoved,
+    PropertyUpdated,
+)
+
+from specter_viewer.models.properties import GRPCPropertiesModel, PropertiesModel
+from specter_viewer.models.utils import PropertyTree
+
+from viewer_fakes import FakeClient, FakeRpcError, wait_until
+
+
+def make_model(qapp) -> tuple[FakeClient, GRPCPropertiesModel]:
+    client = FakeClient()
+    client.object_stub.properties["button"] = Properties(
+        properties=[
+            Property(property_name="text", value=convert_to_value("OK")),
+            Property(property_name="enabled", value=convert_to_value(True)),
+        ]
+    )
+    model = GRPCPropertiesModel(client)
+    model.set_object("button")
+    assert wait_until(lambda: client.object_stub.streams and model.rowCount() == 2)
+    return client, model
+
+
+def root_names(model: GRPCPropertiesModel) -> list[str]:
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def test_stream_changes_update_rows_in_place(qapp):
+    client, model = make_model(qapp)
+    stream = client.object_stub.streams[0]
+
+    signals = []
+    model.modelAboutToBeReset.connect(lambda: signals.append("reset"))
+    model.rowsAboutToBeInserted.connect(
+        lambda parent, first, last: signals.append(("insert", first, last))
+    )
+    model.rowsAboutToBeRemoved.connect(
+        lambda parent, first, last: signals.append(("remove", first, last))
+    )
+
+    stream.push(
+        PropertyChange(
+            added=PropertyAdded(property_name="width", value=convert_to_value(80))
+        )
+    )
+    assert wait_until(lambda: model.rowCount() == 3)
+    assert root_names(model) == ["text", "enabled", "width"]
+
+    stream.push(
+        PropertyChange(
+            updated=PropertyUpdated(
+                property_name="text",
+                old_value=convert_to_value("OK"),
+                new_value=convert_to_value("Cancel"),
+            )
+        )
+    )
+    assert wait_until(lambda: model.index(0, 1).data() == "Cancel")
+
+    stream.push(PropertyChange(removed=PropertyRemoved(property_name="enabled")))
+    assert wait_until(lambda: model.rowCount() == 2)
+    assert root_names(model) == ["text", "width"]
+
+    assert signals == [("insert", 2, 2), ("remove", 1, 1)]
+
+    model.set_object(None)
+    assert stream.cancelled.is_set()
+
+
+def test_stream_updates_are_applied_once_per_frame(qapp):
+    client, model = make_model(qapp)
+    stream = client.object_stub.streams[0]
+    changes = []
+    model.dataChanged.connect(lambda top_left, bottom_right: changes.append(1))
+
+    for text in ("A", "B", "C"):
+        stream.push(
+            PropertyChange(
+                updated=PropertyUpdated(
+                    property_name="text", new_value=convert_to_value(text)
+                )
+            )
+        )
+    stream.push(PropertyChange(removed=PropertyRemoved(property_name="enabled")))
+
+    assert wait_until(lambda: model.rowCount() == 1)
+    assert model.index(0, 1).data() == "C"
+    assert len(changes) == 1
+
+    model.set_object(None)
+
+
+def test_unchanged_write_skips_update(qapp):
+    client, model = make_model(qapp)
+
+    assert model.setData(model.index(0, 1), "OK")
+    assert model.setData(model.index(0, 1), "Cancel")
+
+    assert wait_until(lambda: client.object_stub.calls["UpdateProperty"] == 1)
+    assert model.setData(model.index(0, 1), "Cancel")
+    time.sleep(0.1)
+    assert client.object_stub.calls["UpdateProperty"] == 1
+
+    model.set_object(None)
+
+
+def test_rejected_write_reverts_to_server_value(qapp):
+    client, model = make_model(qapp)
+    client.object_stub.errors["UpdateProperty"] = FakeRpcError("text is read-only")
+
+    failures = []
+    model._executor.request_failed.connect(
+        lambda name, message: failures.append((name, message))
+    )
+
+    assert model.setData(model.index(0, 1), "Cancel")
+    assert model.index(0, 1).data() == "Cancel"
+
+    assert wait_until(lambda: model.index(0, 1).data() == "OK")
+    assert failures == [("UpdateProperty", "text is read-only")]
+    assert client.object_stub.calls["GetProperties"] == 2
+
+    model.set_object(None)
+
+
+def test_same_type_switch_updates_values_in_place(qapp):
+    def make_tree(values: list[int]) -> PropertyTree:
+        property_tree = PropertyTree()
+        for index, value in enumerate(values):
+            property_tree.add_root(f"p{index}", {"value": value})
+        return property_tree
+
+    count = PropertiesModel.LAYOUT_CHANGE_THRESHOLD + 1
+    model = PropertiesModel(make_tree([0] * count))
+    items = [model.index(row, 0) for row in range(count)]
+    signals = []
+    model.modelAboutToBeReset.connect(lambda: signals.append("reset"))
+    model.layoutChanged.connect(lambda: signals.append("layout"))
+    model.dataChanged.connect(
+        lambda top_left, bottom_right: signals.append(
+            ("changed", top_left.parent().row())
+        )
+    )
+
+    model.set_property_tree(make_tree([0, 1] + [0] * (count - 2)))
+    assert signals == [("changed", 1)]
+
+    signals.clear()
+    model.set_property_tree(make_tree(list(range(2, count + 2))))
+    assert signals == ["layout"]
+    assert [model.index(0, 1, index).data() for index in items] == list(
+        range(2, count + 2)
+    )
+
+
+def test_update_with_new_keys_rebuilds_root(qapp):
+    property_tree = PropertyTree()
+    property_tree.add_root("geometry", {"x": 1}, editable=False)
+    property_tree.add_root("text", "OK")
+    model = PropertiesModel(property_tree)
+
+    model.update_root_property("geometry", {"x": 2, "y": 3})
+
+    geometry = model.index(1, 0)
+    assert root_names(model) == ["text", "geometry"]
+    assert [
+        (model.index(row, 0, geometry).data(), model.index(row, 1, geometry).data())
+        for row in range(model.rowCount(geometry))
+    ] == [("x", 2), ("y", 3)]
+    assert not model.flags(model.index(1, 1, geometry)) & Qt.ItemFlag.ItemIsEditable
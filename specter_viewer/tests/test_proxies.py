@@ -0,0 +1,157 @@
+import re
+
+import pytest
+
+from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+from specter_viewer.models.proxies import (
+    ColumnFilter,
+    MultiColumnSortFilterProxyModel,
+    NumericRangeFilter,
+    RegexFilter,
+    SubstringFilter,
+)
+
+
+def make_item(value) -> QStandardItem:
+    item = QStandardItem()
+    item.setData(value, Qt.ItemDataRole.EditRole)
+    return item
+
+
+def make_model(rows: list[tuple]) -> QStandardItemModel:
+    model = QStandardItemModel()
+    for row in rows:
+        model.appendRow([make_item(value) for value in row])
+    return model
+
+
+def proxy_rows(proxy, parent: QModelIndex = QModelIndex()) -> list[tuple]:
+    return [
+        tuple(
+            proxy.index(row, column, parent).data(Qt.ItemDataRole.EditRole)
+            for column in range(proxy.columnCount(parent))
+        )
+        for row in range(proxy.rowCount(parent))
+    ]
+
+
+def test_sort_by_columns_with_mixed_orders(qapp):
+    model = make_model([("b", 1), ("a", 2), ("b", 3), ("a", 1)])
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+
+    proxy.sort_by_columns(
+        [0, 1], [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder]
+    )
+    proxy.sort(0)
+
+    assert proxy_rows(proxy) == [("a", 2), ("a", 1), ("b", 3), ("b", 1)]
+    assert len(proxy._sort_key_cache) == 1
+
+
+def test_sort_keys_follow_source_changes(qapp):
+    model = make_model([("c",), ("a",), ("b",)])
+    parent = model.item(0)
+    for value in ("z", "x", "y"):
+        parent.appendRow([make_item(value)])
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+    proxy.sort_by_columns([0])
+    proxy.sort(0)
+
+    children_parent = proxy.index(2, 0)
+    assert proxy_rows(proxy) == [("a",), ("b",), ("c",)]
+    assert proxy_rows(proxy, children_parent) == [("x",), ("y",), ("z",)]
+
+    model.item(1).setData("d", Qt.ItemDataRole.EditRole)
+
+    assert proxy_rows(proxy) == [("b",), ("c",), ("d",)]
+
+
+def test_inserted_rows_are_sorted(qapp):
+    model = make_model([("d",), ("b",)])
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+    proxy.sort_by_columns([0])
+    proxy.sort(0)
+    assert proxy_rows(proxy) == [("b",), ("d",)]
+
+    model.appendRow([make_item("c")])
+    model.insertRow(0, [make_item("a")])
+    model.appendRow([make_item("e")])
+
+    assert proxy_rows(proxy) == [("a",), ("b",), ("c",), ("d",), ("e",)]
+
+
+def test_column_filter_is_abstract():
+    with pytest.raises(TypeError):
+        ColumnFilter(0)
+
+
+def test_column_filter_predicates():
+    insensitive = SubstringFilter("ok", 0).compile()
+    sensitive = SubstringFilter("ok", 0, case_sensitive=True).compile()
+    regex = RegexFilter(r"^btn_\d+$", 0).compile()
+    case_regex = RegexFilter(r"^btn", 0, flags=re.RegexFlag(0)).compile()
+    numeric = NumericRangeFilter(0, minimum=1, maximum=10).compile()
+    unbounded = NumericRangeFilter(0).compile()
+
+    assert [insensitive(value) for value in ("OK", "broken", None)] == [
+        True,
+        True,
+        False,
+    ]
+    assert [sensitive(value) for value in ("OK", "ok", 1)] == [False, True, False]
+    assert [regex(value) for value in ("BTN_12", "btn_a", None)] == [
+        True,
+        False,
+        False,
+    ]
+    assert [case_regex(value) for value in ("btn_1", "BTN_1")] == [True, False]
+    assert [numeric(value) for value in (1, 10.0, 0, 11, "5", None, True)] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert unbounded(-1e9) and not unbounded(False)
+
+
+def test_column_filters_combine_columns(qapp):
+    model = make_model([("alpha", "x", 1), ("beta", "alpha", 2), ("gamma", "y", 3)])
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+
+    proxy.set_column_filter("text", SubstringFilter("ALPHA", [0, 1]))
+    assert proxy_rows(proxy) == [("alpha", "x", 1), ("beta", "alpha", 2)]
+
+    proxy.set_column_filter("number", NumericRangeFilter(2, minimum=2))
+    assert proxy_rows(proxy) == [("beta", "alpha", 2)]
+
+    proxy.remove_column_filter("text")
+    assert proxy_rows(proxy) == [("beta", "alpha", 2), ("gamma", "y", 3)]
+    assert list(proxy.get_filter_stats()) == ["number"]
+
+
+def test_column_filters_run_most_rejecting_first(qapp):
+    model = make_model([(f"item{index}", index) for index in range(10)])
+    proxy = MultiColumnSortFilterProxyModel(None)
+    proxy.setSourceModel(model)
+    proxy.set_column_filter("loose", NumericRangeFilter(1, minimum=1))
+    proxy.set_column_filter("strict", SubstringFilter("item1", 0))
+
+    assert proxy_rows(proxy) == [("item1", 1)]
+    stats = proxy.get_filter_stats()
+    assert (stats["loose"].evaluated, stats["loose"].rejected) == (10, 1)
+    assert (stats["strict"].evaluated, stats["strict"].rejected) == (9, 8)
+
+    model.item(5, 0).setData("other5", Qt.ItemDataRole.EditRole)
+    assert proxy_rows(proxy) == [("item1", 1)]
+    assert (stats["strict"].evaluated, stats["strict"].rejected) == (19, 17)
+    assert (stats["loose"].evaluated, stats["loose"].rejected) == (11, 1)
+    assert stats["strict"].rejection_rate == pytest.approx(17 / 19)
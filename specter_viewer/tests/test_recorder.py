@@ -0,0 +1,47 @@
+from PySide6.QtCore import QModelIndex
+
+from specter_viewer.models.recorder import ConsoleModel, GRPCRecorderConsoleItem
+
+from viewer_fakes import FakeClient
+
+
+def make_items(client: FakeClient, count: int) -> list[GRPCRecorderConsoleItem]:
+    return [GRPCRecorderConsoleItem(f"Recording {i}", client) for i in range(count)]
+
+
+def test_remove_row_stops_recording_and_closes_store(qapp):
+    client = FakeClient()
+    model = ConsoleModel()
+    item, other = make_items(client, 2)
+    for console_item in (item, other):
+        model.add_item(console_item)
+    item.start()
+
+    assert model.removeRow(0, QModelIndex())
+
+    assert client.recorder_stub.streams[0].cancelled.is_set()
+    assert not item.is_running()
+    assert item.get_events()._file.closed
+    assert not other.get_events()._file.closed
+    other.close()
+
+
+def test_row_of_follows_removals(qapp):
+    model = ConsoleModel()
+    items = make_items(FakeClient(), 6)
+    for item in items:
+        model.add_item(item)
+
+    for row in (4, 1, 0):
+        assert model.removeRow(row, QModelIndex())
+    remaining = [items[2], items[3], items[5]]
+
+    assert [model.row_of(item) for item in remaining] == [0, 1, 2]
+    assert all(model.row_of(item) == -1 for item in (items[0], items[1], items[4]))
+
+    late = make_items(FakeClient(), 1)[0]
+    model.add_item(late)
+    assert model.row_of(late) == 3
+
+    for item in remaining + [late]:
+        item.close()
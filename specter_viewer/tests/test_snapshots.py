@@ -0,0 +1,118 @@
+import time
+import threading
+
+from specter.client import convert_to_value
+from specter.proto.specter_pb2 import (
+    Properties,
+    Property,
+    PropertyAdded,
+    PropertyChange,
+)
+
+from specter_viewer.models.snapshots import GRPCSnapshotCache
+
+from viewer_fakes import FakeClient, wait_until
+
+
+def make_cache(qapp) -> tuple[FakeClient, GRPCSnapshotCache]:
+    client = FakeClient()
+    client.object_stub.properties["button"] = Properties(
+        properties=[Property(property_name="text")]
+    )
+    return client, GRPCSnapshotCache(client)
+
+
+def test_concurrent_misses_share_one_fetch(qapp):
+    client, cache = make_cache(qapp)
+    client.object_stub.gate.clear()
+
+    results = {}
+    threads = [
+        threading.Thread(
+            target=lambda: results.update(properties=cache.get_properties("button"))
+        ),
+        threading.Thread(
+            target=lambda: results.update(methods=cache.get_methods("button"))
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    assert wait_until(lambda: client.object_stub.calls["GetProperties"] == 1)
+    time.sleep(0.1)
+    client.object_stub.gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    calls = client.object_stub.calls
+    assert calls["GetProperties"] == 1
+    assert calls["GetMethods"] == 1
+    assert calls["ListenPropertiesChanges"] == 1
+    assert cache.get_stats().misses == 1
+    assert results["properties"].properties[0].property_name == "text"
+    cache.clear()
+
+
+def test_miss_waits_for_pending_prefetch(qapp):
+    client, cache = make_cache(qapp)
+    client.object_stub.gate.clear()
+
+    cache.prefetch(["button"])
+    assert wait_until(lambda: client.object_stub.calls["GetProperties"] == 1)
+
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(properties=cache.get_properties("button"))
+    )
+    thread.start()
+    client.object_stub.gate.set()
+    thread.join(timeout=5)
+
+    stats = cache.get_stats()
+    assert client.object_stub.calls["GetProperties"] == 1
+    assert client.object_stub.calls["ListenPropertiesChanges"] == 1
+    assert stats.misses == 1
+    assert stats.prefetched == 1
+    assert cache.get_properties("button") == result["properties"]
+    cache.clear()
+
+
+def test_changes_during_fetch_are_kept(qapp):
+    client, cache = make_cache(qapp)
+    client.object_stub.gate.clear()
+
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(properties=cache.get_properties("button"))
+    )
+    thread.start()
+    assert wait_until(lambda: client.object_stub.calls["GetProperties"] == 1)
+    client.object_stub.streams[0].push(
+        PropertyChange(
+            added=PropertyAdded(property_name="width", value=convert_to_value(80))
+        )
+    )
+    time.sleep(0.1)
+    client.object_stub.gate.set()
+    thread.join(timeout=5)
+
+    assert client.object_stub.call_order[:2] == [
+        "ListenPropertiesChanges",
+        "GetProperties",
+    ]
+    assert [prop.property_name for prop in result["properties"].properties] == [
+        "text",
+        "width",
+    ]
+    cache.clear()
+
+
+def test_stats_count_one_lookup_per_selection(qapp):
+    client, cache = make_cache(qapp)
+
+    for object_id in ("button", "label", "button", "button"):
+        cache.get_properties(object_id)
+        cache.get_methods(object_id)
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    cache.clear()
@@ -0,0 +1,114 @@
+import time
+import queue
+import typing
+import threading
+import collections
+
+import grpc
+
+from PySide6.QtCore import QCoreApplication
+
+from specter.proto.specter_pb2 import Properties, Methods
+
+
+class FakeStream:
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self.cancelled = threading.Event()
+
+    def push(self, item: typing.Any) -> None:
+        self._queue.put(item)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        self._queue.put(None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = self._queue.get()
+        if item is None:
+            raise StopIteration
+        return item
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, details: str):
+        self._details = details
+
+    def details(self) -> str:
+        return self._details
+
+    def __str__(self):
+        return self._details
+
+
+class FakeObjectStub:
+    def __init__(self):
+        self.properties: dict[str, Properties] = {}
+        self.methods: dict[str, Methods] = {}
+        self.errors: dict[str, Exception] = {}
+        self.calls: collections.Counter = collections.Counter()
+        self.call_order: list[str] = []
+        self.streams: list[FakeStream] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self._lock = threading.Lock()
+
+    def _call(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            self.call_order.append(name)
+        self.gate.wait()
+        if name in self.errors:
+            raise self.errors[name]
+
+    def GetProperties(self, request):
+        self._call("GetProperties")
+        return self.properties.get(request.id, Properties())
+
+    def GetMethods(self, request):
+        self._call("GetMethods")
+        return self.methods.get(request.id, Methods())
+
+    def UpdateProperty(self, request):
+        self._call("UpdateProperty")
+
+    def CallMethod(self, request):
+        self._call("CallMethod")
+
+    def ListenPropertiesChanges(self, request):
+        stream = FakeStream()
+        with self._lock:
+            self.calls["ListenPropertiesChanges"] += 1
+            self.call_order.append("ListenPropertiesChanges")
+            self.streams.append(stream)
+        return stream
+
+
+class FakeRecorderStub:
+    def __init__(self):
+        self.streams: list[FakeStream] = []
+
+    def ListenCommands(self, request):
+        stream = FakeStream()
+        self.streams.append(stream)
+        return stream
+
+
+class FakeClient:
+    def __init__(self):
+        self.object_stub = FakeObjectStub()
+        self.recorder_stub = FakeRecorderStub()
+
+
+def wait_until(predicate: typing.Callable[[], bool], timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.005)
+    QCoreApplication.processEvents()
+    return predicate()